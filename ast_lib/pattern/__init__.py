@@ -1,24 +1,53 @@
-from .match_pattern import (
-    MatchResult,
-    MatchTypeHint,
-    match_all,
-    match_first,
-    match_node,
-    match_pattern,
-    _set_debug,
-)
-from .nodes import *
-from .parse import parse_pattern
-
-__all__ = (
-    "parse_pattern",
-    "match_node",
-    "match_all",
-    "match_first",
-    "match_pattern",
-    "MatchTypeHint",
-    "MatchResult",
-    "_set_debug",
-)
-
-__all__ += nodes.__all__
+from .match_pattern import (
+    MatchResult,
+    MatchTypeHint,
+    compile_pattern,
+    explain,
+    iter_matches,
+    match_all,
+    match_first,
+    match_node,
+    match_pattern,
+    _set_debug,
+)
+from .nodes import *
+from .index import QueryPlan, TreeIndex
+from .locations import Location, Span, match_locations, search_locations, to_arrays
+from .parse import parse_pattern
+from .pattern_set import PatternSet
+from .rewrite import Edit, apply_edits, rewrite, rewrite_edits
+from .search import SearchStats, search_files
+from .selector import Selector, compile_selector, select
+
+__all__ = (
+    "parse_pattern",
+    "compile_pattern",
+    "match_node",
+    "match_all",
+    "match_first",
+    "iter_matches",
+    "explain",
+    "match_pattern",
+    "MatchTypeHint",
+    "MatchResult",
+    "PatternSet",
+    "TreeIndex",
+    "QueryPlan",
+    "SearchStats",
+    "search_files",
+    "Location",
+    "Span",
+    "match_locations",
+    "search_locations",
+    "to_arrays",
+    "rewrite",
+    "rewrite_edits",
+    "apply_edits",
+    "Edit",
+    "Selector",
+    "compile_selector",
+    "select",
+    "_set_debug",
+)
+
+__all__ += nodes.__all__
@@ -0,0 +1,173 @@
+"""
+Static analysis of pattern nodes, used to narrow down which targets are worth matching.
+"""
+
+from __future__ import annotations
+
+import ast
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any
+
+from . import nodes
+
+
+def is_variadic(item: Any) -> bool:
+    return isinstance(item, (nodes.WildcardRepeat0, nodes.WildcardRepeat1))
+
+
+def capture_names(pattern: Any) -> Counter[str | int]:
+    """How many times each capture name occurs in `pattern`, in source order."""
+
+    names: Counter[str | int] = Counter()
+    stack = [pattern]
+    while stack:
+        item = stack.pop()
+        # children are pushed in reverse, so they are popped in source order
+        if isinstance(item, list):
+            stack.extend(reversed(item))
+        elif isinstance(item, nodes.Capture):
+            names[item.name] += 1
+            stack.append(item.pattern)
+        elif isinstance(item, nodes.Contains):
+            stack.extend((item.descendant, item.pattern))
+        elif isinstance(item, nodes.Union):
+            # only one alternative binds, so a name shared by several is not repeated
+            alternatives: Counter[str | int] = Counter()
+            for alternative in item.alternatives:
+                alternatives |= capture_names(alternative)
+            names.update(alternatives)
+        elif isinstance(item, nodes.AST):
+            stack.extend(reversed([value for _, value in item.fields]))
+    return names
+
+
+def unwrap_pattern(pattern: Any) -> Any:
+    """
+    Strip captures, `Expr` wrappers and descendant constraints, which do not change the
+    class of the nodes a pattern accepts.
+    """
+
+    while isinstance(pattern, (nodes.Capture, nodes.Expr, nodes.Contains)):
+        pattern = pattern.value if isinstance(pattern, nodes.Expr) else pattern.pattern
+    return pattern
+
+
+def descendant_patterns(pattern: Any) -> list[Any]:
+    """The patterns that the matched node itself must have a descendant matching."""
+
+    found: list[Any] = []
+    while isinstance(pattern, (nodes.Capture, nodes.Expr, nodes.Contains)):
+        if isinstance(pattern, nodes.Contains):
+            found.append(pattern.descendant)
+        pattern = pattern.value if isinstance(pattern, nodes.Expr) else pattern.pattern
+    return found
+
+
+def uses_descendants(pattern: Any) -> bool:
+    stack = [pattern]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, nodes.Contains):
+            return True
+        if isinstance(item, list):
+            stack.extend(item)
+        elif isinstance(item, nodes.Capture):
+            stack.append(item.pattern)
+        elif isinstance(item, nodes.Union):
+            stack.extend(item.alternatives)
+        elif isinstance(item, nodes.AST):
+            stack.extend(value for _, value in item.fields)
+    return False
+
+
+def is_expression_pattern(pattern: Any) -> bool:
+    """Whether `pattern` only matches expressions (and `Expr` statements through them)."""
+
+    pattern = unwrap_pattern(pattern)
+    if isinstance(pattern, nodes.Union):
+        return all(map(is_expression_pattern, pattern.alternatives))
+    return isinstance(pattern, nodes.expr)
+
+
+# the identifier held by each kind of node, as indexed by `TreeIndex`
+IDENTIFIER_FIELDS: dict[type[ast.AST], str] = {
+    ast.Name: "id",
+    ast.Attribute: "attr",
+    ast.FunctionDef: "name",
+    ast.AsyncFunctionDef: "name",
+    ast.ClassDef: "name",
+    ast.keyword: "arg",
+}
+
+# steps from a node to one of its children: the field name, and the index for lists
+type PatternPath = tuple[tuple[str, int | None], ...]
+
+
+@dataclass(frozen=True)
+class RequiredIdentifier:
+    path: PatternPath
+    node_class: type[ast.AST]
+    name: str
+    # `name` is only a prefix of the identifier, from an identifier constraint
+    prefix: bool = False
+
+    def accepts(self, identifier: str) -> bool:
+        return (
+            identifier.startswith(self.name) if self.prefix else identifier == self.name
+        )
+
+
+def required_identifiers(pattern: nodes.AST) -> list[RequiredIdentifier]:
+    """Identifiers that every match must contain, with their path from the matched node."""
+
+    required: list[RequiredIdentifier] = []
+
+    def visit(pattern: Any, path: PatternPath) -> None:
+        pattern = unwrap_pattern(pattern)
+        if not isinstance(pattern, nodes.AST) or isinstance(pattern, nodes.Wildcard):
+            return
+        ast_class = ast.__dict__.get(type(pattern).__name__)
+        if ast_class is None:
+            return
+
+        identifier_field = IDENTIFIER_FIELDS.get(ast_class)
+        for name, value in pattern.fields:
+            if name in pattern._child_fields:
+                if isinstance(value, list):
+                    # positions are only fixed up to the first `~*`/`~+`
+                    for i, item in enumerate(value):
+                        if is_variadic(item):
+                            break
+                        visit(item, (*path, (name, i)))
+                else:
+                    visit(value, (*path, (name, None)))
+            elif name == identifier_field:
+                while isinstance(value, nodes.Capture):
+                    value = value.pattern
+                if isinstance(value, str):
+                    required.append(RequiredIdentifier(path, ast_class, value))
+                elif isinstance(value, nodes.IdConstraint) and value.literal_prefix:
+                    required.append(
+                        RequiredIdentifier(
+                            path, ast_class, value.literal_prefix, prefix=True
+                        )
+                    )
+
+    visit(pattern, ())
+    return required
+
+
+def required_tokens(pattern: nodes.AST) -> list[bytes]:
+    """
+    Byte strings that appear in the source of any code matching `pattern`, longest first.
+
+    Only ASCII identifiers and identifier prefixes are used: they are spelled verbatim in
+    the source, while constants are not (`0x10` and `16`, escapes, implicit string
+    concatenation), and non-ASCII identifiers are NFKC-normalized by the parser.
+    """
+
+    names = {r.name.encode() for r in required_identifiers(pattern) if r.name.isascii()}
+    for descendant in descendant_patterns(pattern):
+        names.update(required_tokens(descendant))
+    return sorted(names, key=len, reverse=True)
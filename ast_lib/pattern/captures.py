@@ -0,0 +1,81 @@
+"""
+Binding of captures.
+
+The interpreter records captures in a dict keyed by name. Compiled matchers use a flat
+list instead, with one slot per name assigned at compile time and `UNSET` in the slots
+not bound yet.
+
+A name captured more than once is a backreference: every later occurrence must be
+structurally equal to the first one, ignoring positions and `ctx`, so `$a = $a` matches
+`x = x`. AST values are compared through structural ids, memoized per subtree for the
+duration of one top-level match, so trees changed between matches are hashed afresh.
+"""
+
+from __future__ import annotations
+
+import ast
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator
+
+from ast_lib.utils import StructuralHasher
+
+_hasher: ContextVar[StructuralHasher | None] = ContextVar("_hasher", default=None)
+
+type Captures = dict[str | int, Any] | list[Any]
+
+UNSET: Any = object()
+
+
+def _new_hasher() -> StructuralHasher:
+    return StructuralHasher(ignore_fields=("ctx",))
+
+
+@contextmanager
+def capture_scope() -> Iterator[None]:
+    """Share structural ids between the backreference checks of one match."""
+
+    if _hasher.get() is not None:
+        yield
+        return
+    token = _hasher.set(_new_hasher())
+    try:
+        yield
+    finally:
+        _hasher.reset(token)
+
+
+def same_capture(a: Any, b: Any) -> bool:
+    if a is b:
+        return True
+    if isinstance(a, ast.AST) and isinstance(b, ast.AST):
+        hasher = _hasher.get() or _new_hasher()
+        return hasher(a) == hasher(b)
+    if isinstance(a, list) and isinstance(b, list):
+        return len(a) == len(b) and all(map(same_capture, a, b))
+    if isinstance(a, ast.AST) or isinstance(b, ast.AST):
+        return False
+    return type(a) is type(b) and a == b
+
+
+def bind_capture(captures: dict[str | int, Any], name: str | int, value: Any) -> bool:
+    if name in captures:
+        return same_capture(captures[name], value)
+    captures[name] = value
+    return True
+
+
+def bind_slot(values: list[Any], slot: int, value: Any) -> bool:
+    current = values[slot]
+    if current is UNSET:
+        values[slot] = value
+        return True
+    return same_capture(current, value)
+
+
+def restore_captures(captures: Captures, saved: Captures) -> None:
+    if isinstance(captures, list):
+        captures[:] = saved
+    else:
+        captures.clear()
+        captures.update(saved)
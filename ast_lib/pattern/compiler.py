@@ -0,0 +1,403 @@
+"""
+Compile pattern nodes into straight-line Python functions.
+
+The generated function mirrors `_match_node`/`_match_field` in `match_pattern`, but all
+decisions depending only on the pattern are taken once at compile time, so matching a
+target is reduced to a sequence of type checks, comparisons and capture assignments.
+Captures are stored in a flat list, at slots numbered at compile time.
+"""
+
+from __future__ import annotations
+
+import ast
+import dataclasses
+from typing import Any, Callable, Iterable
+
+from . import nodes
+from .analysis import capture_names, is_expression_pattern, is_variadic
+from .captures import bind_slot
+from .index import has_descendant
+from .sequence import SequencePattern
+
+type Checker = Callable[[ast.AST, list[Any]], bool]
+
+
+def _check_item(check: Checker, target: Any, captures: list[Any]) -> bool:
+    return check(target, captures)
+
+
+class _CodeGen:
+    def __init__(
+        self, slots: dict[str | int, int], repeated: frozenset[str | int]
+    ) -> None:
+        self.slots = slots
+        self.repeated = repeated
+        self.lines: list[str] = []
+        self.namespace: dict[str, Any] = {
+            "_AST": ast.AST,
+            "_Expr": ast.Expr,
+            "_str": str,
+            "_expr": ast.expr,
+            "_check_item": _check_item,
+            "_bind": bind_slot,
+            "_has_descendant": has_descendant,
+        }
+        self._n_vars = 0
+        # how generated code gives up: `break` inside an alternative of a union
+        self.fail = "return False"
+        self.capturing = False
+
+    def emit(self, line: str, indent: int) -> None:
+        self.lines.append("    " * indent + line)
+
+    def var(self) -> str:
+        self._n_vars += 1
+        return f"v{self._n_vars}"
+
+    def const(self, value: Any) -> str:
+        name = f"_c{len(self.namespace)}"
+        self.namespace[name] = value
+        return name
+
+    def block(self, start: int, indent: int) -> None:
+        if len(self.lines) == start:
+            self.emit("pass", indent)
+
+    def capture(self, name: str | int, value: str, indent: int) -> None:
+        # only names occurring more than once need the backreference check
+        slot = self.slots[name]
+        if name in self.repeated:
+            self.emit(f"if not _bind(caps, {slot}, {value}): {self.fail}", indent)
+        else:
+            self.emit(f"caps[{slot}] = {value}", indent)
+
+    def accepts(self, pattern: nodes.IdConstraint, target: str) -> str:
+        # the regex is compiled once, when the pattern node is built
+        if isinstance(pattern, nodes.IdPrefix):
+            return f"{target}.startswith({self.const(pattern.prefix)})"
+        if isinstance(pattern, nodes.IdRegex):
+            return f"{self.const(pattern.compiled.fullmatch)}({target}) is not None"
+        if isinstance(pattern, nodes.IdSet):
+            return f"{target} in {self.const(pattern.names)}"
+        return f"{self.const(pattern.accepts)}({target})"
+
+    def branches(self, emitters: list[Callable[[int], None]], indent: int) -> None:
+        """Emit alternatives that are tried in turn, until one of them matches."""
+
+        ok = self.var()
+        saved = self.var() if self.capturing else None
+        if saved is not None:
+            self.emit(f"{saved} = caps.copy()", indent)
+        self.emit(f"{ok} = False", indent)
+
+        fail, self.fail = self.fail, "break"
+        for i, emit_alternative in enumerate(emitters):
+            level = indent
+            if i:
+                self.emit(f"if not {ok}:", indent)
+                level += 1
+            self.emit("while True:", level)
+            emit_alternative(level + 1)
+            self.emit(f"{ok} = True", level + 1)
+            self.emit("break", level + 1)
+            if saved is not None and i < len(emitters) - 1:
+                self.emit(f"if not {ok}: caps[:] = {saved}", level)
+        self.fail = fail
+
+        self.emit(f"if not {ok}: {self.fail}", indent)
+
+    def union(
+        self,
+        pattern: nodes.Union,
+        target: str,
+        indent: int,
+        emit: Callable[[Any, str, int], None],
+    ) -> None:
+        alternatives = factor_alternatives(pattern.alternatives)
+        if len(alternatives) == 1:
+            emit(alternatives[0], target, indent)
+            return
+
+        capturing, self.capturing = self.capturing, bool(capture_names(alternatives))
+        self.branches(
+            [
+                lambda level, alternative=alternative: emit(alternative, target, level)
+                for alternative in alternatives
+            ],
+            indent,
+        )
+        self.capturing = capturing
+
+    def contains(self, pattern: nodes.Contains, target: str, indent: int) -> None:
+        if is_expression_pattern(pattern.pattern):
+            # the descendants are looked for below the expression, not its statement
+            unwrapped = self.var()
+            self.emit(
+                f"{unwrapped} = {target}.value if isinstance({target}, _Expr) else {target}",
+                indent,
+            )
+            target = unwrapped
+        self.node(pattern.pattern, target, indent)
+        # `~` accepts a missing child, which has no descendants
+        self.emit(f"if {target} is None: {self.fail}", indent)
+
+        check = compile_checker(pattern.descendant, self.slots, self.repeated)
+        self.emit(
+            f"if not _has_descendant({target}, {self.const(pattern.descendant)}, {self.const(check)}, caps): {self.fail}",
+            indent,
+        )
+
+    # ---------------------------------------------------------------------------- #
+
+    def node(self, pattern: Any, target: str, indent: int) -> None:
+        if isinstance(pattern, nodes.Wildcard):
+            return
+
+        if isinstance(pattern, nodes.Union):
+            self.union(pattern, target, indent, self.node)
+            return
+
+        if isinstance(pattern, nodes.Contains):
+            self.contains(pattern, target, indent)
+            return
+
+        if isinstance(pattern, nodes.expr):
+            unwrapped = self.var()
+            self.emit(
+                f"{unwrapped} = {target}.value if isinstance({target}, _Expr) else {target}",
+                indent,
+            )
+            target = unwrapped
+        elif isinstance(pattern, nodes.Expr):
+            self.emit(f"if isinstance({target}, _expr):", indent)
+            start = len(self.lines)
+            self.node(pattern.value, target, indent + 1)
+            self.block(start, indent + 1)
+            self.emit("else:", indent)
+            start = len(self.lines)
+            self.node_body(pattern, target, indent + 1)
+            self.block(start, indent + 1)
+            return
+
+        self.node_body(pattern, target, indent)
+
+    def node_body(self, pattern: Any, target: str, indent: int) -> None:
+        if isinstance(pattern, nodes.WildcardId):
+            self.emit(self.fail, indent)
+            return
+
+        if isinstance(pattern, nodes.Capture):
+            self.capture(pattern.name, target, indent)
+            self.node(pattern.pattern, target, indent)
+            return
+
+        if pattern is None:
+            self.emit(f"if {target} is not None: {self.fail}", indent)
+            return
+
+        ast_class = ast.__dict__.get(type(pattern).__name__)
+        if ast_class is None:
+            # e.g. a repeated wildcard outside of a list, which can never match
+            self.emit(self.fail, indent)
+            return
+        self.emit(
+            f"if not isinstance({target}, {self.const(ast_class)}): {self.fail}",
+            indent,
+        )
+
+        for name, field in pattern.fields:
+            if name in pattern._child_fields:
+                continue
+            if isinstance(field, (nodes.Wildcard, nodes.WildcardId)):
+                continue
+            value = self.var()
+            self.emit(f"{value} = {target}.{name}", indent)
+            self.field(field, value, indent)
+
+        for name, child in pattern.child_fields:
+            if isinstance(child, nodes.Wildcard):
+                continue
+
+            value = self.var()
+            self.emit(f"{value} = {target}.{name}", indent)
+            while isinstance(child, nodes.Capture):
+                self.capture(child.name, value, indent)
+                child = child.pattern
+
+            if isinstance(child, nodes.WildcardRepeat0):
+                self.emit(f"if not isinstance({value}, list): {self.fail}", indent)
+            elif isinstance(child, nodes.WildcardRepeat1):
+                self.emit(
+                    f"if not isinstance({value}, list) or not {value}: {self.fail}",
+                    indent,
+                )
+            elif isinstance(child, list) and any(map(is_variadic, child)):
+                sequence = SequencePattern.split(
+                    child,
+                    lambda item: compile_checker(item, self.slots, self.repeated),
+                    self.repeated,
+                )
+                self.emit(
+                    f"if not isinstance({value}, list) or not {self.const(sequence)}.match({value}, caps, _check_item): {self.fail}",
+                    indent,
+                )
+            elif isinstance(child, list):
+                self.emit(
+                    f"if not isinstance({value}, list) or len({value}) != {len(child)}: {self.fail}",
+                    indent,
+                )
+                for i, item in enumerate(child):
+                    if isinstance(item, nodes.Wildcard):
+                        continue
+                    element = self.var()
+                    self.emit(f"{element} = {value}[{i}]", indent)
+                    self.node(item, element, indent)
+            else:
+                self.node(child, value, indent)
+
+    def field(self, pattern: Any, target: str, indent: int) -> None:
+        if isinstance(pattern, (nodes.Wildcard, nodes.WildcardId)):
+            return
+
+        if isinstance(pattern, nodes.Capture):
+            self.capture(pattern.name, target, indent)
+            self.field(pattern.pattern, target, indent)
+            return
+
+        if isinstance(pattern, nodes.Union):
+            alternatives = factor_alternatives(pattern.alternatives)
+            if len(alternatives) > 1 and not any(map(_is_compound, alternatives)):
+                # e.g. `~.foo || ~.bar`, after factoring: one set lookup
+                self.emit(
+                    f"if {target}.__class__.__hash__ is None or {target} not in {self.const(frozenset(alternatives))}: {self.fail}",
+                    indent,
+                )
+                return
+            self.union(pattern, target, indent, self.field)
+            return
+
+        if isinstance(pattern, nodes.IdConstraint):
+            self.emit(
+                f"if not isinstance({target}, _str) or not {self.accepts(pattern, target)}: {self.fail}",
+                indent,
+            )
+            return
+
+        if isinstance(pattern, nodes.AST):
+            self.emit(self.fail, indent)
+            return
+
+        if isinstance(pattern, list):
+            self.emit(
+                f"if isinstance({target}, _AST) or len({target}) != {len(pattern)}: {self.fail}",
+                indent,
+            )
+            for i, item in enumerate(pattern):
+                element = self.var()
+                self.emit(f"{element} = {target}[{i}]", indent)
+                self.field(item, element, indent)
+            return
+
+        # an AST target never compares equal to a primitive pattern
+        self.emit(f"if not ({self.const(pattern)} == {target}): {self.fail}", indent)
+
+
+def _is_compound(pattern: Any) -> bool:
+    return isinstance(pattern, (nodes.AST, list))
+
+
+def _has_class(pattern: Any) -> bool:
+    # a node that only matches targets of its own `ast` class; an `Expr` pattern also
+    # matches bare expressions
+    return (
+        isinstance(pattern, nodes.AST)
+        and not isinstance(pattern, nodes.Expr)
+        and ast.__dict__.get(type(pattern).__name__) is not None
+    )
+
+
+def _merge(a: nodes.AST, b: nodes.AST) -> nodes.AST | None:
+    diff = [name for name, value in a.fields if value != getattr(b, name)]
+    if not diff:
+        # `b` can only match where `a` already did
+        return a
+    if len(diff) > 1:
+        return None
+    name = diff[0]
+    values = getattr(a, name), getattr(b, name)
+    if any(isinstance(v, list) or is_variadic(v) for v in values):
+        return None
+    merged = factor_alternatives(values)
+    return dataclasses.replace(
+        a, **{name: merged[0] if len(merged) == 1 else nodes.Union(tuple(merged))}
+    )
+
+
+def factor_alternatives(alternatives: Iterable[Any]) -> list[Any]:
+    """
+    Flatten nested unions, and merge alternatives of the same class that differ in a
+    single field into one node, with a union in that field. `a.foo() || a.bar()` becomes
+    `a.(foo || bar)()`, so the call and the receiver are checked once.
+
+    Alternatives are only moved past ones that cannot match the same targets, so the
+    first matching alternative stays the same.
+    """
+
+    flat: list[Any] = []
+    for alternative in alternatives:
+        if isinstance(alternative, nodes.Union):
+            flat.extend(factor_alternatives(alternative.alternatives))
+        else:
+            flat.append(alternative)
+        if isinstance(alternative, nodes.Wildcard):
+            # nothing after it is ever tried
+            break
+
+    factored: list[Any] = []
+    for alternative in flat:
+        for i in range(len(factored) - 1, -1, -1):
+            other = factored[i]
+            if not (_has_class(other) and _has_class(alternative)):
+                factored.append(alternative)
+                break
+            if type(other) is type(alternative):
+                merged = _merge(other, alternative)
+                if merged is None:
+                    factored.append(alternative)
+                else:
+                    factored[i] = merged
+                break
+        else:
+            factored.append(alternative)
+    return factored
+
+
+def compile_checker(
+    pattern: nodes.AST,
+    slots: dict[str | int, int] | None = None,
+    repeated: frozenset[str | int] | None = None,
+) -> Checker:
+    """
+    Return `check(target, captures)`, equivalent to `_match_node(pattern, target, 0, ...)`
+    but storing each capture `name` at `captures[slots[name]]`. `captures` must have a
+    slot for every name, initially `UNSET`.
+
+    `slots` and `repeated` (the capture names used more than once) describe the whole
+    pattern, when `pattern` is only a part of it.
+    """
+
+    names = capture_names(pattern)
+    if slots is None:
+        slots = {name: i for i, name in enumerate(names)}
+    if repeated is None:
+        repeated = frozenset(k for k, n in names.items() if n > 1)
+    gen = _CodeGen(slots, repeated)
+    gen.emit("def check(v0, caps):", 0)
+    gen.node(pattern, "v0", 1)
+    gen.emit("return True", 1)
+
+    source = "\n".join(gen.lines)
+    exec(compile(source, f"<pattern {type(pattern).__name__}>", "exec"), gen.namespace)
+    check = gen.namespace["check"]
+    check.__source__ = source
+    return check
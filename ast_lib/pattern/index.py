@@ -0,0 +1,381 @@
+"""
+Per-tree indexes used to pick match candidates without visiting every node.
+
+The candidates of a pattern are found by a `QueryPlan`, which starts from whichever
+constraint is the most selective in the tree at hand: the class of the node, the rarest
+identifier it pins, or the candidates of a descendant it must contain.
+"""
+
+from __future__ import annotations
+
+import ast
+import bisect
+import heapq
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Iterator, Literal, Sequence, cast
+
+from . import nodes
+from .analysis import (
+    IDENTIFIER_FIELDS,
+    PatternPath,
+    RequiredIdentifier,
+    descendant_patterns,
+    is_expression_pattern,
+    required_identifiers,
+    unwrap_pattern,
+)
+from .captures import Captures, restore_captures
+
+# indexes of the trees being searched, innermost search last
+_active: ContextVar[tuple[TreeIndex, ...]] = ContextVar("_active", default=())
+
+
+@dataclass(frozen=True)
+class QueryPlan:
+    """How a `TreeIndex` finds the candidates of a pattern, with its estimated cost."""
+
+    strategy: Literal["scan", "class", "identifier", "descendant", "union"]
+    cost: float
+    description: str
+    execute: Callable[[], Iterable[int]] = field(repr=False, compare=False)
+    inputs: tuple[QueryPlan, ...] = ()
+
+    def explain(self, indent: int = 0) -> str:
+        lines = [
+            f"{'  ' * indent}{self.strategy}: {self.description} (cost {self.cost:.0f})"
+        ]
+        lines.extend(plan.explain(indent + 1) for plan in self.inputs)
+        return "\n".join(lines)
+
+
+class TreeIndex:
+    """
+    Index of a tree, built once and shared by any number of pattern searches.
+
+    Nodes are numbered in preorder; `ends[i]` is one past the last node in the subtree
+    rooted at node `i`, so the descendants of `i` are exactly `range(i + 1, ends[i])`.
+    `identifiers` maps each identifier (see `IDENTIFIER_FIELDS`) to the nodes holding it.
+    """
+
+    def __init__(self, tree: ast.AST) -> None:
+        self.tree = tree
+        self.nodes: list[ast.AST] = []
+        self.ends: list[int] = []
+        self.parents: list[int] = []
+        # the field (and list index) under which each node is stored in its parent
+        self.links: list[tuple[str, int | None]] = []
+        self.identifiers: dict[str, list[int]] = {}
+        self._classes: dict[type[ast.AST], list[int]] = {}
+        self._class_cache: dict[type[ast.AST], list[int]] = {}
+        self._sorted_identifiers: list[str] | None = None
+        self._depth: float | None = None
+        self._positions: dict[int, int] | None = None
+        # candidates of descendant patterns, by pattern id (the pattern is kept alive)
+        self._descendant_cache: dict[int, tuple[nodes.AST, Sequence[int]]] = {}
+
+        # an `int` entry marks the exit of the node at that position
+        stack: list[tuple[ast.AST, int, str, int | None] | int] = [(tree, -1, "", None)]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, int):
+                self.ends[item] = len(self.nodes)
+                continue
+
+            node, parent, field, index = item
+            position = len(self.nodes)
+            self.nodes.append(node)
+            self.ends.append(position + 1)
+            self.parents.append(parent)
+            self.links.append((field, index))
+            self._classes.setdefault(type(node), []).append(position)
+
+            identifier_field = IDENTIFIER_FIELDS.get(type(node))
+            if identifier_field is not None:
+                identifier = getattr(node, identifier_field, None)
+                if isinstance(identifier, str):
+                    self.identifiers.setdefault(identifier, []).append(position)
+
+            stack.append(position)
+            children: list[tuple[ast.AST, int, str, int | None]] = []
+            for name, value in ast.iter_fields(node):
+                if isinstance(value, ast.AST):
+                    children.append((value, position, name, None))
+                elif isinstance(value, list):
+                    children.extend(
+                        (v, position, name, i)
+                        for i, v in enumerate(value)
+                        if isinstance(v, ast.AST)
+                    )
+            stack.extend(reversed(children))
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def of_class(self, cls: type[ast.AST]) -> list[int]:
+        """Positions of the nodes that are instances of `cls`, in preorder."""
+
+        positions = self._class_cache.get(cls)
+        if positions is None:
+            groups = [p for c, p in self._classes.items() if issubclass(c, cls)]
+            positions = groups[0] if len(groups) == 1 else list(heapq.merge(*groups))
+            self._class_cache[cls] = positions
+        return positions
+
+    def position(self, node: ast.AST) -> int | None:
+        """Preorder position of `node`, or `None` if it is not in the tree."""
+
+        if self._positions is None:
+            self._positions = {id(n): i for i, n in enumerate(self.nodes)}
+        return self._positions.get(id(node))
+
+    @contextmanager
+    def active(self) -> Iterator[TreeIndex]:
+        """Evaluate descendant constraints with this index while in the block."""
+
+        token = _active.set((*_active.get(), self))
+        try:
+            yield self
+        finally:
+            _active.reset(token)
+
+    def _climb(self, position: int, path: PatternPath) -> int | None:
+        nodes, parents, links = self.nodes, self.parents, self.links
+        for step in reversed(path):
+            parent = parents[position]
+            # an `Expr` statement stands at the same place as the expression it wraps
+            if parent >= 0 and type(nodes[parent]) is ast.Expr:
+                position = parent
+            if links[position] != step:
+                return None
+            position = parents[position]
+        return position
+
+    def _holds(self, position: int, required: RequiredIdentifier) -> bool:
+        node: Any = self.nodes[position]
+        for fname, index in required.path:
+            if isinstance(node, ast.Expr):
+                node = node.value
+            node = getattr(node, fname, None)
+            if index is not None:
+                node = (
+                    node[index]
+                    if isinstance(node, list) and index < len(node)
+                    else None
+                )
+        if isinstance(node, ast.Expr):
+            node = node.value
+        return isinstance(node, required.node_class) and required.accepts(
+            getattr(node, IDENTIFIER_FIELDS[required.node_class])
+        )
+
+    def _prefixed(self, prefix: str) -> list[str]:
+        # the identifiers starting with the prefix are contiguous once sorted
+        if self._sorted_identifiers is None:
+            self._sorted_identifiers = sorted(self.identifiers)
+        names = self._sorted_identifiers
+        start = bisect.bisect_left(names, prefix)
+        end = start
+        while end < len(names) and names[end].startswith(prefix):
+            end += 1
+        return names[start:end]
+
+    def _postings(self, required: RequiredIdentifier) -> Iterable[int]:
+        if not required.prefix:
+            return self.identifiers.get(required.name, ())
+        return heapq.merge(
+            *(self.identifiers[name] for name in self._prefixed(required.name))
+        )
+
+    def _posting_count(self, required: RequiredIdentifier) -> int:
+        if not required.prefix:
+            return len(self.identifiers.get(required.name, ()))
+        return sum(
+            len(self.identifiers[name]) for name in self._prefixed(required.name)
+        )
+
+    def _class_count(self, cls: type[ast.AST]) -> int:
+        positions = self._class_cache.get(cls)
+        if positions is not None:
+            return len(positions)
+        return sum(len(p) for c, p in self._classes.items() if issubclass(c, cls))
+
+    def _average_depth(self) -> float:
+        # each node is counted once in the subtree of each of its ancestors
+        if self._depth is None:
+            sizes = sum(end - i for i, end in enumerate(self.ends))
+            self._depth = sizes / len(self.nodes) - 1
+        return self._depth
+
+    def _by_identifiers(
+        self, required: list[RequiredIdentifier], first: int
+    ) -> list[int]:
+        # climb from the `first` identifier, then check the others from each candidate
+        driver = required[first]
+        roots = {
+            self._climb(p, driver.path)
+            for p in self._postings(driver)
+            if isinstance(self.nodes[p], driver.node_class)
+        }
+        roots.discard(None)
+        return sorted(
+            root
+            for root in cast(set[int], roots)
+            if all(self._holds(root, r) for i, r in enumerate(required) if i != first)
+        )
+
+    def _ancestors(
+        self, positions: Iterable[int], cls: type[ast.AST] | None
+    ) -> list[int]:
+        found: list[int] = []
+        seen: set[int] = set()
+        for position in positions:
+            # an ancestor already seen had all of its own ancestors seen too
+            ancestor = self.parents[position]
+            while ancestor >= 0 and ancestor not in seen:
+                seen.add(ancestor)
+                if cls is None or isinstance(self.nodes[ancestor], cls):
+                    found.append(ancestor)
+                ancestor = self.parents[ancestor]
+        found.sort()
+        return found
+
+    def _union(
+        self, alternatives: tuple[Any, ...], plans: list[QueryPlan]
+    ) -> list[int]:
+        found: set[int] = set()
+        for alternative, plan in zip(alternatives, plans, strict=True):
+            positions = plan.execute()
+            found.update(positions)
+            if is_expression_pattern(alternative):
+                # the statements wrapping these expressions match too
+                for p in positions:
+                    parent = self.parents[p]
+                    if parent >= 0 and type(self.nodes[parent]) is ast.Expr:
+                        found.add(parent)
+        return sorted(found)
+
+    def plan(self, pattern: nodes.AST) -> QueryPlan:
+        """
+        Choose how to find the candidates of `pattern`, starting from its most selective
+        constraint. Costs estimate the number of nodes touched, from the class counts,
+        identifier frequencies and average depth of this tree.
+        """
+
+        core = unwrap_pattern(pattern)
+        if isinstance(core, nodes.Union):
+            plans = [self.plan(alternative) for alternative in core.alternatives]
+            return QueryPlan(
+                "union",
+                sum(plan.cost for plan in plans),
+                f"{len(plans)} alternatives",
+                lambda: self._union(core.alternatives, plans),
+                tuple(plans),
+            )
+
+        options: list[QueryPlan] = []
+        ast_class = ast.__dict__.get(type(core).__name__)
+        if isinstance(core, nodes.Wildcard) or ast_class is None:
+            ast_class = None
+            options.append(
+                QueryPlan(
+                    "scan", len(self.nodes), "every node", lambda: range(len(self))
+                )
+            )
+        else:
+            options.append(
+                QueryPlan(
+                    "class",
+                    self._class_count(ast_class),
+                    f"nodes of class {ast_class.__name__}",
+                    lambda: self.of_class(ast_class),
+                )
+            )
+
+        required = required_identifiers(pattern)
+        if required:
+            counts = [self._posting_count(r) for r in required]
+            first = min(range(len(required)), key=counts.__getitem__)
+            driver = required[first]
+            attr = IDENTIFIER_FIELDS[driver.node_class]
+            options.append(
+                QueryPlan(
+                    "identifier",
+                    counts[first] * (1 + len(driver.path)),
+                    f"{driver.node_class.__name__}.{attr} "
+                    f"{'starting with' if driver.prefix else '='} {driver.name!r} "
+                    f"({counts[first]} nodes), climbing {len(driver.path)} "
+                    f"level{'s' * (len(driver.path) != 1)}",
+                    lambda: self._by_identifiers(required, first),
+                )
+            )
+
+        for descendant in descendant_patterns(pattern):
+            inner = self.plan(descendant)
+            options.append(
+                QueryPlan(
+                    "descendant",
+                    inner.cost * (1 + self._average_depth()),
+                    "ancestors of the candidates of the descendant",
+                    lambda inner=inner: self._ancestors(inner.execute(), ast_class),
+                    (inner,),
+                )
+            )
+
+        return min(options, key=lambda plan: plan.cost)
+
+    def candidates(self, pattern: nodes.AST) -> Iterable[int]:
+        """
+        Positions of the nodes that can match `pattern`, in preorder, found by its
+        cheapest plan (see `plan`).
+        """
+
+        return self.plan(pattern).execute()
+
+    def explain(self, pattern: nodes.AST) -> str:
+        return self.plan(pattern).explain()
+
+    def _descendant_candidates(self, pattern: nodes.AST) -> Sequence[int]:
+        entry = self._descendant_cache.get(id(pattern))
+        if entry is None:
+            positions = self.candidates(pattern)
+            if not isinstance(positions, (list, range)):
+                positions = list(positions)
+            entry = self._descendant_cache[id(pattern)] = (pattern, positions)
+        return entry[1]
+
+
+def has_descendant(
+    node: ast.AST,
+    pattern: nodes.AST,
+    check: Callable[[ast.AST, Captures], bool],
+    captures: Captures,
+) -> bool:
+    """
+    Whether `check` accepts a proper descendant of `node`, trying those that can match
+    `pattern` in preorder. Captures of rejected descendants are rolled back.
+
+    The candidates are taken from the index of an active search holding `node`, and cut
+    down to its subtree by bisection, so no subtree is walked again per node. Outside of
+    a search, the subtree of `node` is indexed.
+    """
+
+    for index in reversed(_active.get()):
+        position = index.position(node)
+        if position is not None:
+            break
+    else:
+        index, position = TreeIndex(node), 0
+
+    candidates = index._descendant_candidates(pattern)
+    start = bisect.bisect_right(candidates, position)
+    end = bisect.bisect_left(candidates, index.ends[position], start)
+    if start == end:
+        return False
+    saved = captures.copy()
+    for i in range(start, end):
+        if check(index.nodes[candidates[i]], captures):
+            return True
+        restore_captures(captures, saved)
+    return False
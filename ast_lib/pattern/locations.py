@@ -0,0 +1,143 @@
+"""
+Matches reduced to their source locations, for reporting.
+
+A `Location` holds plain strings and integers only, so it pickles cheaply, e.g. back
+from worker processes. Locations can be packed into NumPy structured arrays.
+"""
+
+from __future__ import annotations
+
+import ast
+import os
+from typing import TYPE_CHECKING, Any, Iterable, NamedTuple, Sequence
+
+from . import nodes
+from .match_pattern import MatchResult, iter_matches
+from .search import SearchStats, search_files
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+class Span(NamedTuple):
+    lineno: int
+    col_offset: int
+    end_lineno: int
+    end_col_offset: int
+
+
+class Location(NamedTuple):
+    path: str
+    lineno: int
+    col_offset: int
+    end_lineno: int
+    end_col_offset: int
+    # the span of each capture, positional ones keyed by their index; `None` for
+    # captures without a position, such as identifiers
+    captures: tuple[tuple[str | int, Span | None], ...] = ()
+
+    @property
+    def span(self) -> Span:
+        return Span(self.lineno, self.col_offset, self.end_lineno, self.end_col_offset)
+
+
+def _cover(spans: Iterable[Span | None]) -> Span | None:
+    found = [span for span in spans if span is not None]
+    if not found:
+        return None
+    start = min((span.lineno, span.col_offset) for span in found)
+    end = max((span.end_lineno, span.end_col_offset) for span in found)
+    return Span(*start, *end)
+
+
+def span_of(value: Any) -> Span | None:
+    """
+    The source span of a node, or of a list of nodes. Nodes without a position of their
+    own (e.g. `arguments`) cover their children.
+    """
+
+    if isinstance(value, list):
+        return _cover(map(span_of, value))
+    if not isinstance(value, ast.AST):
+        return None
+    if getattr(value, "end_lineno", None) is None:
+        return _cover(map(span_of, ast.iter_child_nodes(value)))
+    node: Any = value
+    return Span(node.lineno, node.col_offset, node.end_lineno, node.end_col_offset)
+
+
+def locate(result: MatchResult, path: str | os.PathLike[str] = "") -> Location:
+    span = span_of(result.node) or Span(0, 0, 0, 0)
+    captures: list[tuple[str | int, Span | None]] = [
+        (i, span_of(group)) for i, group in enumerate(result.groups)
+    ]
+    captures.extend((name, span_of(value)) for name, value in result.kw_groups.items())
+    return Location(os.fspath(path), *span, captures=tuple(captures))
+
+
+def match_locations(
+    pattern: str | nodes.AST,
+    tree: ast.AST,
+    path: str | os.PathLike[str] = "",
+) -> list[Location]:
+    """The locations of all matches of `pattern` in `tree`, as `iter_matches` finds them."""
+
+    return [locate(res, path) for res in iter_matches(pattern, tree)]
+
+
+def search_locations(
+    pattern: str | nodes.AST,
+    paths: Iterable[str | os.PathLike[str]],
+    *,
+    prefilter: bool = True,
+    stats: SearchStats | None = None,
+) -> list[Location]:
+    """
+    The locations of all matches of `pattern` in the given Python files, as
+    `search_files` finds them. Suited to be run in worker processes over chunks of paths:
+
+    >>> with ProcessPoolExecutor() as pool:
+    ...     found = pool.map(partial(search_locations, "~.append(~)"), chunks)
+    """
+
+    return [
+        locate(res, path)
+        for path, res in search_files(pattern, paths, prefilter=prefilter, stats=stats)
+    ]
+
+
+def _numpy() -> Any:
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError("to_arrays requires NumPy; install ast-lib[numpy]") from e
+    return numpy
+
+
+def to_arrays(locations: Sequence[Location]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Pack locations into two NumPy structured arrays: one row per match, and one per
+    capture, pointing at its match by row number. Captures without a position get -1 as
+    their span, and positional captures are named by their index.
+    """
+
+    np = _numpy()
+    span_fields = [(name, np.int32) for name in Span._fields]
+
+    path_width = max((len(loc.path) for loc in locations), default=0)
+    matches = np.array(
+        [(loc.path, *loc.span) for loc in locations],
+        dtype=[("path", f"U{max(path_width, 1)}"), *span_fields],
+    )
+
+    rows = [
+        (row, str(name), *(span or (-1, -1, -1, -1)))
+        for row, loc in enumerate(locations)
+        for name, span in loc.captures
+    ]
+    name_width = max((len(name) for _, name, *_ in rows), default=0)
+    captures = np.array(
+        rows,
+        dtype=[("match", np.int64), ("name", f"U{max(name_width, 1)}"), *span_fields],
+    )
+    return matches, captures
@@ -1,348 +1,755 @@
-""""""
-
-# ! Note: there is only two possible types of list: AST or _Identifier
-
-from __future__ import annotations
-
-import ast
-import io
-import re
-
-# from pydantic.dataclasses import dataclass
-from dataclasses import dataclass
-from typing import Any, Iterable, Literal, Sequence, cast, overload
-
-from loguru import logger
-
-from . import nodes
-from .parse import parse_pattern
-
-_debug_mode = False
-
-
-def _set_debug(debug: bool):
-    global _debug_mode
-    _debug_mode = debug
-
-
-logger.remove()
-
-
-def debug_log(msg: str, depth: float):
-    msg = re.sub(" at 0x[0-9a-fA-F]+>", ">", msg)
-    logger.debug(f"{' ' * int(depth * 2)}{msg}")
-
-
-def _match_field(
-    field_pattern: Any, field_target: Any, depth: float, captures: dict[str | int, Any]
-) -> bool:
-    if isinstance(field_pattern, (nodes.Wildcard, nodes.WildcardId)):
-        debug_log(f"Field {field_pattern} is wildcard, shortcut", depth)
-        return True
-    if isinstance(field_pattern, nodes.Capture):
-        debug_log(f"Field {field_pattern} is capture, expand", depth)
-        captures[field_pattern.name] = field_target
-        return _match_field(field_pattern.pattern, field_target, depth + 1, captures)
-
-    if isinstance(field_pattern, nodes.AST) or isinstance(field_target, ast.AST):
-        debug_log(f"Not expected field type: {field_pattern} or {field_target}", depth)
-        return False
-
-    if isinstance(field_pattern, list):
-        if len(field_pattern) != len(field_target):
-            debug_log(f"Field {field_pattern} is list, length mismatch", depth)
-            return False
-        for p, t in zip(field_pattern, field_target):
-            if not _match_field(p, t, depth, captures):
-                debug_log(f"Field {field_pattern} is list, mismatch", depth)
-                return False
-
-        debug_log(f"Field {field_pattern} is list, match", depth)
-        return True
-
-    debug_log(f"Field {field_pattern} is not list, match", depth)
-    return field_pattern == field_target
-
-
-def _match_node(
-    pattern_node: nodes.AST | None,
-    target_node: ast.AST | None,
-    depth: float,
-    captures: dict[str | int, Any],
-) -> bool:
-    # assert isinstance(pattern_node, nodes.AST)
-    # assert isinstance(target_node, ast.AST)
-
-    debug_log(f"Matching {pattern_node} against {target_node}", depth)
-
-    if isinstance(pattern_node, nodes.expr) and isinstance(target_node, ast.Expr):
-        debug_log("Target is Expr, expand", depth)
-        return _match_node(pattern_node, target_node.value, depth + 1, captures)
-    if isinstance(pattern_node, nodes.Expr) and isinstance(target_node, ast.expr):
-        debug_log("Pattern is Expr, expand", depth)
-        return _match_node(pattern_node.value, target_node, depth + 1, captures)
-
-    if isinstance(pattern_node, (nodes.Wildcard)):
-        debug_log("Pattern is wildcard or capture, shortcut", depth)
-        return True
-
-    if isinstance(pattern_node, nodes.WildcardId):
-        # raise ValueError(f"WildcardId {pattern_node} is not expected")
-        debug_log("WildcardId is not expected", depth)
-        return False
-
-    if isinstance(pattern_node, nodes.Capture):
-        captures[pattern_node.name] = target_node
-        debug_log("Pattern is capture, expand", depth)
-        assert isinstance(pattern_node.pattern, nodes.AST)
-        return _match_node(pattern_node.pattern, target_node, depth + 1, captures)
-
-    if pattern_node is None:
-        debug_log("Pattern is None, shortcut", depth)
-        return target_node is None
-    if target_node is None:
-        debug_log("Target is None, mismatch", depth)
-        return False
-
-    if not issubclass(target_node.__class__, pattern_node.ast_class):
-        debug_log(f"{pattern_node} is not {target_node.__class__}, mismatch", depth)
-        return False
-
-    for name, field in pattern_node.fields:
-        if name in pattern_node._child_fields:
-            continue
-
-        if name not in target_node._fields:
-            raise ValueError(
-                f"{name} not in {target_node._fields} when matching {pattern_node} against {target_node}"
-            )
-
-        if not _match_field(field, getattr(target_node, name), depth + 0.5, captures):
-            debug_log(f"Field {name} mismatch", depth)
-            return False
-
-        debug_log(
-            f"Field {name} matched with {repr(getattr(target_node, name))}", depth + 0.5
-        )
-
-    for name, child in pattern_node.child_fields:
-        # TODO: fix
-
-        if isinstance(child, nodes.Wildcard):
-            debug_log(f"Child {name} is wildcard, shortcut", depth)
-            continue
-
-        while isinstance(child, nodes.Capture):
-            # TODO: match or record first
-            captures[child.name] = getattr(target_node, name)
-            debug_log(f"Child {name} is capture, expand", depth)
-            child = child.pattern
-
-        target_child = getattr(target_node, name)
-        if isinstance(target_child, list):
-            if isinstance(child, nodes.WildcardRepeat0):
-                continue
-
-            if isinstance(child, nodes.WildcardRepeat1):
-                if len(target_child) == 0:
-                    debug_log(f"Child {name} is list, but target is empty", depth)
-                    return False
-                continue
-
-            assert isinstance(child, list)
-
-            if len(target_child) != len(child):
-                debug_log(f"Child {name} is list, length mismatch", depth)
-                return False
-
-            for p, t in zip(child, target_child):
-                if not _match_node(p, t, depth + 1, captures):
-                    debug_log(f"Field {name} mismatch", depth)
-                    return False
-            continue
-
-        if isinstance(child, list):
-            debug_log(
-                f"Child {name} is list: {child}, but target is not list: {target_child}",
-                depth,
-            )
-            return False
-
-        if not _match_node(child, target_child, depth + 1, captures):
-            debug_log(f"Field {name} mismatch", depth)
-            return False
-
-    debug_log(f"Match {pattern_node} against {target_node} success", depth)
-    return True
-
-
-# todo: covariant? Mapping?
-@dataclass(frozen=True)
-class MatchResult[N: ast.AST, *T, K]:
-    node: N
-    groups: tuple[*T]
-    kw_groups: K
-
-    def to_tuple(self) -> tuple[N, *T, K]:
-        return (self.node, *self.groups, self.kw_groups)
-
-
-class MatchTypeHint[N: ast.AST, *T, K: dict]:
-    pass
-
-
-MATCH_TYPE_HINT_DEFAULT = MatchTypeHint[ast.AST, *tuple[Any, ...], dict]()
-
-
-@overload
-def match_node[N: ast.AST, *T, K: dict](
-    pattern_node: nodes.AST,
-    target: ast.AST,
-    #
-    assert_match: Literal[True],
-    match_type_hint: MatchTypeHint[N, *T, K] = MATCH_TYPE_HINT_DEFAULT,
-) -> MatchResult[N, *T, K]: ...
-
-
-@overload
-def match_node[N: ast.AST, *T, K: dict](
-    pattern_node: nodes.AST,
-    target: ast.AST,
-    #
-    assert_match: Literal[False] = False,
-    match_type_hint: MatchTypeHint[N, *T, K] = MATCH_TYPE_HINT_DEFAULT,
-) -> MatchResult[N, *T, K] | None: ...
-
-
-def match_node[N: ast.AST, *T, K: dict](
-    pattern_node: nodes.AST,
-    target: ast.AST,
-    #
-    assert_match: bool = False,
-    match_type_hint: MatchTypeHint[N, *T, K] = MATCH_TYPE_HINT_DEFAULT,
-) -> MatchResult[N, *T, K] | None:
-    sink = io.StringIO()
-    handler_id = logger.add(sink, format="{message}")
-
-    captures: dict[str | int, Any] = {}
-    res = _match_node(pattern_node, target, 0, captures)
-
-    logger.remove(handler_id)
-
-    if res:
-        int_keys = [k for k in captures.keys() if isinstance(k, int)]
-        if int_keys:
-            assert int_keys == list(range(min(int_keys), max(int_keys) + 1))
-
-        args: Any = [None] * len(int_keys)
-        for k in int_keys:
-            args[k] = captures.pop(k)
-
-        return cast(
-            Any, MatchResult(node=target, groups=tuple(args), kw_groups=captures)
-        )
-
-    if assert_match or _debug_mode:
-        raise ValueError(
-            f"Pattern {pattern_node} does not match:\n{ast.unparse(target)}\n"
-            "Traceback:\n"
-            f"{sink.getvalue()}"
-        )
-    return None
-
-
-@overload
-def match_pattern[N: ast.AST, *T, K: dict](
-    pattern: str,
-    target: ast.AST,
-    assert_match: Literal[False] = False,
-    match_type_hint: MatchTypeHint[N, *T, K] = MATCH_TYPE_HINT_DEFAULT,
-) -> MatchResult[N, *T, K] | None: ...
-
-
-@overload
-def match_pattern[N: ast.AST, *T, K: dict](
-    pattern: str,
-    target: ast.AST,
-    #
-    assert_match: Literal[True],
-    match_type_hint: MatchTypeHint[N, *T, K] = MATCH_TYPE_HINT_DEFAULT,
-) -> MatchResult[N, *T, K]: ...
-
-
-def match_pattern[N: ast.AST, *T, K: dict](
-    pattern: str,
-    target: ast.AST,
-    #
-    assert_match: bool = False,
-    match_type_hint: MatchTypeHint[N, *T, K] = MATCH_TYPE_HINT_DEFAULT,
-) -> MatchResult[N, *T, K] | None:
-    pattern_node = parse_pattern(pattern)
-
-    assert_match = cast(Literal[False], assert_match)
-    res = match_node(pattern_node, target, assert_match=assert_match)
-    return res  # pyright: ignore
-
-
-@overload
-def match_first[N: ast.AST, *T, K: dict](
-    pattern: str | nodes.AST,
-    targets: Iterable[ast.AST],
-    *,
-    assert_match: Literal[False] = False,
-    match_type_hint: MatchTypeHint[N, *T, K] = MATCH_TYPE_HINT_DEFAULT,
-) -> MatchResult[N, *T, K] | None: ...
-
-
-@overload
-def match_first[N: ast.AST, *T, K: dict](
-    pattern: str | nodes.AST,
-    targets: Iterable[ast.AST],
-    *,
-    assert_match: Literal[True],
-    match_type_hint: MatchTypeHint[N, *T, K] = MATCH_TYPE_HINT_DEFAULT,
-) -> MatchResult[N, *T, K]: ...
-
-
-def match_first[N: ast.AST, *T, K: dict](
-    pattern: str | nodes.AST,
-    targets: Iterable[ast.AST],
-    *,
-    assert_match: bool = False,
-    match_type_hint: MatchTypeHint[N, *T, K] = MATCH_TYPE_HINT_DEFAULT,
-) -> MatchResult[N, *T, K] | None:
-    if isinstance(pattern, str):
-        pattern = parse_pattern(pattern)
-
-    for target in targets:
-        res = match_node(pattern, target)
-        if res is not None:
-            return cast(MatchResult[N, *T, K], res)
-
-    if assert_match:
-        nodes_str = "\n".join(ast.unparse(target) for target in targets)
-        raise ValueError(f"Pattern {pattern} does not match:\n{nodes_str}")
-    return None
-
-
-def match_all[N: ast.AST, *T, K: dict](
-    pattern: str | nodes.AST,
-    targets: Iterable[ast.AST],
-    *,
-    assert_all: bool = False,
-    match_type_hint: MatchTypeHint[N, *T, K] = MATCH_TYPE_HINT_DEFAULT,
-) -> list[MatchResult[N, *T, K]]:
-    if isinstance(pattern, str):
-        pattern = parse_pattern(pattern)
-
-    results: list[MatchResult] = []
-    for target in targets:
-        res = match_node(pattern, target)
-        if res is None:
-            if assert_all:
-                raise ValueError(f"Pattern {pattern} does not match: {target}")
-            continue
-
-        results.append(res)
-
-    return cast(Any, results)
+""""""
+
+# ! Note: there is only two possible types of list: AST or _Identifier
+
+from __future__ import annotations
+
+import ast
+import io
+import itertools
+import re
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    Literal,
+    Sequence,
+    cast,
+    overload,
+)
+
+from loguru import logger
+
+from . import nodes
+from .analysis import (
+    capture_names,
+    is_expression_pattern,
+    is_variadic,
+    uses_descendants,
+)
+from .captures import UNSET, bind_capture, capture_scope, restore_captures
+from .compiler import compile_checker
+from .index import TreeIndex, has_descendant
+from .parse import parse_pattern
+from .sequence import SequencePattern
+
+_debug_mode = False
+# Only set while replaying a failed match, so the normal path never formats log messages
+_tracing = False
+
+
+def _set_debug(debug: bool):
+    global _debug_mode
+    _debug_mode = debug
+
+
+logger.remove()
+
+
+def debug_log(msg: str, depth: float):
+    msg = re.sub(" at 0x[0-9a-fA-F]+>", ">", msg)
+    logger.debug(f"{' ' * int(depth * 2)}{msg}")
+
+
+def _trace_match(pattern_node: nodes.AST, target: ast.AST) -> str:
+    global _tracing
+    sink = io.StringIO()
+    handler_id = logger.add(sink, format="{message}")
+    _tracing = True
+    try:
+        _match_node(pattern_node, target, 0, {})
+    finally:
+        _tracing = False
+        logger.remove(handler_id)
+    return sink.getvalue()
+
+
+def _match_field(
+    field_pattern: Any, field_target: Any, depth: float, captures: dict[str | int, Any]
+) -> bool:
+    if isinstance(field_pattern, (nodes.Wildcard, nodes.WildcardId)):
+        if _tracing:
+            debug_log(f"Field {field_pattern} is wildcard, shortcut", depth)
+        return True
+    if isinstance(field_pattern, nodes.Capture):
+        if _tracing:
+            debug_log(f"Field {field_pattern} is capture, expand", depth)
+        if not bind_capture(captures, field_pattern.name, field_target):
+            if _tracing:
+                debug_log(f"Field {field_pattern} differs from earlier capture", depth)
+            return False
+        return _match_field(field_pattern.pattern, field_target, depth + 1, captures)
+
+    if isinstance(field_pattern, nodes.Union):
+        return _match_alternatives(
+            field_pattern.alternatives, field_target, depth, captures, _match_field
+        )
+
+    if isinstance(field_pattern, nodes.IdConstraint):
+        if _tracing:
+            debug_log(f"Field {field_pattern} is identifier constraint", depth)
+        return isinstance(field_target, str) and field_pattern.accepts(field_target)
+
+    if isinstance(field_pattern, nodes.AST) or isinstance(field_target, ast.AST):
+        if _tracing:
+            debug_log(
+                f"Not expected field type: {field_pattern} or {field_target}", depth
+            )
+        return False
+
+    if isinstance(field_pattern, list):
+        if len(field_pattern) != len(field_target):
+            if _tracing:
+                debug_log(f"Field {field_pattern} is list, length mismatch", depth)
+            return False
+        for p, t in zip(field_pattern, field_target):
+            if not _match_field(p, t, depth, captures):
+                if _tracing:
+                    debug_log(f"Field {field_pattern} is list, mismatch", depth)
+                return False
+
+        if _tracing:
+            debug_log(f"Field {field_pattern} is list, match", depth)
+        return True
+
+    if _tracing:
+        debug_log(f"Field {field_pattern} is not list, match", depth)
+    return field_pattern == field_target
+
+
+def _match_alternatives(
+    alternatives: Iterable[Any],
+    target: Any,
+    depth: float,
+    captures: dict[str | int, Any],
+    match: Callable[[Any, Any, float, dict[str | int, Any]], bool],
+) -> bool:
+    saved = captures.copy()
+    for i, alternative in enumerate(alternatives):
+        if match(alternative, target, depth + 1, captures):
+            if _tracing:
+                debug_log(f"Alternative {i} matched", depth)
+            return True
+        # the captures of a failed alternative are dropped
+        restore_captures(captures, saved)
+    if _tracing:
+        debug_log("No alternative matched", depth)
+    return False
+
+
+# kinds of work items of `_match_node`
+_NODE, _CHILD, _SUCCESS_LOG, _FAILURE_LOG = range(4)
+
+
+def _match_node(
+    pattern_node: nodes.AST | None,
+    target_node: ast.AST | None,
+    depth: float,
+    captures: dict[str | int, Any],
+) -> bool:
+    # An explicit work stack keeps deep patterns off the call stack. Items are pushed in
+    # reverse, so they run in the order of a recursive descent and bind captures in the
+    # same order.
+    stack: list[tuple[Any, ...]] = [(_NODE, pattern_node, target_node, depth)]
+    while stack:
+        item = stack.pop()
+        kind = item[0]
+        if kind == _NODE:
+            ok = _match_node_step(item[1], item[2], item[3], captures, stack)
+        elif kind == _CHILD:
+            ok = _match_child_step(*item[1:], captures=captures, stack=stack)
+        elif kind == _SUCCESS_LOG:
+            debug_log(item[1], item[2])
+            continue
+        else:
+            continue
+
+        if not ok:
+            if _tracing:
+                # report every enclosing child on the way out, innermost first
+                for pending in reversed(stack):
+                    if pending[0] == _FAILURE_LOG:
+                        debug_log(pending[1], pending[2])
+            return False
+    return True
+
+
+def _match_contains(
+    pattern_node: nodes.Contains,
+    target_node: ast.AST | None,
+    depth: float,
+    captures: dict[str | int, Any],
+) -> bool:
+    if is_expression_pattern(pattern_node.pattern) and isinstance(
+        target_node, ast.Expr
+    ):
+        # the descendants are looked for below the expression, not its statement
+        target_node = target_node.value
+    if target_node is None or not _match_node(
+        pattern_node.pattern, target_node, depth + 1, captures
+    ):
+        return False
+
+    descendant = pattern_node.descendant
+    if _tracing:
+        debug_log(f"Looking for a descendant matching {descendant}", depth)
+    return has_descendant(
+        target_node,
+        descendant,
+        lambda node, caps: _match_node(descendant, node, depth + 1, caps),
+        captures,
+    )
+
+
+def _match_node_step(
+    pattern_node: nodes.AST | None,
+    target_node: ast.AST | None,
+    depth: float,
+    captures: dict[str | int, Any],
+    stack: list[tuple[Any, ...]],
+) -> bool:
+    while True:
+        if _tracing:
+            debug_log(f"Matching {pattern_node} against {target_node}", depth)
+
+        if isinstance(pattern_node, nodes.expr) and isinstance(target_node, ast.Expr):
+            if _tracing:
+                debug_log("Target is Expr, expand", depth)
+            target_node = target_node.value
+            depth += 1
+            continue
+        if isinstance(pattern_node, nodes.Expr) and isinstance(target_node, ast.expr):
+            if _tracing:
+                debug_log("Pattern is Expr, expand", depth)
+            pattern_node = pattern_node.value
+            depth += 1
+            continue
+
+        if isinstance(pattern_node, (nodes.Wildcard)):
+            if _tracing:
+                debug_log("Pattern is wildcard or capture, shortcut", depth)
+            return True
+
+        if isinstance(pattern_node, nodes.WildcardId):
+            # raise ValueError(f"WildcardId {pattern_node} is not expected")
+            if _tracing:
+                debug_log("WildcardId is not expected", depth)
+            return False
+
+        if isinstance(pattern_node, nodes.Union):
+            return _match_alternatives(
+                pattern_node.alternatives, target_node, depth, captures, _match_node
+            )
+
+        if isinstance(pattern_node, nodes.Contains):
+            return _match_contains(pattern_node, target_node, depth, captures)
+
+        if isinstance(pattern_node, nodes.Capture):
+            if not bind_capture(captures, pattern_node.name, target_node):
+                if _tracing:
+                    debug_log("Pattern is capture, differs from earlier capture", depth)
+                return False
+            if _tracing:
+                debug_log("Pattern is capture, expand", depth)
+            assert isinstance(pattern_node.pattern, nodes.AST)
+            pattern_node = pattern_node.pattern
+            depth += 1
+            continue
+
+        break
+
+    if pattern_node is None:
+        if _tracing:
+            debug_log("Pattern is None, shortcut", depth)
+        return target_node is None
+    if target_node is None:
+        if _tracing:
+            debug_log("Target is None, mismatch", depth)
+        return False
+
+    if not issubclass(target_node.__class__, pattern_node.ast_class):
+        if _tracing:
+            debug_log(f"{pattern_node} is not {target_node.__class__}, mismatch", depth)
+        return False
+
+    for name, field in pattern_node.fields:
+        if name in pattern_node._child_fields:
+            continue
+
+        if name not in target_node._fields:
+            raise ValueError(
+                f"{name} not in {target_node._fields} when matching {pattern_node} against {target_node}"
+            )
+
+        if not _match_field(field, getattr(target_node, name), depth + 0.5, captures):
+            if _tracing:
+                debug_log(f"Field {name} mismatch", depth)
+            return False
+
+        if _tracing:
+            debug_log(
+                f"Field {name} matched with {repr(getattr(target_node, name))}",
+                depth + 0.5,
+            )
+
+    if _tracing:
+        stack.append(
+            (_SUCCESS_LOG, f"Match {pattern_node} against {target_node} success", depth)
+        )
+    for name, child in reversed(list(pattern_node.child_fields)):
+        stack.append((_CHILD, target_node, name, child, depth))
+    return True
+
+
+def _match_child_step(
+    target_node: ast.AST,
+    name: str,
+    child: Any,
+    depth: float,
+    *,
+    captures: dict[str | int, Any],
+    stack: list[tuple[Any, ...]],
+) -> bool:
+    # TODO: fix
+
+    if isinstance(child, nodes.Wildcard):
+        if _tracing:
+            debug_log(f"Child {name} is wildcard, shortcut", depth)
+        return True
+
+    while isinstance(child, nodes.Capture):
+        # TODO: match or record first
+        if not bind_capture(captures, child.name, getattr(target_node, name)):
+            if _tracing:
+                debug_log(f"Child {name} differs from earlier capture", depth)
+            return False
+        if _tracing:
+            debug_log(f"Child {name} is capture, expand", depth)
+        child = child.pattern
+
+    target_child = getattr(target_node, name)
+    if isinstance(target_child, list):
+        if isinstance(child, nodes.WildcardRepeat0):
+            return True
+
+        if isinstance(child, nodes.WildcardRepeat1):
+            if len(target_child) == 0:
+                if _tracing:
+                    debug_log(f"Child {name} is list, but target is empty", depth)
+                return False
+            return True
+
+        assert isinstance(child, list)
+
+        if any(is_variadic(p) for p in child):
+            sequence = SequencePattern.split(child)
+            if not sequence.match(
+                target_child,
+                captures,
+                lambda p, t, c: _match_node(p, t, depth + 1, c),
+            ):
+                if _tracing:
+                    debug_log(f"Child {name} is variadic list, mismatch", depth)
+                return False
+            return True
+
+        if len(target_child) != len(child):
+            if _tracing:
+                debug_log(f"Child {name} is list, length mismatch", depth)
+            return False
+
+        if _tracing:
+            stack.append((_FAILURE_LOG, f"Field {name} mismatch", depth))
+        for p, t in reversed(list(zip(child, target_child))):
+            stack.append((_NODE, p, t, depth + 1))
+        return True
+
+    if isinstance(child, list):
+        if _tracing:
+            debug_log(
+                f"Child {name} is list: {child}, but target is not list: {target_child}",
+                depth,
+            )
+        return False
+
+    if _tracing:
+        stack.append((_FAILURE_LOG, f"Field {name} mismatch", depth))
+    stack.append((_NODE, child, target_child, depth + 1))
+    return True
+
+
+# number of positional captures, and the names of the others
+type CaptureLayout = tuple[int, tuple[str, ...]]
+
+
+# todo: covariant? Mapping?
+class MatchResult[N: ast.AST, *T, K]:
+    """
+    Result of a successful match.
+
+    Compiled matchers hand over their flat capture array as is; `groups` and `kw_groups`
+    are built from it on first access.
+    """
+
+    __slots__ = ("_groups", "_kw_groups", "_layout", "_values", "node")
+    __match_args__ = ("node", "groups", "kw_groups")
+
+    node: N
+
+    def __init__(self, node: N, groups: tuple[*T], kw_groups: K) -> None:
+        self.node = node
+        self._groups: tuple[*T] | None = groups
+        self._kw_groups: K | None = kw_groups
+
+    @classmethod
+    def _from_slots(
+        cls, node: N, layout: CaptureLayout, values: list[Any]
+    ) -> MatchResult[N, *T, K]:
+        result = cls.__new__(cls)
+        result.node = node
+        result._layout = layout
+        result._values = values
+        result._groups = None
+        result._kw_groups = None
+        return result
+
+    def _materialize(self) -> None:
+        n_groups, kw_names = self._layout
+        values = self._values
+        args = values[:n_groups]
+        kwargs = dict(zip(kw_names, values[n_groups:]))
+        if UNSET in values:
+            args = [v for v in args if v is not UNSET]
+            kwargs = {k: v for k, v in kwargs.items() if v is not UNSET}
+        self._groups = cast(Any, tuple(args))
+        self._kw_groups = cast(Any, kwargs)
+        del self._values
+
+    @property
+    def groups(self) -> tuple[*T]:
+        if self._groups is None:
+            self._materialize()
+        return cast(Any, self._groups)
+
+    @property
+    def kw_groups(self) -> K:
+        if self._kw_groups is None:
+            self._materialize()
+        return cast(Any, self._kw_groups)
+
+    def to_tuple(self) -> tuple[N, *T, K]:
+        return (self.node, *self.groups, self.kw_groups)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, MatchResult):
+            return NotImplemented
+        return self.to_tuple() == other.to_tuple()
+
+    __hash__ = None  # type: ignore
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(node={self.node!r}, groups={self.groups!r}, kw_groups={self.kw_groups!r})"
+
+
+class MatchTypeHint[N: ast.AST, *T, K: dict]:
+    pass
+
+
+MATCH_TYPE_HINT_DEFAULT = MatchTypeHint[ast.AST, *tuple[Any, ...], dict]()
+
+
+def compile_pattern[N: ast.AST, *T, K: dict](
+    pattern: str | nodes.AST,
+    match_type_hint: MatchTypeHint[N, *T, K] = MATCH_TYPE_HINT_DEFAULT,
+) -> Callable[[ast.AST], MatchResult[N, *T, K] | None]:
+    if isinstance(pattern, str):
+        pattern = parse_pattern(pattern)
+
+    # patterns are frozen, so the matcher is cached on the node itself
+    matcher = pattern.__dict__.get("_compiled")
+    if matcher is not None:
+        return matcher
+
+    # positional captures go first, so `groups` is a prefix of the capture array
+    names = capture_names(pattern)
+    int_names = sorted(k for k in names if isinstance(k, int))
+    kw_names = tuple(k for k in names if isinstance(k, str))
+    assert int_names == list(range(len(int_names)))
+    layout: CaptureLayout = (len(int_names), kw_names)
+    slots = {name: i for i, name in enumerate((*int_names, *kw_names))}
+    try:
+        check = compile_checker(pattern, slots)
+    except RecursionError:
+        # too deep to generate code for; the interpreter does not recurse
+        def check(target: ast.AST, values: list[Any]) -> bool:
+            captures: dict[str | int, Any] = {}
+            if not _match_node(pattern, target, 0, captures):
+                return False
+            for name, value in captures.items():
+                values[slots[name]] = value
+            return True
+
+    empty = [UNSET] * len(slots)
+
+    def matcher(target: ast.AST) -> Any:
+        values = empty.copy()
+        if not check(target, values):
+            return None
+        return MatchResult._from_slots(target, layout, values)
+
+    if any(count > 1 for count in names.values()):
+        unscoped = matcher
+
+        def matcher(target: ast.AST) -> Any:
+            with capture_scope():
+                return unscoped(target)
+
+    object.__setattr__(pattern, "_compiled", matcher)
+    return matcher
+
+
+@overload
+def match_node[N: ast.AST, *T, K: dict](
+    pattern_node: nodes.AST,
+    target: ast.AST,
+    #
+    assert_match: Literal[True],
+    match_type_hint: MatchTypeHint[N, *T, K] = MATCH_TYPE_HINT_DEFAULT,
+) -> MatchResult[N, *T, K]: ...
+
+
+@overload
+def match_node[N: ast.AST, *T, K: dict](
+    pattern_node: nodes.AST,
+    target: ast.AST,
+    #
+    assert_match: Literal[False] = False,
+    match_type_hint: MatchTypeHint[N, *T, K] = MATCH_TYPE_HINT_DEFAULT,
+) -> MatchResult[N, *T, K] | None: ...
+
+
+def match_node[N: ast.AST, *T, K: dict](
+    pattern_node: nodes.AST,
+    target: ast.AST,
+    #
+    assert_match: bool = False,
+    match_type_hint: MatchTypeHint[N, *T, K] = MATCH_TYPE_HINT_DEFAULT,
+) -> MatchResult[N, *T, K] | None:
+    res = compile_pattern(pattern_node)(target)
+    if res is not None:
+        return cast(Any, res)
+
+    if assert_match or _debug_mode:
+        # The match is replayed with tracing on, only when the trace is needed
+        raise ValueError(
+            f"Pattern {pattern_node} does not match:\n{ast.unparse(target)}\n"
+            "Traceback:\n"
+            f"{_trace_match(pattern_node, target)}"
+        )
+    return None
+
+
+@overload
+def match_pattern[N: ast.AST, *T, K: dict](
+    pattern: str,
+    target: ast.AST,
+    assert_match: Literal[False] = False,
+    match_type_hint: MatchTypeHint[N, *T, K] = MATCH_TYPE_HINT_DEFAULT,
+) -> MatchResult[N, *T, K] | None: ...
+
+
+@overload
+def match_pattern[N: ast.AST, *T, K: dict](
+    pattern: str,
+    target: ast.AST,
+    #
+    assert_match: Literal[True],
+    match_type_hint: MatchTypeHint[N, *T, K] = MATCH_TYPE_HINT_DEFAULT,
+) -> MatchResult[N, *T, K]: ...
+
+
+def match_pattern[N: ast.AST, *T, K: dict](
+    pattern: str,
+    target: ast.AST,
+    #
+    assert_match: bool = False,
+    match_type_hint: MatchTypeHint[N, *T, K] = MATCH_TYPE_HINT_DEFAULT,
+) -> MatchResult[N, *T, K] | None:
+    pattern_node = parse_pattern(pattern)
+
+    assert_match = cast(Literal[False], assert_match)
+    res = match_node(pattern_node, target, assert_match=assert_match)
+    return res  # pyright: ignore
+
+
+@overload
+def match_first[N: ast.AST, *T, K: dict](
+    pattern: str | nodes.AST,
+    targets: Iterable[ast.AST],
+    *,
+    assert_match: Literal[False] = False,
+    match_type_hint: MatchTypeHint[N, *T, K] = MATCH_TYPE_HINT_DEFAULT,
+) -> MatchResult[N, *T, K] | None: ...
+
+
+@overload
+def match_first[N: ast.AST, *T, K: dict](
+    pattern: str | nodes.AST,
+    targets: Iterable[ast.AST],
+    *,
+    assert_match: Literal[True],
+    match_type_hint: MatchTypeHint[N, *T, K] = MATCH_TYPE_HINT_DEFAULT,
+) -> MatchResult[N, *T, K]: ...
+
+
+def match_first[N: ast.AST, *T, K: dict](
+    pattern: str | nodes.AST,
+    targets: Iterable[ast.AST],
+    *,
+    assert_match: bool = False,
+    match_type_hint: MatchTypeHint[N, *T, K] = MATCH_TYPE_HINT_DEFAULT,
+) -> MatchResult[N, *T, K] | None:
+    if isinstance(pattern, str):
+        pattern = parse_pattern(pattern)
+
+    matcher = compile_pattern(pattern)
+    for target in targets:
+        res = matcher(target)
+        if res is not None:
+            return cast(MatchResult[N, *T, K], res)
+
+    if assert_match:
+        nodes_str = "\n".join(ast.unparse(target) for target in targets)
+        raise ValueError(f"Pattern {pattern} does not match:\n{nodes_str}")
+    return None
+
+
+def match_all[N: ast.AST, *T, K: dict](
+    pattern: str | nodes.AST,
+    targets: Iterable[ast.AST],
+    *,
+    assert_all: bool = False,
+    match_type_hint: MatchTypeHint[N, *T, K] = MATCH_TYPE_HINT_DEFAULT,
+) -> list[MatchResult[N, *T, K]]:
+    if isinstance(pattern, str):
+        pattern = parse_pattern(pattern)
+
+    matcher = compile_pattern(pattern)
+    results: list[MatchResult] = []
+    for target in targets:
+        res = matcher(target)
+        if res is None:
+            if assert_all:
+                raise ValueError(f"Pattern {pattern} does not match: {target}")
+            continue
+
+        results.append(res)
+
+    return cast(Any, results)
+
+
+def _iter_tree(
+    matcher: Callable[[ast.AST], MatchResult | None],
+    tree: ast.AST,
+    skip_expr: bool,
+    descend_into_matches: bool,
+) -> Iterator[MatchResult]:
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        if not (skip_expr and isinstance(node, ast.Expr)):
+            res = matcher(node)
+            if res is not None:
+                yield res
+                if not descend_into_matches:
+                    continue
+        stack.extend(reversed(list(ast.iter_child_nodes(node))))
+
+
+def _iter_index(
+    matcher: Callable[[ast.AST], MatchResult | None],
+    index: TreeIndex,
+    positions: Iterable[int],
+    skip_expr: bool,
+    descend_into_matches: bool,
+) -> Iterator[MatchResult]:
+    tree_nodes = index.nodes
+    skip_until = 0
+    for position in positions:
+        if position < skip_until:
+            continue
+        node = tree_nodes[position]
+        if skip_expr and isinstance(node, ast.Expr):
+            continue
+        res = matcher(node)
+        if res is not None:
+            yield res
+            if not descend_into_matches:
+                skip_until = index.ends[position]
+
+
+def _with_index(
+    matcher: Callable[[ast.AST], MatchResult | None], index: TreeIndex
+) -> Callable[[ast.AST], MatchResult | None]:
+    def match(node: ast.AST) -> MatchResult | None:
+        with index.active():
+            return matcher(node)
+
+    return match
+
+
+def iter_matches[N: ast.AST, *T, K: dict](
+    pattern: str | nodes.AST,
+    tree: ast.AST | TreeIndex,
+    *,
+    limit: int | None = None,
+    descend_into_matches: bool = True,
+    match_type_hint: MatchTypeHint[N, *T, K] = MATCH_TYPE_HINT_DEFAULT,
+) -> Iterator[MatchResult[N, *T, K]]:
+    """
+    Lazily yield the matches of `pattern` in the whole `tree`, in preorder.
+
+    An expression pattern matches both an `Expr` statement and its value, so only the
+    value is reported. With `descend_into_matches=False`, nodes below a match are skipped.
+    Given a `TreeIndex`, only the nodes of the pattern's class are tried. Patterns with a
+    descendant constraint (`contains`) index the tree if it is not already.
+    """
+
+    if isinstance(pattern, str):
+        pattern = parse_pattern(pattern)
+
+    matcher = compile_pattern(pattern)
+    skip_expr = is_expression_pattern(pattern)
+    if uses_descendants(pattern):
+        if not isinstance(tree, TreeIndex):
+            tree = TreeIndex(tree)
+        matcher = _with_index(matcher, tree)
+
+    if isinstance(tree, TreeIndex):
+        results = _iter_index(
+            matcher,
+            tree,
+            tree.candidates(pattern),
+            skip_expr,
+            descend_into_matches,
+        )
+    else:
+        results = _iter_tree(matcher, tree, skip_expr, descend_into_matches)
+
+    if limit is not None:
+        results = itertools.islice(results, limit)
+    return cast(Any, results)
+
+
+def explain(pattern: str | nodes.AST, tree: ast.AST | TreeIndex) -> str:
+    """
+    The plan used to find the candidates of `pattern` in an indexed `tree`, and its
+    estimated cost, as `iter_matches` does given a `TreeIndex`.
+    """
+
+    if isinstance(pattern, str):
+        pattern = parse_pattern(pattern)
+    if not isinstance(tree, TreeIndex):
+        tree = TreeIndex(tree)
+    return tree.explain(pattern)
@@ -0,0 +1,186 @@
+"""
+Match many patterns against a node at once.
+
+Patterns are indexed in a discrimination tree. Every pattern is reduced to the tests it
+requires of any matching node, such as the node class at some path or the value of an
+identifier or constant field. Each tree node tests one path and branches on its value.
+Patterns that do not constrain the path are kept on a default branch. A lookup follows
+one value branch plus the default branch at each level, and only the patterns in the
+reached leaves are fully matched.
+"""
+
+from __future__ import annotations
+
+import ast
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Mapping
+
+from . import nodes
+from .analysis import unwrap_pattern
+from .match_pattern import MatchResult, compile_pattern
+from .parse import parse_pattern
+
+type _Path = tuple[str, ...]
+
+_MISSING = object()
+
+
+def _collect_tests(pattern: Any, path: _Path, tests: dict[_Path, Any]) -> None:
+    pattern = unwrap_pattern(pattern)
+    if not isinstance(pattern, nodes.AST) or isinstance(pattern, nodes.Wildcard):
+        return
+    ast_class = ast.__dict__.get(type(pattern).__name__)
+    if ast_class is None:
+        return
+    tests[(*path, "__class__")] = ast_class
+
+    for name, value in pattern.fields:
+        if isinstance(value, list):
+            continue
+        if name in pattern._child_fields:
+            _collect_tests(value, (*path, name), tests)
+            continue
+
+        while isinstance(value, nodes.Capture):
+            value = value.pattern
+        if isinstance(value, nodes.AST):
+            continue
+        try:
+            hash(value)
+        except TypeError:
+            continue
+        tests[(*path, name)] = value
+
+
+def _evaluate(target: Any, path: _Path) -> Any:
+    for name in path:
+        # expression patterns also accept the expression wrapped in an `Expr` statement
+        if isinstance(target, ast.Expr):
+            target = target.value
+        target = getattr(target, name, _MISSING)
+        if target is _MISSING:
+            break
+    return target
+
+
+@dataclass(slots=True)
+class _DiscNode:
+    path: _Path | None = None
+    edges: dict[Any, _DiscNode] = field(default_factory=dict)
+    default: _DiscNode | None = None
+    entries: list[int] = field(default_factory=list)
+
+
+def _build(entries: list[tuple[int, dict[_Path, Any]]]) -> _DiscNode:
+    counts = Counter(path for _, tests in entries for path in tests)
+    if not counts:
+        return _DiscNode(entries=[index for index, _ in entries])
+
+    # the most shared test splits best; shorter paths (e.g. the root class) go first
+    path = max(counts, key=lambda p: (counts[p], -len(p)))
+    branches: dict[Any, list[tuple[int, dict[_Path, Any]]]] = defaultdict(list)
+    rest: list[tuple[int, dict[_Path, Any]]] = []
+    for index, tests in entries:
+        if path in tests:
+            tests = dict(tests)
+            branches[tests.pop(path)].append((index, tests))
+        else:
+            rest.append((index, tests))
+
+    return _DiscNode(
+        path=path,
+        edges={value: _build(branch) for value, branch in branches.items()},
+        default=_build(rest) if rest else None,
+    )
+
+
+class PatternSet[Key]:
+    """
+    A collection of patterns matched together against each node.
+
+    Patterns are stored under a key, which defaults to the pattern itself.
+    """
+
+    def __init__(
+        self, patterns: Iterable[str | nodes.AST] | Mapping[Key, str | nodes.AST] = ()
+    ) -> None:
+        self._keys: list[Key] = []
+        self._patterns: list[nodes.AST] = []
+        self._matchers: list[Callable[[ast.AST], MatchResult | None]] = []
+        self._root: _DiscNode | None = None
+
+        if isinstance(patterns, Mapping):
+            for key, pattern in patterns.items():
+                self.add(pattern, key)
+        else:
+            for pattern in patterns:
+                self.add(pattern)
+
+    def add(self, pattern: str | nodes.AST, key: Key | None = None) -> Key:
+        pattern_node = parse_pattern(pattern) if isinstance(pattern, str) else pattern
+        if key is None:
+            key = pattern  # type: ignore
+        assert key is not None
+
+        self._keys.append(key)
+        self._patterns.append(pattern_node)
+        self._matchers.append(compile_pattern(pattern_node))
+        self._root = None
+        return key
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _get_root(self) -> _DiscNode:
+        if self._root is None:
+            entries: list[tuple[int, dict[_Path, Any]]] = []
+            for index, pattern in enumerate(self._patterns):
+                tests: dict[_Path, Any] = {}
+                _collect_tests(pattern, (), tests)
+                entries.append((index, tests))
+            self._root = _build(entries)
+        return self._root
+
+    def candidates(self, target: ast.AST) -> list[int]:
+        """Indices of the patterns that pass every indexed test, in insertion order."""
+
+        found: list[int] = []
+        stack = [self._get_root()]
+        while stack:
+            disc = stack.pop()
+            found.extend(disc.entries)
+            if disc.path is None:
+                continue
+            if disc.default is not None:
+                stack.append(disc.default)
+
+            if disc.path[-1] == "__class__":
+                node = _evaluate(target, disc.path[:-1])
+                classes = type(node).__mro__
+                if isinstance(node, ast.Expr):
+                    # statement patterns see the wrapper, expression patterns its value
+                    classes += type(node.value).__mro__
+                stack.extend(disc.edges[c] for c in set(classes) if c in disc.edges)
+                continue
+
+            value = _evaluate(target, disc.path)
+            if value is _MISSING:
+                continue
+            try:
+                child = disc.edges.get(value)
+            except TypeError:
+                continue
+            if child is not None:
+                stack.append(child)
+
+        found.sort()
+        return found
+
+    def match(self, target: ast.AST) -> list[tuple[Key, MatchResult]]:
+        results: list[tuple[Key, MatchResult]] = []
+        for index in self.candidates(target):
+            res = self._matchers[index](target)
+            if res is not None:
+                results.append((self._keys[index], res))
+        return results
@@ -0,0 +1,203 @@
+"""
+Rewrite the matches of a pattern in source code.
+
+Each match is replaced by a template, with `$name` and `$0` placeholders filled with the
+source text of the captures. Edits are computed from the node positions, as byte
+offsets into the UTF-8 source, and applied in one pass: the rest of the source, with its
+formatting and comments, is kept verbatim.
+"""
+
+from __future__ import annotations
+
+import ast
+import re
+from bisect import bisect_right
+from typing import Any, Iterable, NamedTuple
+
+from . import nodes
+from .analysis import capture_names, required_tokens
+from .locations import Span, span_of
+from .match_pattern import iter_matches
+from .parse import parse_pattern
+
+# `$$` stands for a literal `$`
+_PLACEHOLDER = re.compile(r"\$(\$|\w+)")
+_NEWLINE = re.compile(rb"\r\n|\r|\n")
+
+# expressions that never need parentheses to keep their meaning next to an operator
+_ATOMS = (
+    ast.Name,
+    ast.Constant,
+    ast.Attribute,
+    ast.Call,
+    ast.Subscript,
+    ast.List,
+    ast.Dict,
+    ast.Set,
+    ast.ListComp,
+    ast.SetComp,
+    ast.DictComp,
+    ast.JoinedStr,
+)
+
+
+class Edit(NamedTuple):
+    # byte offsets into the UTF-8 encoded source
+    start: int
+    end: int
+    text: str
+
+
+class _Source:
+    def __init__(self, data: bytes) -> None:
+        self.data = data
+        self.line_starts = [0]
+        for line in data.splitlines(keepends=True):
+            self.line_starts.append(self.line_starts[-1] + len(line))
+        # line breaks in templates follow the first one of the source
+        newline = _NEWLINE.search(data)
+        self.newline = newline.group().decode() if newline else "\n"
+
+    def offsets(self, span: Span) -> tuple[int, int]:
+        start = self.line_starts[span.lineno - 1] + span.col_offset
+        end = self.line_starts[span.end_lineno - 1] + span.end_col_offset
+        return start, end
+
+    def indent(self, offset: int) -> bytes:
+        line_start = self.line_starts[bisect_right(self.line_starts, offset) - 1]
+        line = self.data[line_start:offset]
+        return line[: len(line) - len(line.lstrip())]
+
+    def text(self, value: Any) -> str:
+        if value is None:
+            return ""
+        if isinstance(value, list) and not value:
+            return ""
+        if not isinstance(value, (ast.AST, list)):
+            # identifiers, and primitive fields such as `MatchSingleton.value`
+            return str(value)
+
+        span = span_of(value)
+        if span is None:
+            return ast.unparse(value) if isinstance(value, ast.AST) else ""
+        start, end = self.offsets(span)
+        return self.data[start:end].decode()
+
+
+def _parse_template(template: str, pattern: nodes.AST) -> list[str | int]:
+    """Split `template` into literal text and capture names, at even and odd indices."""
+
+    names = capture_names(pattern)
+    parts: list[str | int] = [""]
+    for i, part in enumerate(_PLACEHOLDER.split(template.replace("\r\n", "\n"))):
+        if i % 2 == 0 or part == "$":
+            parts[-1] = f"{parts[-1]}{part}"
+            continue
+        name: str | int = int(part) if part.isdigit() else part
+        if name not in names:
+            raise ValueError(
+                f"template refers to ${part}, which the pattern does not capture"
+            )
+        parts.extend((name, ""))
+    return parts
+
+
+def _fill(text: _Source, value: Any, parts: list[str | int], i: int) -> str:
+    """
+    The source text of a capture, parenthesized if it is an expression that could bind
+    differently with the template around it, e.g. `a or b` in `$k in $x`. A capture
+    delimited by brackets, commas or the ends of the template is left as is.
+    """
+
+    filled = text.text(value)
+    if not isinstance(value, ast.expr) or isinstance(value, _ATOMS):
+        return filled
+    before, after = str(parts[i - 1]).rstrip(), str(parts[i + 1]).lstrip()
+    if before[-1:] in ("", "(", "[", "{", ",") and after[:1] in (
+        "",
+        ")",
+        "]",
+        "}",
+        ",",
+    ):
+        return filled
+    return f"({filled})"
+
+
+def rewrite_edits(
+    pattern: str | nodes.AST,
+    template: str,
+    source: str | bytes,
+) -> list[Edit]:
+    """
+    The edits replacing each match of `pattern` in `source` with `template`, in order.
+
+    Matches are found as by `iter_matches`, skipping those inside another match. Edits
+    are sorted by offset, and one overlapping an earlier edit is dropped. Lines after the first in the template are indented like the
+    line the match starts on, and end like the lines of the source.
+    """
+
+    if isinstance(pattern, str):
+        pattern = parse_pattern(pattern)
+    parts = _parse_template(template, pattern)
+    data = source.encode() if isinstance(source, str) else source
+    if not all(token in data for token in required_tokens(pattern)):
+        return []
+
+    text = _Source(data)
+    candidates: list[Edit] = []
+    # in field order, which is not source order for e.g. `IfExp` or decorators
+    for res in iter_matches(pattern, ast.parse(data), descend_into_matches=False):
+        span = span_of(res.node)
+        if span is None:
+            continue
+        start, stop = text.offsets(span)
+        captures: dict[str | int, Any] = dict(enumerate(res.groups))
+        captures.update(res.kw_groups)
+        line_break = text.newline + text.indent(start).decode()
+        replacement = "".join(
+            str(part).replace("\n", line_break)
+            if i % 2 == 0
+            else _fill(text, captures[part], parts, i)
+            for i, part in enumerate(parts)
+        )
+        candidates.append(Edit(start, stop, replacement))
+
+    edits: list[Edit] = []
+    end = 0
+    # the outermost edit goes first among those starting at the same offset
+    for edit in sorted(candidates, key=lambda edit: (edit.start, -edit.end)):
+        # e.g. a match within the span of a node without a position of its own
+        if edit.start >= end:
+            edits.append(edit)
+            end = edit.end
+    return edits
+
+
+def apply_edits(source: str | bytes, edits: Iterable[Edit]) -> str:
+    """Apply non-overlapping edits, sorted by offset, in one pass over `source`."""
+
+    data = source.encode() if isinstance(source, str) else source
+    chunks: list[bytes] = []
+    pos = 0
+    for start, end, text in edits:
+        if start < pos:
+            raise ValueError(f"overlapping edit at byte {start}")
+        chunks.append(data[pos:start])
+        chunks.append(text.encode())
+        pos = end
+    chunks.append(data[pos:])
+    return b"".join(chunks).decode()
+
+
+def rewrite(pattern: str | nodes.AST, template: str, source: str | bytes) -> str:
+    """
+    Replace each match of `pattern` in `source` with `template`, filled with the source
+    text of the captures (`$$` is a literal `$`). Captured expressions are parenthesized where the template could
+    change how they bind:
+
+    >>> rewrite("$x.has_key($k)", "$k in $x", "if d.has_key(key):  # legacy\\n    pass\\n")
+    'if key in d:  # legacy\\n    pass\\n'
+    """
+
+    return apply_edits(source, rewrite_edits(pattern, template, source))
@@ -0,0 +1,80 @@
+"""
+Search files on disk for a pattern.
+"""
+
+from __future__ import annotations
+
+import ast
+import mmap
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterable, Iterator, cast
+
+from . import nodes
+from .analysis import required_tokens
+from .match_pattern import (
+    MATCH_TYPE_HINT_DEFAULT,
+    MatchResult,
+    MatchTypeHint,
+    iter_matches,
+)
+from .parse import parse_pattern
+
+
+@dataclass
+class SearchStats:
+    files: int = 0
+    # never parsed, since their text lacks a token required by the pattern
+    skipped: int = 0
+    parsed: int = 0
+    matches: int = 0
+    errors: list[tuple[Path, SyntaxError]] = field(default_factory=list)
+
+
+def file_contains_all(path: str | os.PathLike[str], tokens: Iterable[bytes]) -> bool:
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return not any(tokens)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as text:
+            return all(text.find(token) != -1 for token in tokens)
+
+
+def search_files[N: ast.AST, *T, K: dict](
+    pattern: str | nodes.AST,
+    paths: Iterable[str | os.PathLike[str]],
+    *,
+    prefilter: bool = True,
+    stats: SearchStats | None = None,
+    match_type_hint: MatchTypeHint[N, *T, K] = MATCH_TYPE_HINT_DEFAULT,
+) -> Iterator[tuple[Path, MatchResult[N, *T, K]]]:
+    """
+    Yield `(path, match)` for every match of `pattern` in the given Python files.
+
+    With `prefilter`, files whose bytes lack an identifier the pattern requires are
+    skipped without being parsed. Pass `stats` to get the counts; files that fail to
+    parse are recorded in `stats.errors`.
+    """
+
+    if isinstance(pattern, str):
+        pattern = parse_pattern(pattern)
+    if stats is None:
+        stats = SearchStats()
+    tokens = required_tokens(pattern) if prefilter else []
+
+    for path in map(Path, paths):
+        stats.files += 1
+        if tokens and not file_contains_all(path, tokens):
+            stats.skipped += 1
+            continue
+
+        try:
+            tree = ast.parse(path.read_bytes(), filename=str(path))
+        except SyntaxError as e:
+            stats.errors.append((path, e))
+            continue
+        stats.parsed += 1
+
+        for res in iter_matches(pattern, tree):
+            stats.matches += 1
+            yield path, cast(Any, res)
@@ -0,0 +1,464 @@
+"""
+XPath-like selectors over ASTs, e.g. `//FunctionDef[decorator_list/Name/@id='property']//Call`.
+
+A selector is a path of steps separated by `/` (children) or `//` (descendants). A step
+names an `ast` class (abstract ones such as `stmt` included), `*` for any node, or a
+field, which selects the nodes stored under that field of the current node: in
+`FunctionDef/decorator_list/Name`, only decorators are tried. Each step may carry
+predicates in brackets:
+
+- `[path]`: some node is reached by the relative `path`
+- `[@attr = 'value']`, `[path/@attr != 1]`: compares a field of the node, or of a node
+  reached by `path` (any one of them); a node-valued field compares by class name
+- `[starts-with(@attr, 'prefix')]`, `[@attr]` (the field is set and non-empty)
+- `and`, `or`, `not(...)` and parentheses
+
+A selector starting with `/` is anchored at the root; otherwise its first step searches
+the whole tree. Inside predicates, paths are relative to the node, `.//` or `//` going
+to its descendants.
+
+Selectors are compiled into a plan over a `TreeIndex`. A descendant step takes the
+positions of its class, or of the identifier it pins, and cuts them down to the preorder
+intervals of the current nodes by bisection, so subtrees are never walked.
+"""
+
+from __future__ import annotations
+
+import ast
+import bisect
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Iterable, Literal, Sequence
+
+from .analysis import IDENTIFIER_FIELDS, RequiredIdentifier
+from .index import TreeIndex
+
+type Axis = Literal["self", "child", "descendant", "descendant-or-self"]
+type Predicate = Exists | Compare | And | Or | Not
+
+_AST_CLASSES: dict[str, type[ast.AST]] = {
+    name: value
+    for name, value in vars(ast).items()
+    if isinstance(value, type) and issubclass(value, ast.AST)
+}
+_FIELDS: frozenset[str] = frozenset(
+    field for cls in _AST_CLASSES.values() for field in cls._fields
+)
+
+_TOKEN = re.compile(
+    r"""\s*(?:
+        (?P<op>//|!=|[/\[\]()=@,*.])
+        |(?P<string>'[^']*'|"[^"]*")
+        |(?P<number>-?\d+(?:\.\d+)?)
+        |(?P<name>[A-Za-z_][\w-]*)
+    )""",
+    re.VERBOSE,
+)
+_LITERALS = {"True": True, "False": False, "None": None}
+_MISSING = object()
+
+
+@dataclass(frozen=True, slots=True)
+class Step:
+    axis: Axis
+    # `None` accepts any node
+    node_class: type[ast.AST] | None = None
+    # only nodes stored under this field of their parent
+    field: str | None = None
+    predicates: tuple[Predicate, ...] = ()
+
+    def accepts(self, index: TreeIndex, position: int) -> bool:
+        if self.node_class is not None and not isinstance(
+            index.nodes[position], self.node_class
+        ):
+            return False
+        if self.field is not None and index.links[position][0] != self.field:
+            return False
+        return all(p.holds(index, position) for p in self.predicates)
+
+    def pinned_identifier(self) -> RequiredIdentifier | None:
+        """The identifier of the node that a predicate pins, usable as an index key."""
+
+        identifier_field = IDENTIFIER_FIELDS.get(self.node_class)  # type: ignore
+        if identifier_field is None:
+            return None
+        for predicate in self.predicates:
+            if (
+                isinstance(predicate, Compare)
+                and not predicate.path
+                and predicate.attr == identifier_field
+                and predicate.op in ("=", "starts-with")
+                and isinstance(predicate.value, str)
+            ):
+                return RequiredIdentifier(
+                    (),
+                    self.node_class,  # type: ignore
+                    predicate.value,
+                    prefix=predicate.op == "starts-with",
+                )
+        return None
+
+
+@dataclass(frozen=True, slots=True)
+class Exists:
+    path: tuple[Step, ...]
+
+    def holds(self, index: TreeIndex, position: int) -> bool:
+        return bool(_run(index, self.path, [position]))
+
+
+@dataclass(frozen=True, slots=True)
+class Compare:
+    # the nodes whose field is compared, relative to the node; `()` is the node itself
+    path: tuple[Step, ...]
+    attr: str
+    op: Literal["=", "!=", "starts-with", "exists"]
+    value: Any = None
+
+    def holds(self, index: TreeIndex, position: int) -> bool:
+        positions = _run(index, self.path, [position]) if self.path else [position]
+        return any(
+            self._test(getattr(index.nodes[p], self.attr, _MISSING)) for p in positions
+        )
+
+    def _test(self, actual: Any) -> bool:
+        if actual is _MISSING:
+            return False
+        if self.op == "exists":
+            return actual is not None and actual != []
+        if self.op == "starts-with":
+            return isinstance(actual, str) and actual.startswith(self.value)
+        if isinstance(actual, ast.AST):
+            # e.g. `@ctx = 'Store'`
+            equal = type(actual).__name__ == self.value
+        else:
+            equal = type(actual) is type(self.value) and actual == self.value
+        return equal == (self.op == "=")
+
+
+@dataclass(frozen=True, slots=True)
+class And:
+    items: tuple[Predicate, ...]
+
+    def holds(self, index: TreeIndex, position: int) -> bool:
+        return all(item.holds(index, position) for item in self.items)
+
+
+@dataclass(frozen=True, slots=True)
+class Or:
+    items: tuple[Predicate, ...]
+
+    def holds(self, index: TreeIndex, position: int) -> bool:
+        return any(item.holds(index, position) for item in self.items)
+
+
+@dataclass(frozen=True, slots=True)
+class Not:
+    item: Predicate
+
+    def holds(self, index: TreeIndex, position: int) -> bool:
+        return not self.item.holds(index, position)
+
+
+# ---------------------------------------------------------------------------- #
+#                                   Execution                                  #
+# ---------------------------------------------------------------------------- #
+
+
+def _candidates(index: TreeIndex, step: Step) -> Sequence[int]:
+    required = step.pinned_identifier()
+    if required is not None:
+        return [
+            p
+            for p in index._postings(required)
+            if isinstance(index.nodes[p], required.node_class)
+        ]
+    if step.node_class is None:
+        return range(len(index.nodes))
+    return index.of_class(step.node_class)
+
+
+def _run_step(index: TreeIndex, step: Step, context: list[int]) -> list[int]:
+    ends = index.ends
+    found: list[int] = []
+
+    if step.axis == "self":
+        found = context
+    elif step.axis == "child":
+        if step.pinned_identifier() is not None:
+            # few candidates: check their parent rather than every child
+            parents = set(context)
+            found = [p for p in _candidates(index, step) if index.parents[p] in parents]
+        else:
+            for position in context:
+                child, end = position + 1, ends[position]
+                while child < end:
+                    found.append(child)
+                    child = ends[child]
+            if len(context) > 1:
+                # children of nested nodes interleave
+                found.sort()
+    else:
+        candidates = _candidates(index, step)
+        inclusive = step.axis == "descendant-or-self"
+        covered = -1
+        # `context` is in preorder, so a node inside the previous interval adds nothing
+        for position in context:
+            if position < covered:
+                continue
+            start = bisect.bisect_left(candidates, position + (not inclusive))
+            stop = bisect.bisect_left(candidates, ends[position], start)
+            found.extend(candidates[start:stop])
+            covered = ends[position]
+
+    return [p for p in found if step.accepts(index, p)]
+
+
+def _run(index: TreeIndex, steps: Iterable[Step], context: list[int]) -> list[int]:
+    for step in steps:
+        if not context:
+            break
+        context = _run_step(index, step, context)
+    return context
+
+
+# ---------------------------------------------------------------------------- #
+#                                    Parsing                                   #
+# ---------------------------------------------------------------------------- #
+
+
+@dataclass(frozen=True, slots=True)
+class _RawStep:
+    axis: Axis
+    # a class or field name, `*` or `.`
+    test: str
+    predicates: tuple[Predicate, ...]
+
+
+class _Parser:
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.tokens: list[tuple[str, str, int]] = []
+        pos = 0
+        while pos < len(text.rstrip()):
+            m = _TOKEN.match(text, pos)
+            if m is None or m.lastgroup is None:
+                raise self.error("invalid token", pos)
+            self.tokens.append(
+                (m.lastgroup, m.group(m.lastgroup), m.start(m.lastgroup))
+            )
+            pos = m.end()
+        self.i = 0
+
+    def error(self, message: str, pos: int | None = None) -> SyntaxError:
+        if pos is None:
+            pos = (
+                self.tokens[self.i][2] if self.i < len(self.tokens) else len(self.text)
+            )
+        return SyntaxError(
+            f"selector: {message}", ("<selector>", 1, pos + 1, self.text)
+        )
+
+    def peek(self, offset: int = 0) -> str | None:
+        i = self.i + offset
+        return self.tokens[i][1] if i < len(self.tokens) else None
+
+    def take(self, kind: str | None = None) -> str:
+        if self.i >= len(self.tokens):
+            raise self.error("unexpected end")
+        token_kind, value, _ = self.tokens[self.i]
+        if kind is not None and token_kind != kind:
+            raise self.error(f"expected {kind}")
+        self.i += 1
+        return value
+
+    def expect(self, value: str) -> None:
+        if self.peek() != value:
+            raise self.error(f"expected {value!r}")
+        self.i += 1
+
+    def selector(self) -> tuple[Step, ...]:
+        if self.peek() == "/":
+            self.i += 1
+            first: Axis = "self"
+        else:
+            if self.peek() == "//":
+                self.i += 1
+            first = "descendant-or-self"
+        steps = self.path(first)
+        if self.i < len(self.tokens):
+            raise self.error("unexpected token")
+        return steps
+
+    def path(self, axis: Axis) -> tuple[Step, ...]:
+        raw = [self.step(axis)]
+        # a trailing `/@attr` belongs to a comparison
+        while self.peek() in ("/", "//") and self.peek(1) != "@":
+            axis = "child" if self.take() == "/" else "descendant"
+            raw.append(self.step(axis))
+        return self.fold(raw)
+
+    def step(self, axis: Axis) -> _RawStep:
+        token = self.peek()
+        if token in ("*", "."):
+            self.i += 1
+        else:
+            token = self.take("name")
+        predicates: list[Predicate] = []
+        while self.peek() == "[":
+            self.i += 1
+            predicates.append(self.or_expr())
+            self.expect("]")
+        return _RawStep(axis, token, tuple(predicates))
+
+    def fold(self, raw: list[_RawStep]) -> tuple[Step, ...]:
+        """Attach each field step to the step naming the nodes it holds."""
+
+        steps: list[Step] = []
+        field: tuple[Axis, str] | None = None
+        for item in raw:
+            if item.test == ".":
+                if item.axis != "child" or item.predicates or field is not None:
+                    raise self.error("`.` is only allowed at the start of a path")
+                steps.append(Step("self"))
+                continue
+
+            node_class = None
+            if item.test != "*":
+                node_class = _AST_CLASSES.get(item.test)
+                if node_class is None:
+                    if item.test not in _FIELDS:
+                        raise self.error(f"unknown class or field {item.test!r}")
+                    if item.predicates:
+                        raise self.error(f"predicates on field {item.test!r}")
+                    if field is not None:
+                        steps.append(Step(field[0], field=field[1]))
+                    field = (item.axis, item.test)
+                    continue
+
+            if field is None:
+                steps.append(Step(item.axis, node_class, predicates=item.predicates))
+            elif item.axis == "child":
+                steps.append(Step(field[0], node_class, field[1], item.predicates))
+            else:
+                steps.append(Step(field[0], field=field[1]))
+                steps.append(
+                    Step("descendant-or-self", node_class, predicates=item.predicates)
+                )
+            field = None
+
+        if field is not None:
+            steps.append(Step(field[0], field=field[1]))
+        return tuple(steps)
+
+    def or_expr(self) -> Predicate:
+        items = [self.and_expr()]
+        while self.peek() == "or":
+            self.i += 1
+            items.append(self.and_expr())
+        return items[0] if len(items) == 1 else Or(tuple(items))
+
+    def and_expr(self) -> Predicate:
+        items = [self.unary()]
+        while self.peek() == "and":
+            self.i += 1
+            items.append(self.unary())
+        return items[0] if len(items) == 1 else And(tuple(items))
+
+    def unary(self) -> Predicate:
+        if self.peek() == "not" and self.peek(1) == "(":
+            self.i += 2
+            item = self.or_expr()
+            self.expect(")")
+            return Not(item)
+        if self.peek() == "(":
+            self.i += 1
+            item = self.or_expr()
+            self.expect(")")
+            return item
+        if self.peek() == "starts-with":
+            self.i += 1
+            self.expect("(")
+            path, attr = self.operand()
+            if attr is None:
+                raise self.error("expected an `@` field")
+            self.expect(",")
+            prefix = self.literal()
+            if not isinstance(prefix, str):
+                raise self.error("expected a string prefix")
+            self.expect(")")
+            return Compare(path, attr, "starts-with", prefix)
+        return self.comparison()
+
+    def comparison(self) -> Predicate:
+        path, attr = self.operand()
+        if attr is None:
+            if self.peek() in ("=", "!="):
+                raise self.error("expected an `@` field to compare")
+            return Exists(path)
+        if self.peek() in ("=", "!="):
+            op = self.take()
+            return Compare(path, attr, op, self.literal())  # type: ignore
+        return Compare(path, attr, "exists")
+
+    def operand(self) -> tuple[tuple[Step, ...], str | None]:
+        path: tuple[Step, ...] = ()
+        if self.peek() != "@":
+            axis: Axis = "child"
+            if self.peek() == "//":
+                self.i += 1
+                axis = "descendant"
+            path = self.path(axis)
+            if self.peek() != "/":
+                return path, None
+            self.i += 1
+        self.expect("@")
+        return path, self.take("name")
+
+    def literal(self) -> Any:
+        kind = self.tokens[self.i][0] if self.i < len(self.tokens) else None
+        value = self.take()
+        if kind == "string":
+            return value[1:-1]
+        if kind == "number":
+            return float(value) if "." in value else int(value)
+        if kind == "name" and value in _LITERALS:
+            return _LITERALS[value]
+        raise self.error("expected a literal", self.tokens[self.i - 1][2])
+
+
+# ---------------------------------------------------------------------------- #
+
+
+class Selector:
+    """A compiled selector; see the module docstring for the syntax."""
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.steps = _Parser(text).selector()
+
+    def __repr__(self) -> str:
+        return f"Selector({self.text!r})"
+
+    def positions(self, index: TreeIndex) -> list[int]:
+        """Preorder positions of the selected nodes in the indexed tree."""
+
+        return _run(index, self.steps, [0])
+
+    def select(self, tree: ast.AST | TreeIndex) -> list[ast.AST]:
+        index = tree if isinstance(tree, TreeIndex) else TreeIndex(tree)
+        return [index.nodes[p] for p in self.positions(index)]
+
+
+@lru_cache(maxsize=256)
+def compile_selector(selector: str) -> Selector:
+    return Selector(selector)
+
+
+def select(selector: str | Selector, tree: ast.AST | TreeIndex) -> list[ast.AST]:
+    """The nodes of `tree` selected by `selector`, in preorder."""
+
+    if isinstance(selector, str):
+        selector = compile_selector(selector)
+    return selector.select(tree)
@@ -0,0 +1,137 @@
+"""
+Matching of list fields whose pattern has `~*`/`~+` among its elements.
+
+The pattern is split at its variadic elements into runs of fixed elements. The first
+and last runs are anchored at the ends of the target list, and every middle run is
+searched for from left to right. A failed placement is memoized, so each run is tried
+at most once per position, with bounds keeping room for what follows.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Callable, Collection, Sequence
+
+from . import nodes
+from .analysis import capture_names, is_variadic
+from .captures import Captures, restore_captures
+
+type ItemMatcher[Item] = Callable[[Item, Any, Captures], bool]
+
+
+@dataclass(frozen=True, slots=True)
+class SequencePattern[Item]:
+    runs: tuple[tuple[Item, ...], ...]
+    # minimal length of the gap between consecutive runs
+    gaps: tuple[int, ...]
+    # room needed from the start of each middle run up to the last run
+    needs: tuple[int, ...]
+    # captures of a failed placement are rolled back, so they cannot be compared
+    # against by backreferences
+    restore: bool = False
+    # a failed placement stays failed, unless it depends on earlier placements
+    memoize: bool = True
+
+    @classmethod
+    def split(
+        cls,
+        items: Sequence[Any],
+        convert: Callable[[Any], Item] = lambda item: item,
+        repeated: Collection[str | int] | None = None,
+    ) -> SequencePattern[Item]:
+        """
+        `repeated` holds the backreferenced capture names of the whole pattern; `None`
+        means unknown, and any capture is assumed to be one.
+        """
+
+        runs: list[list[Item]] = [[]]
+        gaps: list[int] = []
+        after_variadic = False
+        for item in items:
+            if is_variadic(item):
+                if not after_variadic:
+                    gaps.append(0)
+                    runs.append([])
+                gaps[-1] += isinstance(item, nodes.WildcardRepeat1)
+                after_variadic = True
+            else:
+                runs[-1].append(convert(item))
+                after_variadic = False
+
+        needs = [0] * len(runs)
+        for i in range(len(runs) - 2, 0, -1):
+            needs[i] = len(runs[i]) + gaps[i] + needs[i + 1]
+        names = capture_names(list(items))
+        if repeated is None:
+            memoize = not names
+        else:
+            memoize = names.keys().isdisjoint(repeated)
+        return cls(
+            tuple(map(tuple, runs)),
+            tuple(gaps),
+            tuple(needs),
+            restore=bool(names),
+            memoize=memoize,
+        )
+
+    @property
+    def min_length(self) -> int:
+        return sum(map(len, self.runs)) + sum(self.gaps)
+
+    def match(
+        self,
+        targets: Sequence[Any],
+        captures: Captures,
+        match_item: ItemMatcher[Item],
+    ) -> bool:
+        runs, gaps, needs = self.runs, self.gaps, self.needs
+        if not gaps:
+            return len(targets) == len(runs[0]) and _match_run(
+                runs[0], targets, 0, captures, match_item
+            )
+        if len(targets) < self.min_length:
+            return False
+
+        head, tail = runs[0], runs[-1]
+        end = len(targets) - len(tail)
+        if not _match_run(head, targets, 0, captures, match_item):
+            return False
+        if not _match_run(tail, targets, end, captures, match_item):
+            return False
+
+        last = len(runs) - 1
+        failed: set[tuple[int, int]] = set()
+        restore, memoize = self.restore, self.memoize
+
+        def place(i: int, pos: int) -> bool:
+            if i == last:
+                return end - pos >= gaps[-1]
+            run = runs[i]
+            for start in range(pos + gaps[i - 1], end - needs[i] + 1):
+                if (i, start) in failed:
+                    continue
+                saved = captures.copy() if restore else None
+                if _match_run(run, targets, start, captures, match_item) and place(
+                    i + 1, start + len(run)
+                ):
+                    return True
+                if saved is not None:
+                    restore_captures(captures, saved)
+                if memoize:
+                    failed.add((i, start))
+            return False
+
+        return place(1, len(head))
+
+
+def _match_run[Item](
+    run: tuple[Item, ...],
+    targets: Sequence[Any],
+    start: int,
+    captures: Captures,
+    match_item: ItemMatcher[Item],
+) -> bool:
+    for i, item in enumerate(run):
+        if not match_item(item, targets[start + i], captures):
+            return False
+    return True
@@ -1,25 +1,23 @@
-""""""
-
-# Related:
-# - https://github.com/guilatrova/ast_selector
-# - https://github.com/hchasestevens/astpath
-# - https://github.com/user202729/ast-match?tab=readme-ov-file
-# - https://astsearch.readthedocs.io/en/latest/
-# - https://github.com/tcmulcahy/macropy
-
-
-# ? Can we not matching from the root?
-
-# vistor.disable_hooks()
-# pass `set_transformed`, `cancel` etc. to hooks
-# use matched later
-# .match_type() method on @node_context etc.
-# use regex for name 
-# grouped pattern, e.g. $() 
-# use || for union
-# nodes.__all__
-# .groups on `match_all`
-
-# 3. syntax for args; not provided => empty or wildcard? decorators?
-# 4. match_all, instance filter
-# 5. chain
+""""""
+
+# Related:
+# - https://github.com/guilatrova/ast_selector
+# - https://github.com/hchasestevens/astpath
+# - https://github.com/user202729/ast-match?tab=readme-ov-file
+# - https://astsearch.readthedocs.io/en/latest/
+# - https://github.com/tcmulcahy/macropy
+
+
+# ? Can we not matching from the root?
+
+# vistor.disable_hooks()
+# pass `set_transformed`, `cancel` etc. to hooks
+# use matched later
+# .match_type() method on @node_context etc.
+# grouped pattern, e.g. $() 
+# nodes.__all__
+# .groups on `match_all`
+
+# 3. syntax for args; not provided => empty or wildcard? decorators?
+# 4. match_all, instance filter
+# 5. chain
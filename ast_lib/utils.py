@@ -1,42 +1,116 @@
-import ast
-from typing import overload
-
-
-def parse_as_expr(s: str) -> ast.expr:
-    node = ast.parse(s)
-    match node:
-        case ast.Module(body=[ast.Expr(expr)]):
-            return expr
-        case _:
-            raise ValueError(f"Result is not an expression:\n{ast.dump(node)}")
-
-
-@overload
-def parse_as_stmt[T: ast.stmt](s: str, tp: type[T]) -> T: ...
-
-
-@overload
-def parse_as_stmt[T: type[ast.stmt]](s: str) -> ast.stmt: ...
-
-
-def parse_as_stmt[T: ast.stmt](s: str, tp: type[T] = ast.stmt) -> T:  # type: ignore
-    node = ast.parse(s)
-    match node:
-        case ast.Module(body=[ast.stmt() as stmt]):
-            if isinstance(stmt, tp):
-                return stmt
-            raise ValueError(
-                f"Result is not an statement of type {tp}:\n{ast.dump(node)}"
-            )
-        case _:
-            raise ValueError(f"Result is not an statement:\n{ast.dump(node)}")
-
-
-def expand_union(node: ast.expr) -> list[ast.expr]:
-    match node:
-        case ast.BinOp(left=left, right=right):
-            left_list = expand_union(left)
-            right_list = expand_union(right)
-            return left_list + right_list
-        case _:
-            return [node]
+import ast
+import weakref
+from typing import Any, Iterable, MutableMapping, overload
+
+
+def parse_as_expr(s: str) -> ast.expr:
+    node = ast.parse(s)
+    match node:
+        case ast.Module(body=[ast.Expr(expr)]):
+            return expr
+        case _:
+            raise ValueError(f"Result is not an expression:\n{ast.dump(node)}")
+
+
+@overload
+def parse_as_stmt[T: ast.stmt](s: str, tp: type[T]) -> T: ...
+
+
+@overload
+def parse_as_stmt[T: type[ast.stmt]](s: str) -> ast.stmt: ...
+
+
+def parse_as_stmt[T: ast.stmt](s: str, tp: type[T] = ast.stmt) -> T:  # type: ignore
+    node = ast.parse(s)
+    match node:
+        case ast.Module(body=[ast.stmt() as stmt]):
+            if isinstance(stmt, tp):
+                return stmt
+            raise ValueError(
+                f"Result is not an statement of type {tp}:\n{ast.dump(node)}"
+            )
+        case _:
+            raise ValueError(f"Result is not an statement:\n{ast.dump(node)}")
+
+
+def expand_union(node: ast.expr) -> list[ast.expr]:
+    match node:
+        case ast.BinOp(left=left, right=right):
+            left_list = expand_union(left)
+            right_list = expand_union(right)
+            return left_list + right_list
+        case _:
+            return [node]
+
+
+class StructuralHasher:
+    """
+    Hash-cons AST subtrees: structurally equal nodes get the same integer id,
+    ignoring positions (`_attributes`). Ids are memoized per node, so hashing a
+    parent reuses the ids of already hashed children, and only ids from the
+    same hasher are comparable.
+
+    Fields in `ignore_fields` (e.g. `ctx`) are left out of the comparison. With
+    `weak=True`, ids are held in a `WeakKeyDictionary`, so a long-lived hasher does not
+    keep the hashed trees alive.
+    """
+
+    def __init__(
+        self, ignore_fields: Iterable[str] = (), *, weak: bool = False
+    ) -> None:
+        self._ids: MutableMapping[ast.AST, int] = (
+            weakref.WeakKeyDictionary() if weak else {}
+        )
+        self._shapes: dict[tuple[Any, ...], int] = {}
+        self.ignore_fields = frozenset(ignore_fields)
+
+    def __len__(self) -> int:
+        return len(self._shapes)
+
+    def clear(self) -> None:
+        self._ids.clear()
+        self._shapes.clear()
+
+    def _key(self, value: Any) -> Any:
+        if isinstance(value, ast.AST):
+            return self._ids[value]
+        if isinstance(value, list):
+            return (list, tuple(self._key(v) for v in value))
+        # `1`, `1.0` and `True` compare equal, so the type is part of the key
+        return (type(value), value)
+
+    def __call__(self, node: ast.AST) -> int:
+        if (node_id := self._ids.get(node)) is not None:
+            return node_id
+
+        # Post-order with an explicit stack, so deep trees do not hit the recursion limit
+        stack: list[tuple[ast.AST, bool]] = [(node, False)]
+        while stack:
+            cur, expanded = stack.pop()
+            if cur in self._ids:
+                continue
+            if not expanded:
+                stack.append((cur, True))
+                for child in ast.iter_child_nodes(cur):
+                    if child not in self._ids:
+                        stack.append((child, False))
+                continue
+
+            key = (
+                type(cur),
+                tuple(
+                    self._key(getattr(cur, name, None))
+                    for name in cur._fields
+                    if name not in self.ignore_fields
+                ),
+            )
+            self._ids[cur] = self._shapes.setdefault(key, len(self._shapes))
+
+        return self._ids[node]
+
+    def equal(self, a: ast.AST, b: ast.AST) -> bool:
+        return a is b or self(a) == self(b)
+
+
+def structurally_equal(a: ast.AST, b: ast.AST) -> bool:
+    return StructuralHasher().equal(a, b)
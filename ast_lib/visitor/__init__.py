@@ -1,52 +1,76 @@
-from .context import (
-    NodeContextVar,
-    node_context,
-)
-from .core import (
-    BaseNodeVisitor,
-    Hook,
-    HookMode,
-)
-from .exception import (
-    SkipNode,
-)
-from .presets import (
-    ParentMap,
-    PureNodeVisitHook,
-    pure_visit,
-)
-from .reducer import (
-    NodeListCollector,
-    NodeMapCollector,
-    NodeReducer,
-    NodeSetCollector,
-    node_reducer,
-    nodelist_collector,
-    nodemap_collector,
-    nodeset_collector,
-)
-
-__all__ = [
-    # Core visitor
-    "BaseNodeVisitor",
-    "Hook",
-    "HookMode",
-    # Exception
-    "SkipNode",
-    # Context
-    "NodeContextVar",
-    "node_context",
-    # Presets
-    "ParentMap",
-    "PureNodeVisitHook",
-    "pure_visit",
-    # Reducers and collectors
-    "NodeReducer",
-    "NodeListCollector",
-    "NodeMapCollector",
-    "NodeSetCollector",
-    "node_reducer",
-    "nodelist_collector",
-    "nodemap_collector",
-    "nodeset_collector",
-]
+from .context import (
+    NodeContextVar,
+    node_context,
+)
+from .core import (
+    BaseNodeVisitor,
+    Hook,
+    HookMode,
+)
+from .exception import (
+    SkipNode,
+)
+from .presets import (
+    ParentMap,
+    PureNodeVisitHook,
+    SynthesizedAttr,
+    pure_visit,
+    synthesized_attr,
+)
+from .reducer import (
+    DedupGroup,
+    NodeDedupCollector,
+    NodeListCollector,
+    NodeMapCollector,
+    NodeMultiMapCollector,
+    NodeReducer,
+    NodeSetCollector,
+    NodeSinkCollector,
+    NodeSpillCollector,
+    SpillList,
+    node_reducer,
+    nodededup_collector,
+    nodelist_collector,
+    nodemap_collector,
+    nodemultimap_collector,
+    nodeset_collector,
+    nodesink_collector,
+    nodespill_collector,
+)
+
+__all__ = [
+    # Core visitor
+    "BaseNodeVisitor",
+    "Hook",
+    "HookMode",
+    # Exception
+    "SkipNode",
+    # Context
+    "NodeContextVar",
+    "node_context",
+    # Presets
+    "ParentMap",
+    "PureNodeVisitHook",
+    "pure_visit",
+    "SynthesizedAttr",
+    "synthesized_attr",
+    # Reducers and collectors
+    "NodeReducer",
+    "NodeListCollector",
+    "NodeDedupCollector",
+    "DedupGroup",
+    "NodeMapCollector",
+    "NodeMultiMapCollector",
+    "NodeSetCollector",
+    "NodeSinkCollector",
+    "NodeSpillCollector",
+    "SpillList",
+    "node_reducer",
+    "nodelist_collector",
+    "nodededup_collector",
+    "nodemap_collector",
+    "nodemultimap_collector",
+    "nodeset_collector",
+    "nodesink_collector",
+    "nodespill_collector",
+]
@@ -1,256 +1,315 @@
-""""""
-
-# TODO: type stub?
-# TODO: add_visit_hook, node_context, node_collector, pure_visit
-# TODO: partially context, i.e. context for part of children
-# TODO: yield every children
-# TODO: temporarily override visit_XX
-# TODO: default order: before, wrap-enter, after, wrap-exit
-# TODO: name cannot be visit_XX
-# TODO: sibling
-# TODO: per-invoke context
-
-from __future__ import annotations
-
-import ast
-from abc import abstractmethod
-from collections import defaultdict
-from dataclasses import dataclass, field
-from typing import (
-    Any,
-    Callable,
-    ClassVar,
-    ContextManager,
-    Literal,
-    NamedTuple,
-    Protocol,
-    runtime_checkable,
-)
-
-from ..pattern import MatchResult, nodes, parse_pattern
-from .exception import SkipVisit
-
-type HookMode = Literal["before", "after", "wrap"]
-
-
-class HookFunc(Protocol):
-    def __call__(
-        self,
-        instance: ast.NodeVisitor,
-        node: ast.AST,
-        match_result: MatchResult,
-    ) -> Any: ...
-
-
-@dataclass
-class Hook:
-    node_types: tuple[type[ast.AST], ...]
-    mode: HookMode
-    # func: Callable[[ast.NodeVisitor, ast.AST], Any]  # TODO: fix __name__
-    # func: HookFunc
-    func: Callable[[ast.NodeVisitor, ast.AST, MatchResult], Any]
-    #
-    setup: Callable[[ast.NodeVisitor], None] | None = None
-    before: tuple[str, ...] = ()  # TODO: just single `deps`?
-    after: tuple[str, ...] = ()
-    # patterns: list[str] = field(default_factory=list)  # TODO: type hint for decorators
-    pattern: str | None = None  # TODO: type hint for decorators
-    #
-    name: str | None = field(init=False)
-    pattern_node: nodes.AST | None = field(init=False, default=None)
-
-
-# TODO: single or multiple? parent map?
-@runtime_checkable
-class HookProvider(Protocol):
-    @abstractmethod
-    def get_hook(self) -> Hook: ...
-
-
-class HookEvent(NamedTuple):
-    type: Literal["enter", "exit"]
-    name: str
-
-
-def solve_hook_order(hooks: dict[str, Hook]) -> list[HookEvent]:
-    # topological sort
-    # ! 'before' cannot be after 'after', vice versa
-
-    def check_hook_name(name: str) -> None:
-        if name not in hooks:
-            raise ValueError(f"Hook name {name} is not defined")
-
-    def check_valid(cur_name: str, child_name: str) -> None:
-        cur_hook = hooks[cur_name]
-        child_hook = hooks[child_name]
-        if cur_hook.mode == "after" and child_hook.mode == "before":
-            raise ValueError(
-                f"Hook {cur_name} has mode `after` but its child {child_name} has mode `before`"
-            )
-
-    children_map: dict[str, list[str]] = defaultdict(list)
-    for name, hook in hooks.items():
-        for before in hook.before:
-            check_hook_name(before)
-            children_map[name].append(before)
-        for after in hook.after:
-            check_hook_name(after)
-            children_map[after].append(name)
-
-    for name, children in children_map.items():
-        for child in children:
-            check_valid(child, name)
-
-    status_map: dict[str, Literal["white", "gray", "black"]] = {
-        name: "white" for name in hooks
-    }
-    reversed_hooks: list[HookEvent] = []
-
-    def dfs(cur_name: str, path: list[str]) -> None:
-        if status_map[cur_name] == "black":
-            return
-        if status_map[cur_name] == "gray":
-            assert path.count(cur_name) == 1
-            cycle_st = path.index(cur_name)
-            # error_msg = "\n".join(f"{name}->" for name in path[cycle_st:]) + cur_name
-            error_msg = " -> ".join(path[cycle_st:] + [cur_name])
-            raise ValueError(f"Cycle detected in hooks: {cur_name}\n{error_msg}")
-
-        status_map[cur_name] = "gray"
-
-        for child in children_map[cur_name]:
-            dfs(child, path + [cur_name])
-
-        status_map[cur_name] = "black"
-        match hooks[cur_name].mode:
-            case "wrap":
-                reversed_hooks.append(HookEvent(type="exit", name=cur_name))
-                reversed_hooks.append(HookEvent(type="enter", name=cur_name))
-            case "before":
-                reversed_hooks.append(HookEvent(type="enter", name=cur_name))
-            case "after":
-                reversed_hooks.append(HookEvent(type="exit", name=cur_name))
-
-    # if no edges, the order will be preserved
-    for name in reversed(hooks):
-        dfs(name, [])
-
-    # while the returned hooks have `enter` and `exit` interleaved, the order are preserved within each type
-    return reversed_hooks[::-1]
-
-
-# def get_hook_groups(
-#     hook: Hook, node: ast.AST
-# ) -> tuple[tuple[Any, ...], dict[str, Any]] | None:
-#     all_matched = True
-#     groups = []
-#     kw_groups = {}
-#     for pattern in hook.pattern:
-#         # pattern_node = parsed_pattern_cache.get((name, pattern), parse_pattern(pattern))
-#         pattern_node = parse_pattern(pattern)
-#         if not (result := pattern_node.match(node)):
-#             all_matched = False
-#             break
-
-#         groups.extend(result.args)
-#         kw_groups.update(result.kwargs)
-
-#     if not all_matched:
-#         return None
-#     return tuple(groups), kw_groups
-
-
-class BaseNodeVisitor(ast.NodeVisitor):
-    __visit_hook_map__: ClassVar[dict[str, Hook]] = {}
-    __visit_hook_events__: ClassVar[list[HookEvent]] = []
-
-    def __init_subclass__(cls) -> None:
-        # TODO: should this be reversed?
-        hooks_map: dict[str, Hook] = {}
-        for base in cls.__mro__:
-            for obj_name, obj in base.__dict__.items():
-                if isinstance(obj, HookProvider):
-                    hooks_map[obj_name] = obj.get_hook()
-                    hooks_map[obj_name].name = obj_name
-
-        cls.__visit_hook_map__ = hooks_map
-        cls.__visit_hook_events__ = solve_hook_order(hooks_map)
-
-        return super().__init_subclass__()
-
-    def __init__(self) -> None:
-        for hook in self.__visit_hook_map__.values():
-            if hook.setup is not None:
-                hook.setup(self)
-
-    def visit(self, node: ast.AST) -> ast.AST | None:
-        # TODO handle return value
-        # order: before, wrap-enter, wrap-exit, after
-        # called by time added
-
-        visit_events = self.__visit_hook_events__
-        enter_names = [hook.name for hook in visit_events if hook.type == "enter"]
-        exit_names = [hook.name for hook in visit_events if hook.type == "exit"]
-        wrap_contexts: dict[str, ContextManager] = {}
-
-        # parsed_pattern_cache: dict[tuple[str, str], nodes.AST] = {}
-
-        for name in enter_names:
-            hook = self.__visit_hook_map__[name]
-            if not isinstance(node, hook.node_types):
-                continue
-
-            if hook.pattern is None:
-                match_result = MatchResult(node, tuple(), {})
-            else:
-                if hook.pattern_node is None:
-                    hook.pattern_node = parse_pattern(hook.pattern)
-                match_result = hook.pattern_node.match(node)
-            if match_result is None:
-                continue
-
-            try:
-                if hook.mode == "before":
-                    hook.func(self, node, match_result)
-                elif hook.mode == "wrap":
-                    ctx = hook.func(self, node, match_result)
-                    if not isinstance(ctx, ContextManager):
-                        raise ValueError(
-                            f"Hook {hook} with mode 'wrap' must return a context manager"
-                        )
-
-                    ctx.__enter__()
-                    wrap_contexts[name] = ctx
-                else:
-                    raise ValueError(
-                        f"Invalid hook mode for event `enter`: {hook.mode}"
-                    )
-            except SkipVisit as e:
-                # TODO
-                return e.node
-
-        ret = super().visit(node)
-
-        for name in exit_names:
-            hook = self.__visit_hook_map__[name]
-            if not isinstance(node, hook.node_types):
-                continue
-
-            if hook.pattern is None:
-                match_result = MatchResult(node, tuple(), {})
-            else:
-                if hook.pattern_node is None:
-                    hook.pattern_node = parse_pattern(hook.pattern)
-                match_result = hook.pattern_node.match(node)
-            if match_result is None:
-                continue
-
-            if hook.mode == "after":
-                hook.func(self, node, match_result)
-            elif hook.mode == "wrap":
-                ctx = wrap_contexts[name]
-                ctx.__exit__(None, None, None)
-            else:
-                raise ValueError(f"Invalid hook mode for event `exit`: {hook.mode}")
-
-        return ret
+""""""
+
+# TODO: type stub?
+# TODO: add_visit_hook, node_context, node_collector, pure_visit
+# TODO: partially context, i.e. context for part of children
+# TODO: yield every children
+# TODO: temporarily override visit_XX
+# TODO: default order: before, wrap-enter, after, wrap-exit
+# TODO: name cannot be visit_XX
+# TODO: sibling
+# TODO: per-invoke context
+
+from __future__ import annotations
+
+import ast
+from abc import abstractmethod
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    ContextManager,
+    Literal,
+    NamedTuple,
+    Protocol,
+    runtime_checkable,
+)
+
+from ..pattern import MatchResult, TreeIndex, compile_pattern, nodes, parse_pattern
+from ..pattern.analysis import uses_descendants
+from .exception import SkipVisit
+
+type HookMode = Literal["before", "after", "wrap"]
+
+
+class HookFunc(Protocol):
+    def __call__(
+        self,
+        instance: ast.NodeVisitor,
+        node: ast.AST,
+        match_result: MatchResult,
+    ) -> Any: ...
+
+
+@dataclass
+class Hook:
+    node_types: tuple[type[ast.AST], ...]
+    mode: HookMode
+    # func: Callable[[ast.NodeVisitor, ast.AST], Any]  # TODO: fix __name__
+    # func: HookFunc
+    func: Callable[[ast.NodeVisitor, ast.AST, MatchResult], Any]
+    #
+    setup: Callable[[ast.NodeVisitor], None] | None = None
+    # called once when the outermost `visit` call returns
+    teardown: Callable[[ast.NodeVisitor], None] | None = None
+    before: tuple[str, ...] = ()  # TODO: just single `deps`?
+    after: tuple[str, ...] = ()
+    # patterns: list[str] = field(default_factory=list)  # TODO: type hint for decorators
+    pattern: str | None = None  # TODO: type hint for decorators
+    #
+    name: str | None = field(init=False)
+    pattern_node: nodes.AST | None = field(init=False, default=None)
+    # whether the pattern has descendant constraints, checked with a `TreeIndex`
+    uses_index: bool = field(init=False, default=False)
+
+
+# TODO: single or multiple? parent map?
+@runtime_checkable
+class HookProvider(Protocol):
+    @abstractmethod
+    def get_hook(self) -> Hook: ...
+
+
+class HookEvent(NamedTuple):
+    type: Literal["enter", "exit"]
+    name: str
+
+
+def solve_hook_order(hooks: dict[str, Hook]) -> list[HookEvent]:
+    # topological sort
+    # ! 'before' cannot be after 'after', vice versa
+
+    def check_hook_name(name: str) -> None:
+        if name not in hooks:
+            raise ValueError(f"Hook name {name} is not defined")
+
+    def check_valid(cur_name: str, child_name: str) -> None:
+        cur_hook = hooks[cur_name]
+        child_hook = hooks[child_name]
+        if cur_hook.mode == "after" and child_hook.mode == "before":
+            raise ValueError(
+                f"Hook {cur_name} has mode `after` but its child {child_name} has mode `before`"
+            )
+
+    children_map: dict[str, list[str]] = defaultdict(list)
+    for name, hook in hooks.items():
+        for before in hook.before:
+            check_hook_name(before)
+            children_map[name].append(before)
+        for after in hook.after:
+            check_hook_name(after)
+            children_map[after].append(name)
+
+    for name, children in children_map.items():
+        for child in children:
+            check_valid(child, name)
+
+    status_map: dict[str, Literal["white", "gray", "black"]] = {
+        name: "white" for name in hooks
+    }
+    reversed_hooks: list[HookEvent] = []
+
+    def dfs(cur_name: str, path: list[str]) -> None:
+        if status_map[cur_name] == "black":
+            return
+        if status_map[cur_name] == "gray":
+            assert path.count(cur_name) == 1
+            cycle_st = path.index(cur_name)
+            # error_msg = "\n".join(f"{name}->" for name in path[cycle_st:]) + cur_name
+            error_msg = " -> ".join(path[cycle_st:] + [cur_name])
+            raise ValueError(f"Cycle detected in hooks: {cur_name}\n{error_msg}")
+
+        status_map[cur_name] = "gray"
+
+        for child in children_map[cur_name]:
+            dfs(child, path + [cur_name])
+
+        status_map[cur_name] = "black"
+        match hooks[cur_name].mode:
+            case "wrap":
+                reversed_hooks.append(HookEvent(type="exit", name=cur_name))
+                reversed_hooks.append(HookEvent(type="enter", name=cur_name))
+            case "before":
+                reversed_hooks.append(HookEvent(type="enter", name=cur_name))
+            case "after":
+                reversed_hooks.append(HookEvent(type="exit", name=cur_name))
+
+    # if no edges, the order will be preserved
+    for name in reversed(hooks):
+        dfs(name, [])
+
+    # while the returned hooks have `enter` and `exit` interleaved, the order are preserved within each type
+    return reversed_hooks[::-1]
+
+
+# def get_hook_groups(
+#     hook: Hook, node: ast.AST
+# ) -> tuple[tuple[Any, ...], dict[str, Any]] | None:
+#     all_matched = True
+#     groups = []
+#     kw_groups = {}
+#     for pattern in hook.pattern:
+#         # pattern_node = parsed_pattern_cache.get((name, pattern), parse_pattern(pattern))
+#         pattern_node = parse_pattern(pattern)
+#         if not (result := pattern_node.match(node)):
+#             all_matched = False
+#             break
+
+#         groups.extend(result.args)
+#         kw_groups.update(result.kwargs)
+
+#     if not all_matched:
+#         return None
+#     return tuple(groups), kw_groups
+
+
+class BaseNodeVisitor(ast.NodeVisitor):
+    __visit_hook_map__: ClassVar[dict[str, Hook]] = {}
+    __visit_hook_events__: ClassVar[list[HookEvent]] = []
+
+    def __init_subclass__(cls) -> None:
+        # TODO: should this be reversed?
+        hooks_map: dict[str, Hook] = {}
+        for base in cls.__mro__:
+            for obj_name, obj in base.__dict__.items():
+                if isinstance(obj, HookProvider):
+                    hooks_map[obj_name] = obj.get_hook()
+                    hooks_map[obj_name].name = obj_name
+
+        # hooks with the same pattern share its parsed node, and so its matcher
+        pattern_nodes: dict[str, nodes.AST] = {}
+        for hook in hooks_map.values():
+            if hook.pattern is None:
+                continue
+            if hook.pattern not in pattern_nodes:
+                pattern_nodes[hook.pattern] = hook.pattern_node or parse_pattern(
+                    hook.pattern
+                )
+            hook.pattern_node = pattern_nodes[hook.pattern]
+            hook.uses_index = uses_descendants(hook.pattern_node)
+
+        cls.__visit_hook_map__ = hooks_map
+        cls.__visit_hook_events__ = solve_hook_order(hooks_map)
+
+        return super().__init_subclass__()
+
+    def __init__(self) -> None:
+        self._visit_depth = 0
+        # match results of the current traversal, keyed by (matcher, node)
+        self._match_cache: dict[tuple[Callable, ast.AST], MatchResult | None] = {}
+        # the root of the current traversal, indexed on demand
+        self._visit_root: ast.AST | None = None
+        self._tree_index: TreeIndex | None = None
+        for hook in self.__visit_hook_map__.values():
+            if hook.setup is not None:
+                hook.setup(self)
+
+    def visit(self, node: ast.AST) -> ast.AST | None:
+        # `visit` is re-entered for every child, so only the outermost call ends the traversal
+        depth = getattr(self, "_visit_depth", 0)
+        self._visit_depth = depth + 1
+        if depth == 0:
+            self._match_cache = {}
+            self._visit_root, self._tree_index = node, None
+        try:
+            return self._visit_node(node)
+        finally:
+            self._visit_depth = depth
+            if depth == 0:
+                self._match_cache = {}
+                self._visit_root = self._tree_index = None
+                for hook in self.__visit_hook_map__.values():
+                    if hook.teardown is not None:
+                        hook.teardown(self)
+
+    def _match_hook(self, hook: Hook, node: ast.AST) -> MatchResult | None:
+        if hook.pattern is None:
+            return MatchResult(node, tuple(), {})
+        if hook.pattern_node is None:
+            hook.pattern_node = parse_pattern(hook.pattern)
+            hook.uses_index = uses_descendants(hook.pattern_node)
+
+        # hooks with the same pattern share its matcher, and so its cached results
+        matcher = compile_pattern(hook.pattern_node)
+        key = (matcher, node)
+        try:
+            return self._match_cache[key]
+        except KeyError:
+            if hook.uses_index:
+                with self._get_tree_index().active():
+                    match_result = matcher(node)
+            else:
+                match_result = matcher(node)
+            self._match_cache[key] = match_result
+            return match_result
+
+    def _get_tree_index(self) -> TreeIndex:
+        # one index per traversal, so descendant constraints do not walk subtrees again
+        if self._tree_index is None:
+            assert self._visit_root is not None
+            self._tree_index = TreeIndex(self._visit_root)
+        return self._tree_index
+
+    def _visit_node(self, node: ast.AST) -> ast.AST | None:
+        # TODO handle return value
+        # order: before, wrap-enter, wrap-exit, after
+        # called by time added
+
+        visit_events = self.__visit_hook_events__
+        enter_names = [hook.name for hook in visit_events if hook.type == "enter"]
+        exit_names = [hook.name for hook in visit_events if hook.type == "exit"]
+        wrap_contexts: dict[str, ContextManager] = {}
+
+        # parsed_pattern_cache: dict[tuple[str, str], nodes.AST] = {}
+
+        for name in enter_names:
+            hook = self.__visit_hook_map__[name]
+            if not isinstance(node, hook.node_types):
+                continue
+
+            match_result = self._match_hook(hook, node)
+            if match_result is None:
+                continue
+
+            try:
+                if hook.mode == "before":
+                    hook.func(self, node, match_result)
+                elif hook.mode == "wrap":
+                    ctx = hook.func(self, node, match_result)
+                    if not isinstance(ctx, ContextManager):
+                        raise ValueError(
+                            f"Hook {hook} with mode 'wrap' must return a context manager"
+                        )
+
+                    ctx.__enter__()
+                    wrap_contexts[name] = ctx
+                else:
+                    raise ValueError(
+                        f"Invalid hook mode for event `enter`: {hook.mode}"
+                    )
+            except SkipVisit as e:
+                # TODO
+                return e.node
+
+        ret = super().visit(node)
+
+        for name in exit_names:
+            hook = self.__visit_hook_map__[name]
+            if not isinstance(node, hook.node_types):
+                continue
+
+            match_result = self._match_hook(hook, node)
+            if match_result is None:
+                continue
+
+            if hook.mode == "after":
+                hook.func(self, node, match_result)
+            elif hook.mode == "wrap":
+                ctx = wrap_contexts[name]
+                ctx.__exit__(None, None, None)
+            else:
+                raise ValueError(f"Invalid hook mode for event `exit`: {hook.mode}")
+
+        return ret
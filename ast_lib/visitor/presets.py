@@ -1,88 +1,136 @@
-# Synced by scripts/sync_visitor_with_pyi.py with presets.proto.pyi
-# TODO: indent level
-# TODO: qualname
-# TODO: path
-
-from __future__ import annotations
-import ast
-from contextlib import contextmanager
-from typing import Any, Callable
-from ..pattern import MatchResult
-from .core import Hook, HookMode, HookProvider
-from .utils import DescriptorHelper, invoke_callback
-
-type NodeTypes[N] = type[N] | tuple[type[N], ...]
-type VisitHook[VisitorT: ast.NodeVisitor, N: ast.AST] = (
-    Callable[[VisitorT, N], Any] | Callable[[VisitorT, N, MatchResult], Any]
-)
-
-
-class ParentMap(HookProvider, DescriptorHelper):
-    def get_hook(self) -> Hook:
-        def setup(instance: ast.NodeVisitor) -> None:
-            self._set_attr(instance, "current_node", None)
-            self._set_attr(instance, "parent_map", dict())
-
-        @contextmanager
-        def func(instance: ast.NodeVisitor, node: ast.AST, _: MatchResult):
-            prev = self._get_attr(instance, "current_node")
-            self._set_attr(
-                instance,
-                "parent_map",
-                self._get_attr(instance, "parent_map") | {node: prev},
-            )
-            yield
-            self._set_attr(instance, "current_node", node)
-
-        return Hook((ast.AST,), "wrap", func, setup)
-
-    def __get__(
-        self, instance: ast.NodeVisitor, owner: type[ast.NodeVisitor]
-    ) -> dict[ast.AST, ast.AST | None]:
-        return self._get_attr(instance, "parent_map")
-
-
-class PureNodeVisitHook[
-    VisitorT: ast.NodeVisitor,
-    N: ast.AST,
-](HookProvider, DescriptorHelper):
-    def __init__(
-        self,
-        node_types: NodeTypes[N],
-        func: Callable[[VisitorT, N], Any] | Callable[[VisitorT], Any],
-        mode: HookMode = "before",
-        before: tuple[str, ...] = (),
-        after: tuple[str, ...] = (),
-    ):
-        if not isinstance(node_types, tuple):
-            node_types = (node_types,)
-
-        def hook_func(
-            instance: ast.NodeVisitor, node: ast.AST, match_result: MatchResult
-        ):
-            return invoke_callback(func, instance, node, match_result=match_result)
-
-        self.hook = Hook(
-            node_types, mode, hook_func, setup=None, before=before, after=after
-        )
-
-    def get_hook(self) -> Hook:
-        return self.hook
-
-
-# todo: before, after, wrap
-# todo:? match field (create overloads for every ast class)
-
-
-def pure_visit[VisitorT: ast.NodeVisitor, N: ast.AST, *Args, Kwargs: dict](
-    *node_types: type[N],
-    mode: HookMode = "before",
-    before: tuple[str, ...] = (),
-    after: tuple[str, ...] = (),
-) -> Callable[[VisitHook[VisitorT, N]], PureNodeVisitHook[VisitorT, N]]:
-    #
-
-    def wrapper(func: Callable[..., Any]) -> Any:
-        return PureNodeVisitHook(node_types, func, mode, before, after)
-
-    return wrapper
+# Synced by scripts/sync_visitor_with_pyi.py with presets.proto.pyi
+# TODO: indent level
+# TODO: qualname
+# TODO: path
+
+from __future__ import annotations
+import ast
+from contextlib import contextmanager
+from typing import Any, Callable
+from ..pattern import MatchResult
+from .core import Hook, HookMode, HookProvider
+from .utils import DescriptorHelper, invoke_callback
+
+type NodeTypes[N] = type[N] | tuple[type[N], ...]
+type VisitHook[VisitorT: ast.NodeVisitor, N: ast.AST] = (
+    Callable[[VisitorT, N], Any] | Callable[[VisitorT, N, MatchResult], Any]
+)
+type Synthesize[VisitorT: ast.NodeVisitor, T] = (
+    Callable[[ast.AST, list[T]], T]
+    | Callable[[VisitorT, ast.AST, list[T]], T]
+    | Callable[[VisitorT, ast.AST, list[T], MatchResult], T]
+)
+
+
+class ParentMap(HookProvider, DescriptorHelper):
+    def get_hook(self) -> Hook:
+        def setup(instance: ast.NodeVisitor) -> None:
+            self._set_attr(instance, "current_node", None)
+            self._set_attr(instance, "parent_map", dict())
+
+        @contextmanager
+        def func(instance: ast.NodeVisitor, node: ast.AST, _: MatchResult):
+            prev = self._get_attr(instance, "current_node")
+            self._set_attr(
+                instance,
+                "parent_map",
+                self._get_attr(instance, "parent_map") | {node: prev},
+            )
+            yield
+            self._set_attr(instance, "current_node", node)
+
+        return Hook((ast.AST,), "wrap", func, setup)
+
+    def __get__(
+        self, instance: ast.NodeVisitor, owner: type[ast.NodeVisitor]
+    ) -> dict[ast.AST, ast.AST | None]:
+        return self._get_attr(instance, "parent_map")
+
+
+# Bottom-up attribute: `func` receives a node and the values already computed for its
+# children (in `ast.iter_child_nodes` order), all in the same post-order pass.
+# Children skipped by a custom `visit_XXX` that does not recurse contribute nothing.
+class SynthesizedAttr[VisitorT: ast.NodeVisitor, T](HookProvider, DescriptorHelper):
+    def __init__(self, func: Synthesize[VisitorT, T]):
+        self.func = func
+
+    def get_hook(self) -> Hook:
+        def setup(instance: ast.NodeVisitor) -> None:
+            self._set_attr(instance, "table", dict())
+            self._set_attr(instance, "frames", [])
+
+        @contextmanager
+        def func(instance: ast.NodeVisitor, node: ast.AST, match_result: MatchResult):
+            frames: list[list[T]] = self._get_attr(instance, "frames")
+            frames.append([])
+            yield
+            children = frames.pop()
+            value = invoke_callback(
+                self.func, instance, node, children, match_result=match_result
+            )
+            self._get_attr(instance, "table")[node] = value
+            if frames:
+                frames[-1].append(value)
+
+        def teardown(instance: ast.NodeVisitor) -> None:
+            # frames are left over only if the traversal was interrupted
+            self._set_attr(instance, "frames", [])
+
+        return Hook((ast.AST,), "wrap", func, setup, teardown)
+
+    def __get__(
+        self, instance: ast.NodeVisitor, owner: type[ast.NodeVisitor]
+    ) -> dict[ast.AST, T]:
+        return self._get_attr(instance, "table")
+
+
+def synthesized_attr[VisitorT: ast.NodeVisitor, T](
+    func: Synthesize[VisitorT, T],
+) -> SynthesizedAttr[VisitorT, T]:
+    return SynthesizedAttr(func)
+
+
+class PureNodeVisitHook[
+    VisitorT: ast.NodeVisitor,
+    N: ast.AST,
+](HookProvider, DescriptorHelper):
+    def __init__(
+        self,
+        node_types: NodeTypes[N],
+        func: Callable[[VisitorT, N], Any] | Callable[[VisitorT], Any],
+        mode: HookMode = "before",
+        before: tuple[str, ...] = (),
+        after: tuple[str, ...] = (),
+    ):
+        if not isinstance(node_types, tuple):
+            node_types = (node_types,)
+
+        def hook_func(
+            instance: ast.NodeVisitor, node: ast.AST, match_result: MatchResult
+        ):
+            return invoke_callback(func, instance, node, match_result=match_result)
+
+        self.hook = Hook(
+            node_types, mode, hook_func, setup=None, before=before, after=after
+        )
+
+    def get_hook(self) -> Hook:
+        return self.hook
+
+
+# todo: before, after, wrap
+# todo:? match field (create overloads for every ast class)
+
+
+def pure_visit[VisitorT: ast.NodeVisitor, N: ast.AST, *Args, Kwargs: dict](
+    *node_types: type[N],
+    mode: HookMode = "before",
+    before: tuple[str, ...] = (),
+    after: tuple[str, ...] = (),
+) -> Callable[[VisitHook[VisitorT, N]], PureNodeVisitHook[VisitorT, N]]:
+    #
+
+    def wrapper(func: Callable[..., Any]) -> Any:
+        return PureNodeVisitHook(node_types, func, mode, before, after)
+
+    return wrapper
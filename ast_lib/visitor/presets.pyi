@@ -1,41 +1,62 @@
-# Generated by scripts/transform_visitor_pyi.py from presets.proto.pyi
-
-import ast
-from typing import TYPE_CHECKING, Any, Callable
-from .core import Hook, HookMode, HookProvider
-from .utils import DescriptorHelper
-
-if TYPE_CHECKING:
-    from ..pattern import MatchResult
-
-class ParentMap(HookProvider, DescriptorHelper):
-    def get_hook(self) -> Hook: ...
-    def __get__(
-        self, instance: ast.NodeVisitor, owner: type[ast.NodeVisitor]
-    ) -> dict[ast.AST, ast.AST | None]: ...
-
-class PureNodeVisitHook[
-    VisitorT: ast.NodeVisitor,
-    N: ast.AST,
-](HookProvider, DescriptorHelper):
-    def __init__(
-        self,
-        node_types: type[N] | tuple[type[N], ...],
-        func: Callable[[VisitorT, N], Any] | Callable[[VisitorT], Any],
-        mode: HookMode = "before",
-        #
-        before: tuple[str, ...] = (),
-        after: tuple[str, ...] = (),
-    ): ...
-    def get_hook(self) -> Hook: ...
-
-def pure_visit[VisitorT: ast.NodeVisitor, N: ast.AST, *Args, Kwargs: dict](
-    *node_types: type[N],
-    mode: HookMode = "before",
-    #
-    before: tuple[str, ...] = (),
-    after: tuple[str, ...] = (),
-) -> Callable[
-    [Callable[[VisitorT, N], Any] | Callable[[VisitorT, N, MatchResult], Any]],
-    PureNodeVisitHook[VisitorT, N],
-]: ...
+# Generated by scripts/transform_visitor_pyi.py from presets.proto.pyi
+
+import ast
+from typing import TYPE_CHECKING, Any, Callable
+from .core import Hook, HookMode, HookProvider
+from .utils import DescriptorHelper
+
+if TYPE_CHECKING:
+    from ..pattern import MatchResult
+
+class ParentMap(HookProvider, DescriptorHelper):
+    def get_hook(self) -> Hook: ...
+    def __get__(
+        self, instance: ast.NodeVisitor, owner: type[ast.NodeVisitor]
+    ) -> dict[ast.AST, ast.AST | None]: ...
+
+class SynthesizedAttr[
+    VisitorT: ast.NodeVisitor,
+    T,
+](HookProvider, DescriptorHelper):
+    def __init__(
+        self,
+        func: Callable[[ast.AST, list[T]], T]
+        | Callable[[VisitorT, ast.AST, list[T]], T]
+        | Callable[[VisitorT, ast.AST, list[T], MatchResult], T],
+    ): ...
+    def get_hook(self) -> Hook: ...
+    def __get__(
+        self, instance: ast.NodeVisitor, owner: type[ast.NodeVisitor]
+    ) -> dict[ast.AST, T]: ...
+
+def synthesized_attr[VisitorT: ast.NodeVisitor, T](
+    func: Callable[[ast.AST, list[T]], T]
+    | Callable[[VisitorT, ast.AST, list[T]], T]
+    | Callable[[VisitorT, ast.AST, list[T], MatchResult], T],
+) -> SynthesizedAttr[VisitorT, T]: ...
+
+class PureNodeVisitHook[
+    VisitorT: ast.NodeVisitor,
+    N: ast.AST,
+](HookProvider, DescriptorHelper):
+    def __init__(
+        self,
+        node_types: type[N] | tuple[type[N], ...],
+        func: Callable[[VisitorT, N], Any] | Callable[[VisitorT], Any],
+        mode: HookMode = "before",
+        #
+        before: tuple[str, ...] = (),
+        after: tuple[str, ...] = (),
+    ): ...
+    def get_hook(self) -> Hook: ...
+
+def pure_visit[VisitorT: ast.NodeVisitor, N: ast.AST, *Args, Kwargs: dict](
+    *node_types: type[N],
+    mode: HookMode = "before",
+    #
+    before: tuple[str, ...] = (),
+    after: tuple[str, ...] = (),
+) -> Callable[
+    [Callable[[VisitorT, N], Any] | Callable[[VisitorT, N, MatchResult], Any]],
+    PureNodeVisitHook[VisitorT, N],
+]: ...
@@ -1,187 +1,410 @@
-import ast
-from typing import TYPE_CHECKING, Callable, Generator, Literal, TypedDict, Unpack
-
-from .core import Hook, HookProvider
-from .utils import DescriptorHelper
-
-if TYPE_CHECKING:
-    from ..pattern import MatchResult, MatchTypeHint
-
-type ReducerHookMode = Literal["before", "after"]
-
-type NodeTypes[N] = type[N] | tuple[type[N], ...]
-type InitialValue[T] = Callable[[], T] | T
-type GetValue[VisitorT, N: ast.AST, T, *Args, Kwargs: dict] = (
-    Callable[[N], T]
-    | Callable[[VisitorT, N], T]
-    | Callable[[VisitorT, N, MatchResult[N, *Args, Kwargs]], T]
-)
-type Reducer[VisitorT, N: ast.AST, T, *Args, Kwargs: dict] = (
-    Callable[[T, N], T]
-    | Callable[[VisitorT, T, N], T]
-    | Callable[[VisitorT, T, N, MatchResult[N, *Args, Kwargs]], T]
-)  # ? Do we have to use protocol
-
-# [proto] Expand these types in generated .pyi file
-__expand__ = (
-    NodeTypes,
-    InitialValue,
-    GetValue,
-    Reducer,
-)
-
-class PartialReducerOptions[N: ast.AST, *Args, Kwargs: dict](TypedDict, total=False):
-    mode: ReducerHookMode
-    before: tuple[str, ...]
-    pattern: str | None
-    # This is generally not that useful because we have to type hint in decorated function either way
-    match_type_hint: MatchTypeHint[N, *Args, Kwargs]
-
-class ReducerOptions[N: ast.AST, *Args, Kwargs: dict](TypedDict, total=True):
-    mode: ReducerHookMode
-    before: tuple[str, ...]
-    pattern: str | None
-    match_type_hint: MatchTypeHint[N, *Args, Kwargs]
-
-# ------------------------------- Base Reducer ------------------------------- #
-
-class NodeReducer[
-    VisitorT: ast.NodeVisitor,
-    N: ast.AST,
-    T,
-    *Args,
-    Kwargs: dict,
-](HookProvider, DescriptorHelper):
-    def __init__(
-        self,
-        node_types: NodeTypes[N],
-        initial_value: InitialValue[T],
-        reducer: Reducer[VisitorT, N, T, *Args, Kwargs],
-        #
-        **kwargs: Unpack[PartialReducerOptions],
-        #
-        # visitor_type: type[VisitorT] | None = None,  # only used for type hint
-    ): ...
-    def __get__(self, instance: VisitorT, owner: type[VisitorT]) -> T: ...
-    def get_hook(self) -> Hook: ...
-
-def node_reducer[
-    VisitorT: ast.NodeVisitor,
-    N: ast.AST,
-    T,
-    *Args,
-    Kwargs: dict,
-](
-    # This do not need union
-    *node_types: type[N],
-    initial_value: InitialValue[T],
-    #
-    **kwargs: Unpack[PartialReducerOptions],
-    #
-    # return_type: type[T] | None = None,  # only used for type hint
-) -> Callable[
-    [Reducer[VisitorT, N, T, *Args, Kwargs]],
-    NodeReducer[VisitorT, N, T, *Args, Kwargs],
-]: ...
-
-# ----------------------------------- List ----------------------------------- #
-
-class NodeListCollector[
-    VisitorT: ast.NodeVisitor,
-    N: ast.AST,
-    Value,
-    *Args,
-    Kwargs: dict,
-](NodeReducer[VisitorT, N, list[Value], *Args, Kwargs]):
-    def __init__(
-        self,
-        node_types: NodeTypes[N],
-        get_value: GetValue[VisitorT, N, Generator[Value] | Value, *Args, Kwargs],
-        #
-        **kwargs: Unpack[PartialReducerOptions],
-    ): ...
-
-def nodelist_collector[
-    VisitorT: ast.NodeVisitor,
-    N: ast.AST,
-    Value,
-    *Args,
-    Kwargs: dict,
-](
-    *node_types: type[N],
-    #
-    **kwargs: Unpack[PartialReducerOptions],
-) -> Callable[
-    [GetValue[VisitorT, N, Generator[Value] | Value, *Args, Kwargs]],
-    NodeListCollector[VisitorT, N, Value, *Args, Kwargs],
-]: ...
-
-# ------------------------------------ Set ----------------------------------- #
-
-class NodeSetCollector[
-    VisitorT: ast.NodeVisitor,
-    N: ast.AST,
-    Value,
-    *Args,
-    Kwargs: dict,
-](NodeReducer[VisitorT, N, set[Value], *Args, Kwargs]):
-    def __init__(
-        self,
-        node_types: NodeTypes[N],
-        get_value: GetValue[VisitorT, N, Generator[Value] | Value, *Args, Kwargs],
-        #
-        **kwargs: Unpack[PartialReducerOptions],
-    ): ...
-
-def nodeset_collector[
-    VisitorT: ast.NodeVisitor,
-    N: ast.AST,
-    Value,
-    *Args,
-    Kwargs: dict,
-](
-    *node_types: type[N],
-    #
-    **kwargs: Unpack[PartialReducerOptions],
-) -> Callable[
-    [GetValue[VisitorT, N, Generator[Value] | Value, *Args, Kwargs]],
-    NodeSetCollector[VisitorT, N, Value, *Args, Kwargs],
-]: ...
-
-# ------------------------------------ Map ----------------------------------- #
-
-class NodeMapCollector[
-    VisitorT: ast.NodeVisitor,
-    N: ast.AST,
-    Key,
-    Value,
-    *Args,
-    Kwargs: dict,
-](NodeReducer[VisitorT, N, dict[Key, Value], *Args, Kwargs]):
-    def __init__(
-        self,
-        node_types: NodeTypes[N],
-        get_value: GetValue[VisitorT, N, Value, *Args, Kwargs],
-        #
-        get_key: GetValue[VisitorT, N, Key, *Args, Kwargs] = lambda node: node,
-        #
-        **kwargs: Unpack[PartialReducerOptions],
-    ): ...
-
-def nodemap_collector[
-    VisitorT: ast.NodeVisitor,
-    N: ast.AST,
-    Key,
-    Value,
-    *Args,
-    Kwargs: dict,
-](
-    *node_types: type[N],
-    #
-    get_key: GetValue[VisitorT, N, Key, *Args, Kwargs] = lambda node: node,
-    #
-    **kwargs: Unpack[PartialReducerOptions],
-) -> Callable[
-    [GetValue[VisitorT, N, Value, *Args, Kwargs]],
-    NodeMapCollector[VisitorT, N, Key, Value, *Args, Kwargs],
-]: ...
+import ast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Generator,
+    Iterable,
+    Iterator,
+    Literal,
+    Protocol,
+    TypedDict,
+    Unpack,
+    overload,
+)
+
+from .core import Hook, HookProvider
+from .utils import DescriptorHelper
+
+if TYPE_CHECKING:
+    from ..pattern import MatchResult, MatchTypeHint
+
+type ReducerHookMode = Literal["before", "after"]
+
+type NodeTypes[N] = type[N] | tuple[type[N], ...]
+type InitialValue[T] = Callable[[], T] | T
+type GetValue[VisitorT, N: ast.AST, T, *Args, Kwargs: dict] = (
+    Callable[[N], T]
+    | Callable[[VisitorT, N], T]
+    | Callable[[VisitorT, N, MatchResult[N, *Args, Kwargs]], T]
+)
+type Reducer[VisitorT, N: ast.AST, T, *Args, Kwargs: dict] = (
+    Callable[[T, N], T]
+    | Callable[[VisitorT, T, N], T]
+    | Callable[[VisitorT, T, N, MatchResult[N, *Args, Kwargs]], T]
+)  # ? Do we have to use protocol
+
+class SupportsPut[T](Protocol):
+    def put(self, item: T, /) -> Any: ...
+
+class SupportsWrite(Protocol):
+    def write(self, s: str, /) -> Any: ...
+
+type Sink[T] = Callable[[list[T]], Any] | SupportsPut[list[T]] | SupportsWrite
+
+# [proto] Expand these types in generated .pyi file
+__expand__ = (
+    NodeTypes,
+    InitialValue,
+    GetValue,
+    Reducer,
+)
+
+class PartialReducerOptions[N: ast.AST, *Args, Kwargs: dict](TypedDict, total=False):
+    mode: ReducerHookMode
+    before: tuple[str, ...]
+    pattern: str | None
+    # This is generally not that useful because we have to type hint in decorated function either way
+    match_type_hint: MatchTypeHint[N, *Args, Kwargs]
+
+class ReducerOptions[N: ast.AST, *Args, Kwargs: dict](TypedDict, total=True):
+    mode: ReducerHookMode
+    before: tuple[str, ...]
+    pattern: str | None
+    match_type_hint: MatchTypeHint[N, *Args, Kwargs]
+
+# ------------------------------- Base Reducer ------------------------------- #
+
+class NodeReducer[
+    VisitorT: ast.NodeVisitor,
+    N: ast.AST,
+    T,
+    *Args,
+    Kwargs: dict,
+](HookProvider, DescriptorHelper):
+    def __init__(
+        self,
+        node_types: NodeTypes[N],
+        initial_value: InitialValue[T],
+        reducer: Reducer[VisitorT, N, T, *Args, Kwargs],
+        #
+        **kwargs: Unpack[PartialReducerOptions],
+        #
+        # visitor_type: type[VisitorT] | None = None,  # only used for type hint
+    ): ...
+    def __get__(self, instance: VisitorT, owner: type[VisitorT]) -> T: ...
+    def get_hook(self) -> Hook: ...
+
+def node_reducer[
+    VisitorT: ast.NodeVisitor,
+    N: ast.AST,
+    T,
+    *Args,
+    Kwargs: dict,
+](
+    # This do not need union
+    *node_types: type[N],
+    initial_value: InitialValue[T],
+    #
+    **kwargs: Unpack[PartialReducerOptions],
+    #
+    # return_type: type[T] | None = None,  # only used for type hint
+) -> Callable[
+    [Reducer[VisitorT, N, T, *Args, Kwargs]],
+    NodeReducer[VisitorT, N, T, *Args, Kwargs],
+]: ...
+
+# ----------------------------------- List ----------------------------------- #
+
+class NodeListCollector[
+    VisitorT: ast.NodeVisitor,
+    N: ast.AST,
+    Value,
+    *Args,
+    Kwargs: dict,
+](NodeReducer[VisitorT, N, list[Value], *Args, Kwargs]):
+    def __init__(
+        self,
+        node_types: NodeTypes[N],
+        get_value: GetValue[VisitorT, N, Generator[Value] | Value, *Args, Kwargs],
+        #
+        **kwargs: Unpack[PartialReducerOptions],
+    ): ...
+
+def nodelist_collector[
+    VisitorT: ast.NodeVisitor,
+    N: ast.AST,
+    Value,
+    *Args,
+    Kwargs: dict,
+](
+    *node_types: type[N],
+    #
+    **kwargs: Unpack[PartialReducerOptions],
+) -> Callable[
+    [GetValue[VisitorT, N, Generator[Value] | Value, *Args, Kwargs]],
+    NodeListCollector[VisitorT, N, Value, *Args, Kwargs],
+]: ...
+
+# ------------------------------------ Set ----------------------------------- #
+
+class NodeSetCollector[
+    VisitorT: ast.NodeVisitor,
+    N: ast.AST,
+    Value,
+    *Args,
+    Kwargs: dict,
+](NodeReducer[VisitorT, N, set[Value], *Args, Kwargs]):
+    def __init__(
+        self,
+        node_types: NodeTypes[N],
+        get_value: GetValue[VisitorT, N, Generator[Value] | Value, *Args, Kwargs],
+        #
+        **kwargs: Unpack[PartialReducerOptions],
+    ): ...
+
+def nodeset_collector[
+    VisitorT: ast.NodeVisitor,
+    N: ast.AST,
+    Value,
+    *Args,
+    Kwargs: dict,
+](
+    *node_types: type[N],
+    #
+    **kwargs: Unpack[PartialReducerOptions],
+) -> Callable[
+    [GetValue[VisitorT, N, Generator[Value] | Value, *Args, Kwargs]],
+    NodeSetCollector[VisitorT, N, Value, *Args, Kwargs],
+]: ...
+
+# ------------------------------------ Map ----------------------------------- #
+
+class NodeMapCollector[
+    VisitorT: ast.NodeVisitor,
+    N: ast.AST,
+    Key,
+    Value,
+    *Args,
+    Kwargs: dict,
+](NodeReducer[VisitorT, N, dict[Key, Value], *Args, Kwargs]):
+    def __init__(
+        self,
+        node_types: NodeTypes[N],
+        get_value: GetValue[VisitorT, N, Value, *Args, Kwargs],
+        #
+        get_key: GetValue[VisitorT, N, Key, *Args, Kwargs] = lambda node: node,
+        #
+        **kwargs: Unpack[PartialReducerOptions],
+    ): ...
+
+def nodemap_collector[
+    VisitorT: ast.NodeVisitor,
+    N: ast.AST,
+    Key,
+    Value,
+    *Args,
+    Kwargs: dict,
+](
+    *node_types: type[N],
+    #
+    get_key: GetValue[VisitorT, N, Key, *Args, Kwargs] = lambda node: node,
+    #
+    **kwargs: Unpack[PartialReducerOptions],
+) -> Callable[
+    [GetValue[VisitorT, N, Value, *Args, Kwargs]],
+    NodeMapCollector[VisitorT, N, Key, Value, *Args, Kwargs],
+]: ...
+
+# --------------------------------- Multi Map -------------------------------- #
+
+type GroupContainer = Literal["list", "set"]
+
+class NodeMultiMapCollector[
+    VisitorT: ast.NodeVisitor,
+    N: ast.AST,
+    Key,
+    Value,
+    Group: list | set,
+    *Args,
+    Kwargs: dict,
+](NodeReducer[VisitorT, N, dict[Key, Group], *Args, Kwargs]):
+    @overload
+    def __init__(
+        self: NodeMultiMapCollector[  # pyright: ignore
+            VisitorT, N, Key, Value, list[Value], *Args, Kwargs
+        ],
+        node_types: NodeTypes[N],
+        get_value: GetValue[VisitorT, N, Generator[Value] | Value, *Args, Kwargs],
+        #
+        get_key: GetValue[VisitorT, N, Key, *Args, Kwargs] = lambda node: node,
+        container: Literal["list"] = "list",
+        max_per_key: int | None = None,
+        #
+        **kwargs: Unpack[PartialReducerOptions],
+    ): ...
+    @overload
+    def __init__(
+        self: NodeMultiMapCollector[VisitorT, N, Key, Value, set[Value], *Args, Kwargs],  # pyright: ignore
+        node_types: NodeTypes[N],
+        get_value: GetValue[VisitorT, N, Generator[Value] | Value, *Args, Kwargs],
+        #
+        get_key: GetValue[VisitorT, N, Key, *Args, Kwargs] = lambda node: node,
+        *,
+        container: Literal["set"],
+        max_per_key: int | None = None,
+        #
+        **kwargs: Unpack[PartialReducerOptions],
+    ): ...
+
+@overload
+def nodemultimap_collector[
+    VisitorT: ast.NodeVisitor,
+    N: ast.AST,
+    Key,
+    Value,
+    *Args,
+    Kwargs: dict,
+](
+    *node_types: type[N],
+    #
+    get_key: GetValue[VisitorT, N, Key, *Args, Kwargs] = lambda node: node,
+    container: Literal["list"] = "list",
+    max_per_key: int | None = None,
+    #
+    **kwargs: Unpack[PartialReducerOptions],
+) -> Callable[
+    [GetValue[VisitorT, N, Generator[Value] | Value, *Args, Kwargs]],
+    NodeMultiMapCollector[VisitorT, N, Key, Value, list[Value], *Args, Kwargs],
+]: ...
+@overload
+def nodemultimap_collector[
+    VisitorT: ast.NodeVisitor,
+    N: ast.AST,
+    Key,
+    Value,
+    *Args,
+    Kwargs: dict,
+](
+    *node_types: type[N],
+    #
+    get_key: GetValue[VisitorT, N, Key, *Args, Kwargs] = lambda node: node,
+    container: Literal["set"],
+    max_per_key: int | None = None,
+    #
+    **kwargs: Unpack[PartialReducerOptions],
+) -> Callable[
+    [GetValue[VisitorT, N, Generator[Value] | Value, *Args, Kwargs]],
+    NodeMultiMapCollector[VisitorT, N, Key, Value, set[Value], *Args, Kwargs],
+]: ...
+
+# ----------------------------------- Dedup ---------------------------------- #
+
+class DedupGroup[N: ast.AST]:
+    node: N
+    count: int
+    def __init__(self, node: N, count: int = 1): ...
+
+class NodeDedupCollector[
+    VisitorT: ast.NodeVisitor,
+    N: ast.AST,
+    Value: ast.AST,
+    *Args,
+    Kwargs: dict,
+](NodeReducer[VisitorT, N, dict[int, DedupGroup[Value]], *Args, Kwargs]):
+    def __init__(
+        self,
+        node_types: NodeTypes[N],
+        get_value: GetValue[VisitorT, N, Value, *Args, Kwargs] = lambda node: node,
+        #
+        **kwargs: Unpack[PartialReducerOptions],
+    ): ...
+
+def nodededup_collector[
+    VisitorT: ast.NodeVisitor,
+    N: ast.AST,
+    Value: ast.AST,
+    *Args,
+    Kwargs: dict,
+](
+    *node_types: type[N],
+    #
+    **kwargs: Unpack[PartialReducerOptions],
+) -> Callable[
+    [GetValue[VisitorT, N, Value, *Args, Kwargs]],
+    NodeDedupCollector[VisitorT, N, Value, *Args, Kwargs],
+]: ...
+
+# ----------------------------------- Sink ----------------------------------- #
+
+class NodeSinkCollector[
+    VisitorT: ast.NodeVisitor,
+    N: ast.AST,
+    Value,
+    *Args,
+    Kwargs: dict,
+](NodeReducer[VisitorT, N, int, *Args, Kwargs]):
+    def __init__(
+        self,
+        node_types: NodeTypes[N],
+        get_value: GetValue[VisitorT, N, Generator[Value] | Value, *Args, Kwargs],
+        sink: Sink[Value],
+        batch_size: int = 1000,
+        #
+        **kwargs: Unpack[PartialReducerOptions],
+    ): ...
+    def flush(self, instance: VisitorT, partial: bool = True) -> None: ...
+
+def nodesink_collector[
+    VisitorT: ast.NodeVisitor,
+    N: ast.AST,
+    Value,
+    *Args,
+    Kwargs: dict,
+](
+    *node_types: type[N],
+    sink: Sink[Value],
+    batch_size: int = 1000,
+    #
+    **kwargs: Unpack[PartialReducerOptions],
+) -> Callable[
+    [GetValue[VisitorT, N, Generator[Value] | Value, *Args, Kwargs]],
+    NodeSinkCollector[VisitorT, N, Value, *Args, Kwargs],
+]: ...
+
+# ----------------------------------- Spill ---------------------------------- #
+
+class SpillList[T]:
+    threshold: int
+    def __init__(self, threshold: int = 10000): ...
+    def append(self, value: T) -> None: ...
+    def extend(self, values: Iterable[T]) -> None: ...
+    @property
+    def spilled(self) -> int: ...
+    def __len__(self) -> int: ...
+    def __iter__(self) -> Iterator[T]: ...
+    def close(self) -> None: ...
+    def __enter__(self) -> SpillList[T]: ...
+    def __exit__(self, *exc_info: Any) -> None: ...
+
+class NodeSpillCollector[
+    VisitorT: ast.NodeVisitor,
+    N: ast.AST,
+    Value,
+    *Args,
+    Kwargs: dict,
+](NodeReducer[VisitorT, N, SpillList[Value], *Args, Kwargs]):
+    def __init__(
+        self,
+        node_types: NodeTypes[N],
+        get_value: GetValue[VisitorT, N, Generator[Value] | Value, *Args, Kwargs],
+        threshold: int = 10000,
+        #
+        **kwargs: Unpack[PartialReducerOptions],
+    ): ...
+
+def nodespill_collector[
+    VisitorT: ast.NodeVisitor,
+    N: ast.AST,
+    Value,
+    *Args,
+    Kwargs: dict,
+](
+    *node_types: type[N],
+    threshold: int = 10000,
+    #
+    **kwargs: Unpack[PartialReducerOptions],
+) -> Callable[
+    [GetValue[VisitorT, N, Generator[Value] | Value, *Args, Kwargs]],
+    NodeSpillCollector[VisitorT, N, Value, *Args, Kwargs],
+]: ...
@@ -1,321 +1,717 @@
-# Synced by scripts/sync_visitor_with_pyi.py with reducer.proto.pyi
-# TODO: multiple map
-# TODO: return key-value pair in map collector
-# TODO: visitor_type, return_type
-
-from __future__ import annotations
-import ast
-from typing import (
-    TYPE_CHECKING,
-    Any,
-    Callable,
-    Generator,
-    Literal,
-    TypedDict,
-    Unpack,
-    cast,
-)
-from .core import Hook, HookProvider
-from .exception import SkipNode
-from .utils import DescriptorHelper, invoke_callback
-
-if TYPE_CHECKING:
-    from ..pattern import MatchResult, MatchTypeHint
-
-# ---------------------------------------------------------------------------- #
-#                         Types (overlapped with .pyi)                         #
-# ---------------------------------------------------------------------------- #
-
-type ReducerHookMode = Literal["before", "after"]
-type NodeTypes[N] = type[N] | tuple[type[N], ...]
-type InitialValue[T] = Callable[[], T] | T
-type GetValue[VisitorT, N: ast.AST, T, *Args, Kwargs: dict] = (
-    Callable[[N], T]
-    | Callable[[VisitorT, N], T]
-    | Callable[[VisitorT, N, MatchResult[N, *Args, Kwargs]], T]
-)
-type Reducer[VisitorT, N: ast.AST, T, *Args, Kwargs: dict] = (
-    Callable[[T, N], T]
-    | Callable[[VisitorT, T, N], T]
-    | Callable[[VisitorT, T, N, MatchResult[N, *Args, Kwargs]], T]
-)
-
-
-class PartialReducerOptions[
-    N: ast.AST,
-    *Args,
-    Kwargs: dict,
-](TypedDict, total=False):
-    mode: ReducerHookMode
-    before: tuple[str, ...]
-    pattern: str | None
-    match_type_hint: MatchTypeHint[N, *Args, Kwargs]
-
-
-class ReducerOptions[
-    N: ast.AST,
-    *Args,
-    Kwargs: dict,
-](TypedDict, total=True):
-    mode: ReducerHookMode
-    before: tuple[str, ...]
-    pattern: str | None
-    match_type_hint: MatchTypeHint[N, *Args, Kwargs]
-
-
-# ---------------------------------------------------------------------------- #
-#                                Implementation                                #
-# ---------------------------------------------------------------------------- #
-
-_DEFAULT_OPTIONS: ReducerOptions = {
-    "mode": "before",
-    "before": (),
-    "pattern": None,
-    "match_type_hint": cast(Any, None),
-}
-
-# ------------------------------- Base Reducer ------------------------------- #
-
-
-class NodeReducer[
-    VisitorT: ast.NodeVisitor,
-    N: ast.AST,
-    T,
-    *Args,
-    Kwargs: dict,
-](HookProvider, DescriptorHelper):
-    def __init__(
-        self,
-        node_types: NodeTypes[N],
-        initial_value: InitialValue[T],
-        reducer: Reducer[VisitorT, N, T, *Args, Kwargs],
-        **kwargs: Unpack[PartialReducerOptions],
-        #
-        #
-        # visitor_type: type[VisitorT] | None = None,  # only used for type hint
-    ):
-        if not isinstance(node_types, tuple):
-            node_types = (node_types,)
-        self.node_types = node_types
-        self.initial_value = initial_value
-        self.reducer = reducer
-        self.options = kwargs
-
-    def __get__(self, instance: VisitorT, owner: type[VisitorT]) -> T:
-        return self._get_attr(instance, "value")
-
-    def get_hook(self) -> Hook:
-        def setup(instance: ast.NodeVisitor) -> None:
-            value: T
-            if callable(self.initial_value):
-                value = cast(T, self.initial_value())
-            else:
-                value = cast(T, self.initial_value)
-            self._set_attr(instance, "value", value)
-
-        def func(instance: ast.NodeVisitor, node: ast.AST, match_result: MatchResult):
-            prev_value = self._get_attr(instance, "value")
-            try:
-                value = invoke_callback(
-                    self.reducer, instance, prev_value, node, match_result=match_result
-                )
-            except SkipNode:
-                return
-            self._set_attr(instance, "value", value)
-
-        return Hook(
-            self.node_types,
-            self.options.get("mode", _DEFAULT_OPTIONS["mode"]),
-            func,
-            setup=setup,
-            before=self.options.get("before", _DEFAULT_OPTIONS["before"]),
-            pattern=self.options.get("pattern", _DEFAULT_OPTIONS["pattern"]),
-        )
-
-
-def node_reducer[VisitorT: ast.NodeVisitor, N: ast.AST, T, *Args, Kwargs: dict](
-    *node_types: type[N],
-    initial_value: InitialValue[T],
-    **kwargs: Unpack[PartialReducerOptions],
-    # return_type: type[T]
-    # | None = None,  # only used for type hint
-) -> Callable[
-    [Reducer[VisitorT, N, T, *Args, Kwargs]], NodeReducer[VisitorT, N, T, *Args, Kwargs]
-]:
-    def decorator(reducer: Reducer[VisitorT, N, T, *Args, Kwargs]):
-        return NodeReducer[VisitorT, N, T, *Args, Kwargs](
-            node_types, initial_value, reducer, **kwargs
-        )
-
-    return decorator
-
-
-# ----------------------------------- List ----------------------------------- #
-
-
-class NodeListCollector[
-    VisitorT: ast.NodeVisitor,
-    N: ast.AST,
-    Value,
-    *Args,
-    Kwargs: dict,
-](NodeReducer[VisitorT, N, list[Value], *Args, Kwargs]):
-    def __init__(
-        self,
-        node_types: NodeTypes[N],
-        get_value: GetValue[VisitorT, N, Generator[Value] | Value, *Args, Kwargs],
-        **kwargs: Unpack[PartialReducerOptions],
-        #
-    ):
-        def reducer(
-            instance: VisitorT, acc: list[Value], node: N, match_result: MatchResult
-        ) -> list[Value]:
-            value = invoke_callback(
-                get_value, instance, node, match_result=match_result
-            )
-            if isinstance(value, Generator):
-                return acc + list(value)
-            return acc + [value]
-
-        super().__init__(node_types, lambda: list(), reducer, **kwargs)
-
-
-# TODO: add init
-# TODO: can we pass prev_value here?
-# TODO: combine with context
-
-
-def nodelist_collector[
-    VisitorT: ast.NodeVisitor,
-    N: ast.AST,
-    Value,
-    *Args,
-    Kwargs: dict,
-](
-    *node_types: type[N],
-    **kwargs: Unpack[PartialReducerOptions],
-    #
-) -> Callable[
-    [GetValue[VisitorT, N, Generator[Value] | Value, *Args, Kwargs]],
-    NodeListCollector[VisitorT, N, Value, *Args, Kwargs],
-]:
-    def decorator(
-        # TODO
-        get_value: GetValue[VisitorT, N, Value | Generator[Value], *Args, Kwargs],
-    ):
-        return NodeListCollector(node_types, get_value, **kwargs)
-
-    return decorator
-
-
-# ------------------------------------ Set ----------------------------------- #
-
-
-class NodeSetCollector[
-    VisitorT: ast.NodeVisitor,
-    N: ast.AST,
-    Value,
-    *Args,
-    Kwargs: dict,
-](NodeReducer[VisitorT, N, set[Value], *Args, Kwargs]):
-    def __init__(
-        self,
-        node_types: NodeTypes[N],
-        get_value: GetValue[VisitorT, N, Generator[Value] | Value, *Args, Kwargs],
-        **kwargs: Unpack[PartialReducerOptions],
-        #
-    ):
-        def reducer(
-            instance: VisitorT, acc: set[Value], node: N, match_result: MatchResult
-        ) -> set[Value]:
-            value = invoke_callback(
-                get_value, instance, node, match_result=match_result
-            )
-            if isinstance(value, Generator):
-                return acc | set(value)
-            return acc | {value}
-
-        super().__init__(node_types, lambda: set(), reducer, **kwargs)
-
-
-def nodeset_collector[
-    VisitorT: ast.NodeVisitor,
-    N: ast.AST,
-    Value,
-    *Args,
-    Kwargs: dict,
-](
-    *node_types: type[N],
-    **kwargs: Unpack[PartialReducerOptions],
-    #
-) -> Callable[
-    [GetValue[VisitorT, N, Generator[Value] | Value, *Args, Kwargs]],
-    NodeSetCollector[VisitorT, N, Value, *Args, Kwargs],
-]:
-    def decorator(
-        get_value: GetValue[VisitorT, N, Generator[Value] | Value, *Args, Kwargs],
-    ):
-        return NodeSetCollector(node_types, get_value, **kwargs)
-
-    return decorator
-
-
-# ------------------------------------ Map ----------------------------------- #
-
-
-class NodeMapCollector[
-    VisitorT: ast.NodeVisitor,
-    N: ast.AST,
-    Key,
-    Value,
-    *Args,
-    Kwargs: dict,
-](NodeReducer[VisitorT, N, dict[Key, Value], *Args, Kwargs]):
-    def __init__(
-        self,
-        node_types: NodeTypes[N],
-        get_value: GetValue[VisitorT, N, Value, *Args, Kwargs],
-        get_key: GetValue[VisitorT, N, Key, *Args, Kwargs] = lambda node: node,
-        **kwargs: Unpack[PartialReducerOptions],
-        # default_value: Value,
-        #
-        # type: ignore
-        #
-    ):
-        def reducer(
-            instance: VisitorT,
-            acc: dict[Key, Value],
-            node: N,
-            match_result: MatchResult,
-        ) -> dict[Key, Value]:
-            key = invoke_callback(get_key, instance, node, match_result=match_result)
-            value = invoke_callback(
-                get_value, instance, node, match_result=match_result
-            )
-            return acc | {key: value}
-
-        super().__init__(node_types, lambda: dict(), reducer, **kwargs)
-
-
-def nodemap_collector[
-    VisitorT: ast.NodeVisitor,
-    N: ast.AST,
-    Key,
-    Value,
-    *Args,
-    Kwargs: dict,
-](
-    *node_types: type[N],
-    get_key: GetValue[VisitorT, N, Key, *Args, Kwargs] = lambda node: node,
-    **kwargs: Unpack[PartialReducerOptions],
-    #
-    # type: ignore
-    #
-) -> Callable[
-    [GetValue[VisitorT, N, Value, *Args, Kwargs]],
-    NodeMapCollector[VisitorT, N, Key, Value, *Args, Kwargs],
-]:
-    def decorator(get_value: GetValue[VisitorT, N, Value, *Args, Kwargs]):
-        return NodeMapCollector(node_types, get_value, get_key, **kwargs)
-
-    return decorator
+# Synced by scripts/sync_visitor_with_pyi.py with reducer.proto.pyi
+# TODO: return key-value pair in map collector
+# TODO: visitor_type, return_type
+
+from __future__ import annotations
+import ast
+import pickle
+import tempfile
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    IO,
+    Any,
+    Callable,
+    Generator,
+    Iterable,
+    Iterator,
+    Literal,
+    Protocol,
+    TypedDict,
+    Unpack,
+    cast,
+)
+from ..utils import StructuralHasher
+from .core import Hook, HookProvider
+from .exception import SkipNode
+from .utils import DescriptorHelper, invoke_callback
+
+if TYPE_CHECKING:
+    from ..pattern import MatchResult, MatchTypeHint
+
+# ---------------------------------------------------------------------------- #
+#                         Types (overlapped with .pyi)                         #
+# ---------------------------------------------------------------------------- #
+
+type ReducerHookMode = Literal["before", "after"]
+type NodeTypes[N] = type[N] | tuple[type[N], ...]
+type InitialValue[T] = Callable[[], T] | T
+type GetValue[VisitorT, N: ast.AST, T, *Args, Kwargs: dict] = (
+    Callable[[N], T]
+    | Callable[[VisitorT, N], T]
+    | Callable[[VisitorT, N, MatchResult[N, *Args, Kwargs]], T]
+)
+type Reducer[VisitorT, N: ast.AST, T, *Args, Kwargs: dict] = (
+    Callable[[T, N], T]
+    | Callable[[VisitorT, T, N], T]
+    | Callable[[VisitorT, T, N, MatchResult[N, *Args, Kwargs]], T]
+)
+
+
+class SupportsPut[T](Protocol):
+    def put(self, item: T, /) -> Any: ...
+
+
+class SupportsWrite(Protocol):
+    def write(self, s: str, /) -> Any: ...
+
+
+type Sink[T] = Callable[[list[T]], Any] | SupportsPut[list[T]] | SupportsWrite
+
+
+class PartialReducerOptions[
+    N: ast.AST,
+    *Args,
+    Kwargs: dict,
+](TypedDict, total=False):
+    mode: ReducerHookMode
+    before: tuple[str, ...]
+    pattern: str | None
+    match_type_hint: MatchTypeHint[N, *Args, Kwargs]
+
+
+class ReducerOptions[
+    N: ast.AST,
+    *Args,
+    Kwargs: dict,
+](TypedDict, total=True):
+    mode: ReducerHookMode
+    before: tuple[str, ...]
+    pattern: str | None
+    match_type_hint: MatchTypeHint[N, *Args, Kwargs]
+
+
+# ---------------------------------------------------------------------------- #
+#                                Implementation                                #
+# ---------------------------------------------------------------------------- #
+
+_DEFAULT_OPTIONS: ReducerOptions = {
+    "mode": "before",
+    "before": (),
+    "pattern": None,
+    "match_type_hint": cast(Any, None),
+}
+
+# ------------------------------- Base Reducer ------------------------------- #
+
+
+class NodeReducer[
+    VisitorT: ast.NodeVisitor,
+    N: ast.AST,
+    T,
+    *Args,
+    Kwargs: dict,
+](HookProvider, DescriptorHelper):
+    def __init__(
+        self,
+        node_types: NodeTypes[N],
+        initial_value: InitialValue[T],
+        reducer: Reducer[VisitorT, N, T, *Args, Kwargs],
+        **kwargs: Unpack[PartialReducerOptions],
+        #
+        #
+        # visitor_type: type[VisitorT] | None = None,  # only used for type hint
+    ):
+        if not isinstance(node_types, tuple):
+            node_types = (node_types,)
+        self.node_types = node_types
+        self.initial_value = initial_value
+        self.reducer = reducer
+        self.options = kwargs
+
+    def __get__(self, instance: VisitorT, owner: type[VisitorT]) -> T:
+        return self._get_attr(instance, "value")
+
+    def get_hook(self) -> Hook:
+        def setup(instance: ast.NodeVisitor) -> None:
+            value: T
+            if callable(self.initial_value):
+                value = cast(T, self.initial_value())
+            else:
+                value = cast(T, self.initial_value)
+            self._set_attr(instance, "value", value)
+
+        def func(instance: ast.NodeVisitor, node: ast.AST, match_result: MatchResult):
+            prev_value = self._get_attr(instance, "value")
+            try:
+                value = invoke_callback(
+                    self.reducer, instance, prev_value, node, match_result=match_result
+                )
+            except SkipNode:
+                return
+            self._set_attr(instance, "value", value)
+
+        return Hook(
+            self.node_types,
+            self.options.get("mode", _DEFAULT_OPTIONS["mode"]),
+            func,
+            setup=setup,
+            before=self.options.get("before", _DEFAULT_OPTIONS["before"]),
+            pattern=self.options.get("pattern", _DEFAULT_OPTIONS["pattern"]),
+        )
+
+
+def node_reducer[VisitorT: ast.NodeVisitor, N: ast.AST, T, *Args, Kwargs: dict](
+    *node_types: type[N],
+    initial_value: InitialValue[T],
+    **kwargs: Unpack[PartialReducerOptions],
+    # return_type: type[T]
+    # | None = None,  # only used for type hint
+) -> Callable[
+    [Reducer[VisitorT, N, T, *Args, Kwargs]], NodeReducer[VisitorT, N, T, *Args, Kwargs]
+]:
+    def decorator(reducer: Reducer[VisitorT, N, T, *Args, Kwargs]):
+        return NodeReducer[VisitorT, N, T, *Args, Kwargs](
+            node_types, initial_value, reducer, **kwargs
+        )
+
+    return decorator
+
+
+# ----------------------------------- List ----------------------------------- #
+
+
+class NodeListCollector[
+    VisitorT: ast.NodeVisitor,
+    N: ast.AST,
+    Value,
+    *Args,
+    Kwargs: dict,
+](NodeReducer[VisitorT, N, list[Value], *Args, Kwargs]):
+    def __init__(
+        self,
+        node_types: NodeTypes[N],
+        get_value: GetValue[VisitorT, N, Generator[Value] | Value, *Args, Kwargs],
+        **kwargs: Unpack[PartialReducerOptions],
+        #
+    ):
+        def reducer(
+            instance: VisitorT, acc: list[Value], node: N, match_result: MatchResult
+        ) -> list[Value]:
+            value = invoke_callback(
+                get_value, instance, node, match_result=match_result
+            )
+            if isinstance(value, Generator):
+                return acc + list(value)
+            return acc + [value]
+
+        super().__init__(node_types, lambda: list(), reducer, **kwargs)
+
+
+# TODO: add init
+# TODO: can we pass prev_value here?
+# TODO: combine with context
+
+
+def nodelist_collector[
+    VisitorT: ast.NodeVisitor,
+    N: ast.AST,
+    Value,
+    *Args,
+    Kwargs: dict,
+](
+    *node_types: type[N],
+    **kwargs: Unpack[PartialReducerOptions],
+    #
+) -> Callable[
+    [GetValue[VisitorT, N, Generator[Value] | Value, *Args, Kwargs]],
+    NodeListCollector[VisitorT, N, Value, *Args, Kwargs],
+]:
+    def decorator(
+        # TODO
+        get_value: GetValue[VisitorT, N, Value | Generator[Value], *Args, Kwargs],
+    ):
+        return NodeListCollector(node_types, get_value, **kwargs)
+
+    return decorator
+
+
+# ------------------------------------ Set ----------------------------------- #
+
+
+class NodeSetCollector[
+    VisitorT: ast.NodeVisitor,
+    N: ast.AST,
+    Value,
+    *Args,
+    Kwargs: dict,
+](NodeReducer[VisitorT, N, set[Value], *Args, Kwargs]):
+    def __init__(
+        self,
+        node_types: NodeTypes[N],
+        get_value: GetValue[VisitorT, N, Generator[Value] | Value, *Args, Kwargs],
+        **kwargs: Unpack[PartialReducerOptions],
+        #
+    ):
+        def reducer(
+            instance: VisitorT, acc: set[Value], node: N, match_result: MatchResult
+        ) -> set[Value]:
+            value = invoke_callback(
+                get_value, instance, node, match_result=match_result
+            )
+            if isinstance(value, Generator):
+                return acc | set(value)
+            return acc | {value}
+
+        super().__init__(node_types, lambda: set(), reducer, **kwargs)
+
+
+def nodeset_collector[
+    VisitorT: ast.NodeVisitor,
+    N: ast.AST,
+    Value,
+    *Args,
+    Kwargs: dict,
+](
+    *node_types: type[N],
+    **kwargs: Unpack[PartialReducerOptions],
+    #
+) -> Callable[
+    [GetValue[VisitorT, N, Generator[Value] | Value, *Args, Kwargs]],
+    NodeSetCollector[VisitorT, N, Value, *Args, Kwargs],
+]:
+    def decorator(
+        get_value: GetValue[VisitorT, N, Generator[Value] | Value, *Args, Kwargs],
+    ):
+        return NodeSetCollector(node_types, get_value, **kwargs)
+
+    return decorator
+
+
+# ------------------------------------ Map ----------------------------------- #
+
+
+class NodeMapCollector[
+    VisitorT: ast.NodeVisitor,
+    N: ast.AST,
+    Key,
+    Value,
+    *Args,
+    Kwargs: dict,
+](NodeReducer[VisitorT, N, dict[Key, Value], *Args, Kwargs]):
+    def __init__(
+        self,
+        node_types: NodeTypes[N],
+        get_value: GetValue[VisitorT, N, Value, *Args, Kwargs],
+        get_key: GetValue[VisitorT, N, Key, *Args, Kwargs] = lambda node: node,
+        **kwargs: Unpack[PartialReducerOptions],
+        # default_value: Value,
+        #
+        # type: ignore
+        #
+    ):
+        def reducer(
+            instance: VisitorT,
+            acc: dict[Key, Value],
+            node: N,
+            match_result: MatchResult,
+        ) -> dict[Key, Value]:
+            key = invoke_callback(get_key, instance, node, match_result=match_result)
+            value = invoke_callback(
+                get_value, instance, node, match_result=match_result
+            )
+            return acc | {key: value}
+
+        super().__init__(node_types, lambda: dict(), reducer, **kwargs)
+
+
+def nodemap_collector[
+    VisitorT: ast.NodeVisitor,
+    N: ast.AST,
+    Key,
+    Value,
+    *Args,
+    Kwargs: dict,
+](
+    *node_types: type[N],
+    get_key: GetValue[VisitorT, N, Key, *Args, Kwargs] = lambda node: node,
+    **kwargs: Unpack[PartialReducerOptions],
+    #
+    # type: ignore
+    #
+) -> Callable[
+    [GetValue[VisitorT, N, Value, *Args, Kwargs]],
+    NodeMapCollector[VisitorT, N, Key, Value, *Args, Kwargs],
+]:
+    def decorator(get_value: GetValue[VisitorT, N, Value, *Args, Kwargs]):
+        return NodeMapCollector(node_types, get_value, get_key, **kwargs)
+
+    return decorator
+
+
+# --------------------------------- Multi Map -------------------------------- #
+
+type GroupContainer = Literal["list", "set"]
+
+
+class NodeMultiMapCollector[
+    VisitorT: ast.NodeVisitor,
+    N: ast.AST,
+    Key,
+    Value,
+    Group: list | set,
+    *Args,
+    Kwargs: dict,
+](NodeReducer[VisitorT, N, dict[Key, Group], *Args, Kwargs]):
+    def __init__(
+        self,
+        node_types: NodeTypes[N],
+        get_value: GetValue[VisitorT, N, Generator[Value] | Value, *Args, Kwargs],
+        get_key: GetValue[VisitorT, N, Key, *Args, Kwargs] = lambda node: node,
+        container: GroupContainer = "list",
+        max_per_key: int | None = None,
+        **kwargs: Unpack[PartialReducerOptions],
+    ):
+        if container not in ("list", "set"):
+            raise ValueError(f"Invalid container: {container}")
+        is_set = container == "set"
+
+        # Groups are updated in place, unlike the copying collectors above
+        def reducer(
+            instance: VisitorT,
+            acc: dict[Key, Any],
+            node: N,
+            match_result: MatchResult,
+        ) -> dict[Key, Any]:
+            key = invoke_callback(get_key, instance, node, match_result=match_result)
+            value = invoke_callback(
+                get_value, instance, node, match_result=match_result
+            )
+            values = value if isinstance(value, Generator) else (value,)
+
+            group = acc.get(key)
+            if group is None:
+                group = acc[key] = set() if is_set else []
+            add = group.add if is_set else group.append
+            for item in values:
+                if max_per_key is not None and len(group) >= max_per_key:
+                    break
+                add(item)
+            return acc
+
+        super().__init__(node_types, lambda: dict(), reducer, **kwargs)
+
+
+def nodemultimap_collector[
+    VisitorT: ast.NodeVisitor,
+    N: ast.AST,
+    Key,
+    Value,
+    *Args,
+    Kwargs: dict,
+](
+    *node_types: type[N],
+    get_key: GetValue[VisitorT, N, Key, *Args, Kwargs] = lambda node: node,
+    container: GroupContainer = "list",
+    max_per_key: int | None = None,
+    **kwargs: Unpack[PartialReducerOptions],
+) -> Callable[
+    [GetValue[VisitorT, N, Generator[Value] | Value, *Args, Kwargs]],
+    NodeMultiMapCollector[VisitorT, N, Key, Value, Any, *Args, Kwargs],
+]:
+    def decorator(
+        get_value: GetValue[VisitorT, N, Generator[Value] | Value, *Args, Kwargs],
+    ):
+        return NodeMultiMapCollector(
+            node_types, get_value, get_key, container, max_per_key, **kwargs
+        )
+
+    return decorator
+
+
+# ----------------------------------- Dedup ---------------------------------- #
+
+
+@dataclass(slots=True)
+class DedupGroup[N: ast.AST]:
+    node: N
+    count: int = 1
+
+
+# Structurally identical nodes (ignoring positions) are folded into the first one seen.
+# Keys are ids from a per-visitor `StructuralHasher`.
+class NodeDedupCollector[
+    VisitorT: ast.NodeVisitor,
+    N: ast.AST,
+    Value: ast.AST,
+    *Args,
+    Kwargs: dict,
+](NodeReducer[VisitorT, N, dict[int, DedupGroup[Value]], *Args, Kwargs]):
+    def __init__(
+        self,
+        node_types: NodeTypes[N],
+        get_value: GetValue[VisitorT, N, Value, *Args, Kwargs] = lambda node: node,
+        **kwargs: Unpack[PartialReducerOptions],
+    ):
+        def reducer(
+            instance: VisitorT,
+            acc: dict[int, DedupGroup[Value]],
+            node: N,
+            match_result: MatchResult,
+        ) -> dict[int, DedupGroup[Value]]:
+            value = invoke_callback(
+                get_value, instance, node, match_result=match_result
+            )
+            hasher: StructuralHasher = self._get_attr(instance, "hasher")
+            key = hasher(value)
+            if (group := acc.get(key)) is not None:
+                group.count += 1
+            else:
+                acc[key] = DedupGroup(value)
+            return acc
+
+        super().__init__(node_types, lambda: dict(), reducer, **kwargs)
+
+    def get_hook(self) -> Hook:
+        hook = super().get_hook()
+        setup = hook.setup
+        assert setup is not None
+
+        def setup_hasher(instance: ast.NodeVisitor) -> None:
+            setup(instance)
+            self._set_attr(instance, "hasher", StructuralHasher())
+
+        hook.setup = setup_hasher
+        return hook
+
+
+def nodededup_collector[
+    VisitorT: ast.NodeVisitor,
+    N: ast.AST,
+    Value: ast.AST,
+    *Args,
+    Kwargs: dict,
+](
+    *node_types: type[N],
+    **kwargs: Unpack[PartialReducerOptions],
+) -> Callable[
+    [GetValue[VisitorT, N, Value, *Args, Kwargs]],
+    NodeDedupCollector[VisitorT, N, Value, *Args, Kwargs],
+]:
+    def decorator(get_value: GetValue[VisitorT, N, Value, *Args, Kwargs]):
+        return NodeDedupCollector(node_types, get_value, **kwargs)
+
+    return decorator
+
+
+# ----------------------------------- Sink ----------------------------------- #
+
+
+def _make_flush[T](sink: Sink[T]) -> Callable[[list[T]], Any]:
+    if hasattr(sink, "put"):
+        return cast(SupportsPut[list[T]], sink).put
+    if hasattr(sink, "write"):
+        writer = cast(SupportsWrite, sink)
+        return lambda batch: writer.write("".join(f"{value}\n" for value in batch))
+    if callable(sink):
+        return sink
+    raise TypeError(f"Invalid sink: {sink!r}")
+
+
+# Values are pushed to the sink in batches instead of being kept on the visitor;
+# the descriptor holds the number of values produced so far.
+class NodeSinkCollector[
+    VisitorT: ast.NodeVisitor,
+    N: ast.AST,
+    Value,
+    *Args,
+    Kwargs: dict,
+](NodeReducer[VisitorT, N, int, *Args, Kwargs]):
+    def __init__(
+        self,
+        node_types: NodeTypes[N],
+        get_value: GetValue[VisitorT, N, Generator[Value] | Value, *Args, Kwargs],
+        sink: Sink[Value],
+        batch_size: int = 1000,
+        **kwargs: Unpack[PartialReducerOptions],
+    ):
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be positive, got {batch_size}")
+        self.flush_batch = _make_flush(sink)
+        self.batch_size = batch_size
+
+        def reducer(
+            instance: VisitorT, acc: int, node: N, match_result: MatchResult
+        ) -> int:
+            value = invoke_callback(
+                get_value, instance, node, match_result=match_result
+            )
+            values = list(value) if isinstance(value, Generator) else [value]
+            buffer: list[Value] = self._get_attr(instance, "buffer")
+            buffer.extend(values)
+            if len(buffer) >= self.batch_size:
+                self.flush(instance, partial=False)
+            return acc + len(values)
+
+        super().__init__(node_types, 0, reducer, **kwargs)
+
+    def flush(self, instance: VisitorT, partial: bool = True) -> None:
+        buffer: list[Value] = self._get_attr(instance, "buffer")
+        # Batches are sliced out so the sink is free to keep them
+        start = 0
+        while len(buffer) - start >= self.batch_size:
+            self.flush_batch(buffer[start : start + self.batch_size])
+            start += self.batch_size
+        if partial and start < len(buffer):
+            self.flush_batch(buffer[start:])
+            start = len(buffer)
+        self._set_attr(instance, "buffer", buffer[start:])
+
+    def get_hook(self) -> Hook:
+        hook = super().get_hook()
+        setup = hook.setup
+        assert setup is not None
+
+        def setup_buffer(instance: ast.NodeVisitor) -> None:
+            setup(instance)
+            self._set_attr(instance, "buffer", [])
+
+        hook.setup = setup_buffer
+        hook.teardown = lambda instance: self.flush(cast(VisitorT, instance))
+        return hook
+
+
+def nodesink_collector[
+    VisitorT: ast.NodeVisitor,
+    N: ast.AST,
+    Value,
+    *Args,
+    Kwargs: dict,
+](
+    *node_types: type[N],
+    sink: Sink[Value],
+    batch_size: int = 1000,
+    **kwargs: Unpack[PartialReducerOptions],
+) -> Callable[
+    [GetValue[VisitorT, N, Generator[Value] | Value, *Args, Kwargs]],
+    NodeSinkCollector[VisitorT, N, Value, *Args, Kwargs],
+]:
+    def decorator(
+        get_value: GetValue[VisitorT, N, Generator[Value] | Value, *Args, Kwargs],
+    ):
+        return NodeSinkCollector(node_types, get_value, sink, batch_size, **kwargs)
+
+    return decorator
+
+
+# ----------------------------------- Spill ---------------------------------- #
+
+
+class SpillList[T]:
+    """
+    An append-only sequence that keeps at most `threshold` values in memory.
+    Whenever the buffer is full it is pickled as one chunk to a temporary file,
+    and iteration reads the chunks back in order before the in-memory tail.
+    """
+
+    def __init__(self, threshold: int = 10000):
+        if threshold < 1:
+            raise ValueError(f"threshold must be positive, got {threshold}")
+        self.threshold = threshold
+        self._buffer: list[T] = []
+        self._file: IO[bytes] | None = None
+        self._chunk_offsets: list[int] = []
+        self._spilled_len = 0
+
+    def append(self, value: T) -> None:
+        self._buffer.append(value)
+        if len(self._buffer) >= self.threshold:
+            self._spill()
+
+    def extend(self, values: Iterable[T]) -> None:
+        for value in values:
+            self.append(value)
+
+    def _spill(self) -> None:
+        if self._file is None:
+            self._file = tempfile.TemporaryFile()
+        self._file.seek(0, 2)
+        self._chunk_offsets.append(self._file.tell())
+        pickle.dump(self._buffer, self._file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._spilled_len += len(self._buffer)
+        self._buffer = []
+
+    @property
+    def spilled(self) -> int:
+        return len(self._chunk_offsets)
+
+    def __len__(self) -> int:
+        return self._spilled_len + len(self._buffer)
+
+    def __iter__(self) -> Iterator[T]:
+        # Offsets are looked up on every step so values appended meanwhile are not lost
+        i = 0
+        while i < len(self._chunk_offsets):
+            assert self._file is not None
+            self._file.seek(self._chunk_offsets[i])
+            yield from pickle.load(self._file)
+            i += 1
+        yield from self._buffer
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._chunk_offsets = []
+        self._spilled_len = 0
+        self._buffer = []
+
+    def __enter__(self) -> SpillList[T]:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class NodeSpillCollector[
+    VisitorT: ast.NodeVisitor,
+    N: ast.AST,
+    Value,
+    *Args,
+    Kwargs: dict,
+](NodeReducer[VisitorT, N, SpillList[Value], *Args, Kwargs]):
+    def __init__(
+        self,
+        node_types: NodeTypes[N],
+        get_value: GetValue[VisitorT, N, Generator[Value] | Value, *Args, Kwargs],
+        threshold: int = 10000,
+        **kwargs: Unpack[PartialReducerOptions],
+    ):
+        def reducer(
+            instance: VisitorT,
+            acc: SpillList[Value],
+            node: N,
+            match_result: MatchResult,
+        ) -> SpillList[Value]:
+            value = invoke_callback(
+                get_value, instance, node, match_result=match_result
+            )
+            if isinstance(value, Generator):
+                acc.extend(value)
+            else:
+                acc.append(value)
+            return acc
+
+        super().__init__(node_types, lambda: SpillList(threshold), reducer, **kwargs)
+
+
+def nodespill_collector[
+    VisitorT: ast.NodeVisitor,
+    N: ast.AST,
+    Value,
+    *Args,
+    Kwargs: dict,
+](
+    *node_types: type[N],
+    threshold: int = 10000,
+    **kwargs: Unpack[PartialReducerOptions],
+) -> Callable[
+    [GetValue[VisitorT, N, Generator[Value] | Value, *Args, Kwargs]],
+    NodeSpillCollector[VisitorT, N, Value, *Args, Kwargs],
+]:
+    def decorator(
+        get_value: GetValue[VisitorT, N, Generator[Value] | Value, *Args, Kwargs],
+    ):
+        return NodeSpillCollector(node_types, get_value, threshold, **kwargs)
+
+    return decorator
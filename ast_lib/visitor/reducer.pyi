@@ -1,208 +1,499 @@
-# Generated by scripts/transform_visitor_pyi.py from reducer.proto.pyi
-
-import ast
-from typing import TYPE_CHECKING, Callable, Generator, Literal, TypedDict, Unpack
-from .core import Hook, HookProvider
-from .utils import DescriptorHelper
-
-if TYPE_CHECKING:
-    from ..pattern import MatchResult, MatchTypeHint
-type ReducerHookMode = Literal["before", "after"]  # ? Do we have to use protocol
-
-class PartialReducerOptions[
-    N: ast.AST,
-    *Args,
-    Kwargs: dict,
-](TypedDict, total=False):
-    mode: ReducerHookMode
-    before: tuple[str, ...]
-    pattern: str | None
-
-    # This is generally not that useful because we have to type hint in decorated function either way
-
-    match_type_hint: MatchTypeHint[N, *Args, Kwargs]
-
-class ReducerOptions[
-    N: ast.AST,
-    *Args,
-    Kwargs: dict,
-](TypedDict, total=True):
-    mode: ReducerHookMode
-    before: tuple[str, ...]
-    pattern: str | None
-    match_type_hint: MatchTypeHint[N, *Args, Kwargs]
-
-# ------------------------------- Base Reducer ------------------------------- #
-
-class NodeReducer[
-    VisitorT: ast.NodeVisitor,
-    N: ast.AST,
-    T,
-    *Args,
-    Kwargs: dict,
-](HookProvider, DescriptorHelper):
-    def __init__(
-        self,
-        node_types: type[N] | tuple[type[N], ...],
-        initial_value: Callable[[], T] | T,
-        reducer: Callable[[T, N], T]
-        | Callable[[VisitorT, T, N], T]
-        | Callable[[VisitorT, T, N, MatchResult[N, *Args, Kwargs]], T],
-        #
-        **kwargs: Unpack[PartialReducerOptions],
-        #
-        # visitor_type: type[VisitorT] | None = None,  # only used for type hint
-    ): ...
-    def __get__(self, instance: VisitorT, owner: type[VisitorT]) -> T: ...
-    def get_hook(self) -> Hook: ...
-
-def node_reducer[VisitorT: ast.NodeVisitor, N: ast.AST, T, *Args, Kwargs: dict](
-    # This do not need union
-    *node_types: type[N],
-    initial_value: Callable[[], T] | T,
-    #
-    **kwargs: Unpack[PartialReducerOptions],
-    #
-    # return_type: type[T] | None = None,  # only used for type hint
-) -> Callable[
-    [
-        Callable[[T, N], T]
-        | Callable[[VisitorT, T, N], T]
-        | Callable[[VisitorT, T, N, MatchResult[N, *Args, Kwargs]], T]
-    ],
-    NodeReducer[VisitorT, N, T, *Args, Kwargs],
-]: ...
-
-# ----------------------------------- List ----------------------------------- #
-
-class NodeListCollector[
-    VisitorT: ast.NodeVisitor,
-    N: ast.AST,
-    Value,
-    *Args,
-    Kwargs: dict,
-](NodeReducer[VisitorT, N, list[Value], *Args, Kwargs]):
-    def __init__(
-        self,
-        node_types: type[N] | tuple[type[N], ...],
-        get_value: Callable[[N], Generator[Value] | Value]
-        | Callable[[VisitorT, N], Generator[Value] | Value]
-        | Callable[
-            [VisitorT, N, MatchResult[N, *Args, Kwargs]], Generator[Value] | Value
-        ],
-        #
-        **kwargs: Unpack[PartialReducerOptions],
-    ): ...
-
-def nodelist_collector[
-    VisitorT: ast.NodeVisitor,
-    N: ast.AST,
-    Value,
-    *Args,
-    Kwargs: dict,
-](
-    *node_types: type[N],
-    #
-    **kwargs: Unpack[PartialReducerOptions],
-) -> Callable[
-    [
-        Callable[[N], Generator[Value] | Value]
-        | Callable[[VisitorT, N], Generator[Value] | Value]
-        | Callable[
-            [VisitorT, N, MatchResult[N, *Args, Kwargs]], Generator[Value] | Value
-        ]
-    ],
-    NodeListCollector[VisitorT, N, Value, *Args, Kwargs],
-]: ...
-
-# ------------------------------------ Set ----------------------------------- #
-
-class NodeSetCollector[
-    VisitorT: ast.NodeVisitor,
-    N: ast.AST,
-    Value,
-    *Args,
-    Kwargs: dict,
-](NodeReducer[VisitorT, N, set[Value], *Args, Kwargs]):
-    def __init__(
-        self,
-        node_types: type[N] | tuple[type[N], ...],
-        get_value: Callable[[N], Generator[Value] | Value]
-        | Callable[[VisitorT, N], Generator[Value] | Value]
-        | Callable[
-            [VisitorT, N, MatchResult[N, *Args, Kwargs]], Generator[Value] | Value
-        ],
-        #
-        **kwargs: Unpack[PartialReducerOptions],
-    ): ...
-
-def nodeset_collector[
-    VisitorT: ast.NodeVisitor,
-    N: ast.AST,
-    Value,
-    *Args,
-    Kwargs: dict,
-](
-    *node_types: type[N],
-    #
-    **kwargs: Unpack[PartialReducerOptions],
-) -> Callable[
-    [
-        Callable[[N], Generator[Value] | Value]
-        | Callable[[VisitorT, N], Generator[Value] | Value]
-        | Callable[
-            [VisitorT, N, MatchResult[N, *Args, Kwargs]], Generator[Value] | Value
-        ]
-    ],
-    NodeSetCollector[VisitorT, N, Value, *Args, Kwargs],
-]: ...
-
-# ------------------------------------ Map ----------------------------------- #
-
-class NodeMapCollector[
-    VisitorT: ast.NodeVisitor,
-    N: ast.AST,
-    Key,
-    Value,
-    *Args,
-    Kwargs: dict,
-](NodeReducer[VisitorT, N, dict[Key, Value], *Args, Kwargs]):
-    def __init__(
-        self,
-        node_types: type[N] | tuple[type[N], ...],
-        get_value: Callable[[N], Value]
-        | Callable[[VisitorT, N], Value]
-        | Callable[[VisitorT, N, MatchResult[N, *Args, Kwargs]], Value],
-        #
-        get_key: Callable[[N], Key]
-        | Callable[[VisitorT, N], Key]
-        | Callable[
-            [VisitorT, N, MatchResult[N, *Args, Kwargs]], Key
-        ] = lambda node: node,
-        #
-        **kwargs: Unpack[PartialReducerOptions],
-    ): ...
-
-def nodemap_collector[
-    VisitorT: ast.NodeVisitor,
-    N: ast.AST,
-    Key,
-    Value,
-    *Args,
-    Kwargs: dict,
-](
-    *node_types: type[N],
-    #
-    get_key: Callable[[N], Key]
-    | Callable[[VisitorT, N], Key]
-    | Callable[[VisitorT, N, MatchResult[N, *Args, Kwargs]], Key] = lambda node: node,
-    #
-    **kwargs: Unpack[PartialReducerOptions],
-) -> Callable[
-    [
-        Callable[[N], Value]
-        | Callable[[VisitorT, N], Value]
-        | Callable[[VisitorT, N, MatchResult[N, *Args, Kwargs]], Value]
-    ],
-    NodeMapCollector[VisitorT, N, Key, Value, *Args, Kwargs],
-]: ...
+# Generated by scripts/transform_visitor_pyi.py from reducer.proto.pyi
+
+import ast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Generator,
+    Iterable,
+    Iterator,
+    Literal,
+    Protocol,
+    TypedDict,
+    Unpack,
+    overload,
+)
+from .core import Hook, HookProvider
+from .utils import DescriptorHelper
+
+if TYPE_CHECKING:
+    from ..pattern import MatchResult, MatchTypeHint
+type ReducerHookMode = Literal["before", "after"]  # ? Do we have to use protocol
+
+class SupportsPut[
+    T,
+](Protocol):
+    def put(self, item: T, /) -> Any: ...
+
+class SupportsWrite(Protocol):
+    def write(self, s: str, /) -> Any: ...
+
+type Sink[T] = Callable[[list[T]], Any] | SupportsPut[list[T]] | SupportsWrite
+
+class PartialReducerOptions[
+    N: ast.AST,
+    *Args,
+    Kwargs: dict,
+](TypedDict, total=False):
+    mode: ReducerHookMode
+    before: tuple[str, ...]
+    pattern: str | None
+
+    # This is generally not that useful because we have to type hint in decorated function either way
+
+    match_type_hint: MatchTypeHint[N, *Args, Kwargs]
+
+class ReducerOptions[
+    N: ast.AST,
+    *Args,
+    Kwargs: dict,
+](TypedDict, total=True):
+    mode: ReducerHookMode
+    before: tuple[str, ...]
+    pattern: str | None
+    match_type_hint: MatchTypeHint[N, *Args, Kwargs]
+
+# ------------------------------- Base Reducer ------------------------------- #
+
+class NodeReducer[
+    VisitorT: ast.NodeVisitor,
+    N: ast.AST,
+    T,
+    *Args,
+    Kwargs: dict,
+](HookProvider, DescriptorHelper):
+    def __init__(
+        self,
+        node_types: type[N] | tuple[type[N], ...],
+        initial_value: Callable[[], T] | T,
+        reducer: Callable[[T, N], T]
+        | Callable[[VisitorT, T, N], T]
+        | Callable[[VisitorT, T, N, MatchResult[N, *Args, Kwargs]], T],
+        #
+        **kwargs: Unpack[PartialReducerOptions],
+        #
+        # visitor_type: type[VisitorT] | None = None,  # only used for type hint
+    ): ...
+    def __get__(self, instance: VisitorT, owner: type[VisitorT]) -> T: ...
+    def get_hook(self) -> Hook: ...
+
+def node_reducer[VisitorT: ast.NodeVisitor, N: ast.AST, T, *Args, Kwargs: dict](
+    # This do not need union
+    *node_types: type[N],
+    initial_value: Callable[[], T] | T,
+    #
+    **kwargs: Unpack[PartialReducerOptions],
+    #
+    # return_type: type[T] | None = None,  # only used for type hint
+) -> Callable[
+    [
+        Callable[[T, N], T]
+        | Callable[[VisitorT, T, N], T]
+        | Callable[[VisitorT, T, N, MatchResult[N, *Args, Kwargs]], T]
+    ],
+    NodeReducer[VisitorT, N, T, *Args, Kwargs],
+]: ...
+
+# ----------------------------------- List ----------------------------------- #
+
+class NodeListCollector[
+    VisitorT: ast.NodeVisitor,
+    N: ast.AST,
+    Value,
+    *Args,
+    Kwargs: dict,
+](NodeReducer[VisitorT, N, list[Value], *Args, Kwargs]):
+    def __init__(
+        self,
+        node_types: type[N] | tuple[type[N], ...],
+        get_value: Callable[[N], Generator[Value] | Value]
+        | Callable[[VisitorT, N], Generator[Value] | Value]
+        | Callable[
+            [VisitorT, N, MatchResult[N, *Args, Kwargs]], Generator[Value] | Value
+        ],
+        #
+        **kwargs: Unpack[PartialReducerOptions],
+    ): ...
+
+def nodelist_collector[
+    VisitorT: ast.NodeVisitor,
+    N: ast.AST,
+    Value,
+    *Args,
+    Kwargs: dict,
+](
+    *node_types: type[N],
+    #
+    **kwargs: Unpack[PartialReducerOptions],
+) -> Callable[
+    [
+        Callable[[N], Generator[Value] | Value]
+        | Callable[[VisitorT, N], Generator[Value] | Value]
+        | Callable[
+            [VisitorT, N, MatchResult[N, *Args, Kwargs]], Generator[Value] | Value
+        ]
+    ],
+    NodeListCollector[VisitorT, N, Value, *Args, Kwargs],
+]: ...
+
+# ------------------------------------ Set ----------------------------------- #
+
+class NodeSetCollector[
+    VisitorT: ast.NodeVisitor,
+    N: ast.AST,
+    Value,
+    *Args,
+    Kwargs: dict,
+](NodeReducer[VisitorT, N, set[Value], *Args, Kwargs]):
+    def __init__(
+        self,
+        node_types: type[N] | tuple[type[N], ...],
+        get_value: Callable[[N], Generator[Value] | Value]
+        | Callable[[VisitorT, N], Generator[Value] | Value]
+        | Callable[
+            [VisitorT, N, MatchResult[N, *Args, Kwargs]], Generator[Value] | Value
+        ],
+        #
+        **kwargs: Unpack[PartialReducerOptions],
+    ): ...
+
+def nodeset_collector[
+    VisitorT: ast.NodeVisitor,
+    N: ast.AST,
+    Value,
+    *Args,
+    Kwargs: dict,
+](
+    *node_types: type[N],
+    #
+    **kwargs: Unpack[PartialReducerOptions],
+) -> Callable[
+    [
+        Callable[[N], Generator[Value] | Value]
+        | Callable[[VisitorT, N], Generator[Value] | Value]
+        | Callable[
+            [VisitorT, N, MatchResult[N, *Args, Kwargs]], Generator[Value] | Value
+        ]
+    ],
+    NodeSetCollector[VisitorT, N, Value, *Args, Kwargs],
+]: ...
+
+# ------------------------------------ Map ----------------------------------- #
+
+class NodeMapCollector[
+    VisitorT: ast.NodeVisitor,
+    N: ast.AST,
+    Key,
+    Value,
+    *Args,
+    Kwargs: dict,
+](NodeReducer[VisitorT, N, dict[Key, Value], *Args, Kwargs]):
+    def __init__(
+        self,
+        node_types: type[N] | tuple[type[N], ...],
+        get_value: Callable[[N], Value]
+        | Callable[[VisitorT, N], Value]
+        | Callable[[VisitorT, N, MatchResult[N, *Args, Kwargs]], Value],
+        #
+        get_key: Callable[[N], Key]
+        | Callable[[VisitorT, N], Key]
+        | Callable[
+            [VisitorT, N, MatchResult[N, *Args, Kwargs]], Key
+        ] = lambda node: node,
+        #
+        **kwargs: Unpack[PartialReducerOptions],
+    ): ...
+
+def nodemap_collector[
+    VisitorT: ast.NodeVisitor,
+    N: ast.AST,
+    Key,
+    Value,
+    *Args,
+    Kwargs: dict,
+](
+    *node_types: type[N],
+    #
+    get_key: Callable[[N], Key]
+    | Callable[[VisitorT, N], Key]
+    | Callable[[VisitorT, N, MatchResult[N, *Args, Kwargs]], Key] = lambda node: node,
+    #
+    **kwargs: Unpack[PartialReducerOptions],
+) -> Callable[
+    [
+        Callable[[N], Value]
+        | Callable[[VisitorT, N], Value]
+        | Callable[[VisitorT, N, MatchResult[N, *Args, Kwargs]], Value]
+    ],
+    NodeMapCollector[VisitorT, N, Key, Value, *Args, Kwargs],
+]: ...
+
+# --------------------------------- Multi Map -------------------------------- #
+
+type GroupContainer = Literal["list", "set"]
+
+class NodeMultiMapCollector[
+    VisitorT: ast.NodeVisitor,
+    N: ast.AST,
+    Key,
+    Value,
+    Group: list | set,
+    *Args,
+    Kwargs: dict,
+](NodeReducer[VisitorT, N, dict[Key, Group], *Args, Kwargs]):
+    @overload
+    def __init__(
+        self: NodeMultiMapCollector[
+            VisitorT, N, Key, Value, list[Value], *Args, Kwargs
+        ],  # pyright: ignore
+        node_types: type[N] | tuple[type[N], ...],
+        get_value: Callable[[N], Generator[Value] | Value]
+        | Callable[[VisitorT, N], Generator[Value] | Value]
+        | Callable[
+            [VisitorT, N, MatchResult[N, *Args, Kwargs]], Generator[Value] | Value
+        ],
+        #
+        get_key: Callable[[N], Key]
+        | Callable[[VisitorT, N], Key]
+        | Callable[
+            [VisitorT, N, MatchResult[N, *Args, Kwargs]], Key
+        ] = lambda node: node,
+        container: Literal["list"] = "list",
+        max_per_key: int | None = None,
+        #
+        **kwargs: Unpack[PartialReducerOptions],
+    ): ...
+    @overload
+    def __init__(
+        self: NodeMultiMapCollector[VisitorT, N, Key, Value, set[Value], *Args, Kwargs],  # pyright: ignore
+        node_types: type[N] | tuple[type[N], ...],
+        get_value: Callable[[N], Generator[Value] | Value]
+        | Callable[[VisitorT, N], Generator[Value] | Value]
+        | Callable[
+            [VisitorT, N, MatchResult[N, *Args, Kwargs]], Generator[Value] | Value
+        ],
+        #
+        get_key: Callable[[N], Key]
+        | Callable[[VisitorT, N], Key]
+        | Callable[
+            [VisitorT, N, MatchResult[N, *Args, Kwargs]], Key
+        ] = lambda node: node,
+        *,
+        container: Literal["set"],
+        max_per_key: int | None = None,
+        #
+        **kwargs: Unpack[PartialReducerOptions],
+    ): ...
+
+@overload
+def nodemultimap_collector[
+    VisitorT: ast.NodeVisitor,
+    N: ast.AST,
+    Key,
+    Value,
+    *Args,
+    Kwargs: dict,
+](
+    *node_types: type[N],
+    #
+    get_key: Callable[[N], Key]
+    | Callable[[VisitorT, N], Key]
+    | Callable[[VisitorT, N, MatchResult[N, *Args, Kwargs]], Key] = lambda node: node,
+    container: Literal["list"] = "list",
+    max_per_key: int | None = None,
+    #
+    **kwargs: Unpack[PartialReducerOptions],
+) -> Callable[
+    [
+        Callable[[N], Generator[Value] | Value]
+        | Callable[[VisitorT, N], Generator[Value] | Value]
+        | Callable[
+            [VisitorT, N, MatchResult[N, *Args, Kwargs]], Generator[Value] | Value
+        ]
+    ],
+    NodeMultiMapCollector[VisitorT, N, Key, Value, list[Value], *Args, Kwargs],
+]: ...
+@overload
+def nodemultimap_collector[
+    VisitorT: ast.NodeVisitor,
+    N: ast.AST,
+    Key,
+    Value,
+    *Args,
+    Kwargs: dict,
+](
+    *node_types: type[N],
+    #
+    get_key: Callable[[N], Key]
+    | Callable[[VisitorT, N], Key]
+    | Callable[[VisitorT, N, MatchResult[N, *Args, Kwargs]], Key] = lambda node: node,
+    container: Literal["set"],
+    max_per_key: int | None = None,
+    #
+    **kwargs: Unpack[PartialReducerOptions],
+) -> Callable[
+    [
+        Callable[[N], Generator[Value] | Value]
+        | Callable[[VisitorT, N], Generator[Value] | Value]
+        | Callable[
+            [VisitorT, N, MatchResult[N, *Args, Kwargs]], Generator[Value] | Value
+        ]
+    ],
+    NodeMultiMapCollector[VisitorT, N, Key, Value, set[Value], *Args, Kwargs],
+]: ...
+
+# ----------------------------------- Dedup ---------------------------------- #
+
+class DedupGroup[
+    N: ast.AST,
+]:
+    node: N
+    count: int
+
+    def __init__(self, node: N, count: int = 1): ...
+
+class NodeDedupCollector[
+    VisitorT: ast.NodeVisitor,
+    N: ast.AST,
+    Value: ast.AST,
+    *Args,
+    Kwargs: dict,
+](NodeReducer[VisitorT, N, dict[int, DedupGroup[Value]], *Args, Kwargs]):
+    def __init__(
+        self,
+        node_types: type[N] | tuple[type[N], ...],
+        get_value: Callable[[N], Value]
+        | Callable[[VisitorT, N], Value]
+        | Callable[[VisitorT, N, MatchResult[N, *Args, Kwargs]], Value] = lambda node: (
+            node
+        ),
+        #
+        **kwargs: Unpack[PartialReducerOptions],
+    ): ...
+
+def nodededup_collector[
+    VisitorT: ast.NodeVisitor,
+    N: ast.AST,
+    Value: ast.AST,
+    *Args,
+    Kwargs: dict,
+](
+    *node_types: type[N],
+    #
+    **kwargs: Unpack[PartialReducerOptions],
+) -> Callable[
+    [
+        Callable[[N], Value]
+        | Callable[[VisitorT, N], Value]
+        | Callable[[VisitorT, N, MatchResult[N, *Args, Kwargs]], Value]
+    ],
+    NodeDedupCollector[VisitorT, N, Value, *Args, Kwargs],
+]: ...
+
+# ----------------------------------- Sink ----------------------------------- #
+
+class NodeSinkCollector[
+    VisitorT: ast.NodeVisitor,
+    N: ast.AST,
+    Value,
+    *Args,
+    Kwargs: dict,
+](NodeReducer[VisitorT, N, int, *Args, Kwargs]):
+    def __init__(
+        self,
+        node_types: type[N] | tuple[type[N], ...],
+        get_value: Callable[[N], Generator[Value] | Value]
+        | Callable[[VisitorT, N], Generator[Value] | Value]
+        | Callable[
+            [VisitorT, N, MatchResult[N, *Args, Kwargs]], Generator[Value] | Value
+        ],
+        sink: Sink[Value],
+        batch_size: int = 1000,
+        #
+        **kwargs: Unpack[PartialReducerOptions],
+    ): ...
+    def flush(self, instance: VisitorT, partial: bool = True) -> None: ...
+
+def nodesink_collector[
+    VisitorT: ast.NodeVisitor,
+    N: ast.AST,
+    Value,
+    *Args,
+    Kwargs: dict,
+](
+    *node_types: type[N],
+    sink: Sink[Value],
+    batch_size: int = 1000,
+    #
+    **kwargs: Unpack[PartialReducerOptions],
+) -> Callable[
+    [
+        Callable[[N], Generator[Value] | Value]
+        | Callable[[VisitorT, N], Generator[Value] | Value]
+        | Callable[
+            [VisitorT, N, MatchResult[N, *Args, Kwargs]], Generator[Value] | Value
+        ]
+    ],
+    NodeSinkCollector[VisitorT, N, Value, *Args, Kwargs],
+]: ...
+
+# ----------------------------------- Spill ---------------------------------- #
+
+class SpillList[
+    T,
+]:
+    threshold: int
+
+    def __init__(self, threshold: int = 10000): ...
+    def append(self, value: T) -> None: ...
+    def extend(self, values: Iterable[T]) -> None: ...
+    @property
+    def spilled(self) -> int: ...
+    def __len__(self) -> int: ...
+    def __iter__(self) -> Iterator[T]: ...
+    def close(self) -> None: ...
+    def __enter__(self) -> SpillList[T]: ...
+    def __exit__(self, *exc_info: Any) -> None: ...
+
+class NodeSpillCollector[
+    VisitorT: ast.NodeVisitor,
+    N: ast.AST,
+    Value,
+    *Args,
+    Kwargs: dict,
+](NodeReducer[VisitorT, N, SpillList[Value], *Args, Kwargs]):
+    def __init__(
+        self,
+        node_types: type[N] | tuple[type[N], ...],
+        get_value: Callable[[N], Generator[Value] | Value]
+        | Callable[[VisitorT, N], Generator[Value] | Value]
+        | Callable[
+            [VisitorT, N, MatchResult[N, *Args, Kwargs]], Generator[Value] | Value
+        ],
+        threshold: int = 10000,
+        #
+        **kwargs: Unpack[PartialReducerOptions],
+    ): ...
+
+def nodespill_collector[
+    VisitorT: ast.NodeVisitor,
+    N: ast.AST,
+    Value,
+    *Args,
+    Kwargs: dict,
+](
+    *node_types: type[N],
+    threshold: int = 10000,
+    #
+    **kwargs: Unpack[PartialReducerOptions],
+) -> Callable[
+    [
+        Callable[[N], Generator[Value] | Value]
+        | Callable[[VisitorT, N], Generator[Value] | Value]
+        | Callable[
+            [VisitorT, N, MatchResult[N, *Args, Kwargs]], Generator[Value] | Value
+        ]
+    ],
+    NodeSpillCollector[VisitorT, N, Value, *Args, Kwargs],
+]: ...
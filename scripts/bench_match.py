@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import ast
+import inspect
+import time
+from typing import Annotated, Callable
+
+import typer
+from typer import Typer
+
+from ast_lib.pattern import match_node, match_pattern, nodes, parse_pattern
+
+app = Typer()
+
+# Stdlib modules with large sources, used as the target corpus
+CORPUS_MODULES = ("ast", "inspect", "typing", "dataclasses", "argparse")
+
+PATTERNS = (
+    "$x",
+    "self.$attr",
+    "~.append(~)",
+    "$obj.$method($arg)",
+    "return ~.format(~*)",
+    "def __init__(self): ...",
+)
+
+
+def load_corpus() -> list[ast.AST]:
+    targets: list[ast.AST] = []
+    for name in CORPUS_MODULES:
+        module = __import__(name)
+        targets.extend(ast.walk(ast.parse(inspect.getsource(module))))
+    return targets
+
+
+def bench(func: Callable[[], int], repeat: int) -> tuple[float, int]:
+    best = float("inf")
+    matched = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        matched = func()
+        best = min(best, time.perf_counter() - start)
+    return best, matched
+
+
+@app.command()
+def main(
+    repeat: Annotated[int, typer.Option(help="Runs per pattern")] = 3,
+    limit: Annotated[int | None, typer.Option(help="Max number of targets")] = None,
+):
+    targets = load_corpus()[:limit]
+    print(f"{len(targets)} target nodes from {', '.join(CORPUS_MODULES)}")
+    print(f"{'pattern':<28} {'matches':>8} {'seconds':>9} {'nodes/s':>12}")
+
+    for pattern in PATTERNS:
+        pattern_node = parse_pattern(pattern)
+
+        def run(pattern_node: nodes.AST = pattern_node) -> int:
+            return sum(match_node(pattern_node, t) is not None for t in targets)
+
+        seconds, matched = bench(run, repeat)
+        print(
+            f"{pattern:<28} {matched:>8} {seconds:>9.3f} {len(targets) / seconds:>12,.0f}"
+        )
+
+    # one-shot matches with a pattern string, as scripts typically call them
+    print(f"{'pattern string':<28} {'matches':>8} {'seconds':>9} {'nodes/s':>12}")
+    for pattern in PATTERNS:
+
+        def run_string(pattern: str = pattern) -> int:
+            return sum(match_pattern(pattern, t) is not None for t in targets)
+
+        seconds, matched = bench(run_string, repeat)
+        print(
+            f"{pattern:<28} {matched:>8} {seconds:>9.3f} {len(targets) / seconds:>12,.0f}"
+        )
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,121 @@
+"""
+Compare selectors with astpath-style querying, which converts the AST into an XML tree
+and runs XPath over it (lxml, when installed, else ElementTree with hand-written
+equivalents of the queries).
+"""
+
+from __future__ import annotations
+
+import ast
+import inspect
+import time
+import xml.etree.ElementTree as ET
+from typing import Annotated, Any, Callable
+
+import typer
+from typer import Typer
+
+from ast_lib.pattern import TreeIndex, compile_selector
+
+try:
+    from lxml import etree as lxml_etree  # type: ignore
+except ImportError:
+    lxml_etree = None
+
+app = Typer()
+
+CORPUS_MODULES = ("ast", "inspect", "typing", "dataclasses", "argparse")
+
+
+def _decorated_calls(root: Any) -> list[Any]:
+    return [
+        call
+        for function in root.iter("FunctionDef")
+        if function.find("decorator_list/Name[@id='property']") is not None
+        for call in function.iter("Call")
+    ]
+
+
+# selector, and its equivalent over an ElementTree
+QUERIES: tuple[tuple[str, Callable[[Any], list[Any]]], ...] = (
+    (
+        "//FunctionDef[decorator_list/Name/@id='property']//Call",
+        _decorated_calls,
+    ),
+    (
+        "//Call[func/Attribute/@attr='append']",
+        lambda root: [
+            call
+            for call in root.iter("Call")
+            if call.find("func/Attribute[@attr='append']") is not None
+        ],
+    ),
+    (
+        "//ClassDef/body/FunctionDef[@name='__init__']",
+        lambda root: root.findall(".//ClassDef/body/FunctionDef[@name='__init__']"),
+    ),
+    ("//Return/value/Call", lambda root: root.findall(".//Return/value/Call")),
+)
+
+
+def to_xml(node: ast.AST, factory: Any) -> Any:
+    """Convert like astpath: one element per node and per field, primitives as attributes."""
+
+    element = factory.Element(type(node).__name__)
+    for name, value in ast.iter_fields(node):
+        if isinstance(value, ast.AST):
+            field = factory.SubElement(element, name)
+            field.append(to_xml(value, factory))
+        elif isinstance(value, list):
+            field = factory.SubElement(element, name)
+            for item in value:
+                if isinstance(item, ast.AST):
+                    field.append(to_xml(item, factory))
+        elif value is not None:
+            element.set(name, str(value))
+    return element
+
+
+def bench(func: Callable[[], Any], repeat: int) -> tuple[float, Any]:
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+@app.command()
+def main(repeat: Annotated[int, typer.Option(help="Runs per query")] = 3):
+    trees = [ast.parse(inspect.getsource(__import__(name))) for name in CORPUS_MODULES]
+    factory = lxml_etree or ET
+    backend = "lxml" if lxml_etree is not None else "ElementTree"
+
+    index_seconds, indexes = bench(lambda: [TreeIndex(t) for t in trees], repeat)
+    xml_seconds, roots = bench(lambda: [to_xml(t, factory) for t in trees], repeat)
+    print(f"{sum(map(len, indexes))} nodes from {', '.join(CORPUS_MODULES)}")
+    print(f"build: TreeIndex {index_seconds:.3f}s, {backend} XML {xml_seconds:.3f}s")
+    print(f"{'query':<58} {'found':>6} {'selector':>9} {backend:>12}")
+
+    for selector, equivalent in QUERIES:
+        compiled = compile_selector(selector)
+        if lxml_etree is not None:
+            equivalent = lxml_etree.XPath(selector)
+
+        seconds, found = bench(
+            lambda compiled=compiled: sum(
+                len(compiled.positions(index)) for index in indexes
+            ),
+            repeat,
+        )
+        xml_query_seconds, xml_found = bench(
+            lambda equivalent=equivalent: sum(len(equivalent(root)) for root in roots),
+            repeat,
+        )
+        assert found == xml_found, (selector, found, xml_found)
+        print(f"{selector:<58} {found:>6} {seconds:>9.4f} {xml_query_seconds:>12.4f}")
+
+
+if __name__ == "__main__":
+    app()
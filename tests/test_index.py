@@ -0,0 +1,184 @@
+import ast
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from ast_lib.pattern import (
+    TreeIndex,
+    explain,
+    iter_matches,
+    match_node,
+    parse_pattern,
+)
+from ast_lib.pattern.analysis import is_expression_pattern
+
+SOURCE = """
+class C:
+    def __init__(self, x):
+        self.x = x
+        self.items.append(x)
+
+    def run(self):
+        print(self.x.format(1))
+        if self.x is None:
+            return "a".format(self.x)
+"""
+
+
+def test_tree_index_preorder():
+    tree = ast.parse(SOURCE)
+    index = TreeIndex(tree)
+
+    assert index.nodes == list(_preorder(tree))
+    for position, node in enumerate(index.nodes):
+        descendants = index.nodes[position + 1 : index.ends[position]]
+        assert descendants == list(_preorder(node))[1:]
+
+    functions = [index.nodes[p].name for p in index.of_class(ast.FunctionDef)]
+    assert functions == ["__init__", "run"]
+    assert len(index.of_class(ast.stmt)) == sum(
+        isinstance(node, ast.stmt) for node in ast.walk(tree)
+    )
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    [
+        "$x",
+        "self.$attr",
+        "~.$attr",
+        "~.append(~)",
+        "~ is None",
+        "return ~",
+        "self.x",
+        "print(~)",
+        "self.items.append(x)",
+        "def run(self): ...",
+        "~.format(self.x)",
+        "self.`it*`.append(~)",
+        "def `{run, stop}`(self): ...",
+        '~.`"f.*t"`(~*)',
+        "self.x || print(~)",
+        "~.append(~) || ~.format(~*) || return ~",
+    ],
+)
+@pytest.mark.parametrize("descend", [True, False])
+def test_indexed_search_agrees_with_walk(pattern: str, descend: bool):
+    tree = ast.parse(SOURCE)
+    index = TreeIndex(tree)
+
+    expected = [
+        res.node for res in iter_matches(pattern, tree, descend_into_matches=descend)
+    ]
+    found = [
+        res.node for res in iter_matches(pattern, index, descend_into_matches=descend)
+    ]
+    assert found == expected
+    assert expected
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    [
+        "def `(self): ... contains return ~",
+        "print(~) contains self.x",
+        "~.format(~*) contains self.$attr",
+        "~.format(~*) contains $x{self.x}",
+    ],
+)
+def test_descendant_constraint(pattern: str):
+    tree = ast.parse(SOURCE)
+    pattern_node = parse_pattern(pattern)
+
+    # each node matched alone indexes its own subtree; expression matches are reported
+    # without their statement
+    skip_expr = is_expression_pattern(pattern_node)
+    expected = [
+        node
+        for node in _preorder(tree)
+        if not (skip_expr and isinstance(node, ast.Expr))
+        and match_node(pattern_node, node) is not None
+    ]
+    for target in (tree, TreeIndex(tree)):
+        found = [res.node for res in iter_matches(pattern_node, target)]
+        assert found == expected
+    assert expected
+
+
+def test_interleaved_descendant_searches():
+    pattern = "def $f(self): ... contains self.$attr"
+    trees = [
+        ast.parse(SOURCE),
+        ast.parse("class D:\n    def g(self):\n        return self.y\n"),
+    ]
+    expected = [[res.kw_groups for res in iter_matches(pattern, t)] for t in trees]
+    assert all(expected)
+
+    # each search evaluates `contains` against its own tree, however they are advanced
+    searches = [iter_matches(pattern, t) for t in trees]
+    found: list[list[dict]] = [[], []]
+    for _ in range(max(map(len, expected))):
+        for i, search in enumerate(searches):
+            res = next(search, None)
+            if res is not None:
+                found[i].append(res.kw_groups)
+    assert found == expected
+
+    with ThreadPoolExecutor(4) as pool:
+        runs = pool.map(
+            lambda t: [res.kw_groups for res in iter_matches(pattern, t)],
+            trees * 50,
+        )
+        assert list(runs) == expected * 50
+
+
+def test_identifier_candidates():
+    index = TreeIndex(ast.parse(SOURCE))
+
+    assert index.identifiers.keys() >= {"C", "__init__", "self", "x", "append"}
+    candidates = [
+        ast.unparse(index.nodes[p])
+        for p in index.candidates(parse_pattern("self.items.append(x)"))
+    ]
+    assert candidates == ["self.items.append(x)"]
+    assert list(index.candidates(parse_pattern("self.missing"))) == []
+
+    by_prefix = [
+        ast.unparse(index.nodes[p])
+        for p in index.candidates(parse_pattern("self.`it*`"))
+    ]
+    assert by_prefix == ["self.items"]
+    assert list(index.candidates(parse_pattern('~.`"form.*"`'))) == list(
+        index.candidates(parse_pattern("~.`form*`"))
+    )
+
+
+def _preorder(node: ast.AST):
+    yield node
+    for child in ast.iter_child_nodes(node):
+        yield from _preorder(child)
+
+
+def test_query_plan():
+    source = "".join(f"def f{i}():\n    g{i}(print)\n" for i in range(50))
+    index = TreeIndex(ast.parse(source + "def h():\n    rare()\n"))
+
+    # a rare name is looked up, a common one is not
+    assert index.plan(parse_pattern("rare()")).strategy == "identifier"
+    assert index.plan(parse_pattern("print(~)")).strategy == "class"
+    assert index.plan(parse_pattern("~.$attr")).strategy == "class"
+
+    pattern = parse_pattern("def `(): ... contains rare()")
+    plan = index.plan(pattern)
+    assert plan.strategy == "descendant"
+    assert plan.inputs[0].strategy == "identifier"
+    assert [index.nodes[p].name for p in plan.execute()] == ["h"]  # type: ignore
+    assert [res.node.name for res in iter_matches(pattern, index)] == ["h"]  # type: ignore
+
+    union = index.plan(parse_pattern("g1(~) || rare()"))
+    assert [p.strategy for p in union.inputs] == ["identifier", "identifier"]
+    assert union.cost == sum(p.cost for p in union.inputs)
+
+    text = explain("def `(): ... contains rare()", index)
+    assert text.splitlines()[0].startswith("descendant: ")
+    assert text.splitlines()[1].startswith("  identifier: Name.id = 'rare'")
@@ -0,0 +1,52 @@
+import ast
+import pickle
+from pathlib import Path
+
+import pytest
+
+from ast_lib.pattern import Location, Span, match_locations, search_locations, to_arrays
+from ast_lib.pattern.locations import span_of
+
+SOURCE = """\
+def f(self, a, b):
+    self.items.append(a + b)
+    return self.items
+"""
+
+
+def test_match_locations():
+    tree = ast.parse(SOURCE)
+    (loc,) = match_locations("$obj.$attr.append($0)", tree, "m.py")
+    assert loc.path == "m.py" and loc.span == Span(2, 4, 2, 28)
+    assert loc.captures == (
+        (0, Span(2, 22, 2, 27)),
+        ("obj", Span(2, 4, 2, 8)),
+        ("attr", None),
+    )
+    assert pickle.loads(pickle.dumps(loc)) == loc
+
+    # lists, and nodes without a position of their own, cover their items
+    (loc,) = match_locations("~.append($args{~*})", tree)
+    assert loc.captures == (("args", Span(2, 22, 2, 27)),)
+    assert span_of(tree.body[0].args) == Span(1, 6, 1, 16)  # type: ignore
+
+
+def test_search_locations(tmp_path: Path):
+    (tmp_path / "a.py").write_text(SOURCE)
+    (tmp_path / "b.py").write_text("x = 1\n")
+    found = search_locations("return self.$attr", sorted(tmp_path.iterdir()))
+    assert found == [
+        Location(str(tmp_path / "a.py"), 3, 4, 3, 21, (("attr", None),)),
+    ]
+
+
+def test_to_arrays():
+    np = pytest.importorskip("numpy")
+    locations = match_locations("self.$attr", ast.parse(SOURCE), "m.py")
+    matches, captures = to_arrays(locations)
+    assert matches["path"].tolist() == ["m.py", "m.py"]
+    assert matches["lineno"].tolist() == [2, 3]
+    assert captures["match"].tolist() == [0, 1]
+    assert (captures["lineno"] == -1).all()
+    assert pickle.loads(pickle.dumps(matches)).dtype == matches.dtype
+    assert np.array_equal(matches["end_col_offset"], [14, 21])
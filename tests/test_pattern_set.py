@@ -0,0 +1,61 @@
+import ast
+
+from ast_lib.pattern import PatternSet, compile_pattern
+
+SOURCE = """
+class C:
+    def __init__(self, x):
+        self.x = x
+        self.items.append(x)
+
+    def run(self):
+        print(self.x.format(1))
+        items = [i for i in range(3) if i is None]
+        return "a".format(self.x)
+"""
+
+PATTERNS = [
+    "$x",
+    "self.$attr",
+    "self.x",
+    "~.append(~)",
+    "$obj.$method($arg)",
+    "print(~)",
+    "range(3)",
+    "~ is None",
+    "return ~.format(~*)",
+    "def __init__(self, x): ...",
+    "def run(self): ...",
+    "$x{~.`.`}",
+    "~.format(1)",
+]
+
+
+def test_pattern_set_agrees_with_each_pattern():
+    pattern_set = PatternSet(PATTERNS)
+    matchers = [compile_pattern(p) for p in pattern_set._patterns]
+
+    total = 0
+    for target in ast.walk(ast.parse(SOURCE)):
+        expected = [
+            pattern
+            for pattern, matcher in zip(PATTERNS, matchers, strict=True)
+            if matcher(target) is not None
+        ]
+        assert [key for key, _ in pattern_set.match(target)] == expected
+        total += len(expected)
+    assert total > len(PATTERNS)
+
+
+def test_pattern_set_keys_and_candidates():
+    pattern_set = PatternSet({"attr": "self.x", "call": "~.append(~)"})
+    pattern_set.add("print(~)")
+    assert len(pattern_set) == 3
+
+    stmt = ast.parse("self.items.append(x)").body[0]
+    assert pattern_set.candidates(stmt) == [1]
+    [(key, res)] = pattern_set.match(stmt)
+    assert key == "call"
+    assert isinstance(res.node, ast.Expr)
+
+    assert pattern_set.candidates(ast.parse("self.y", mode="eval").body) == []
@@ -0,0 +1,85 @@
+import pytest
+
+from ast_lib.pattern import Edit, apply_edits, rewrite, rewrite_edits
+
+SOURCE = """\
+def f(d, key):
+    if d.has_key(key):  # legacy
+        return d.has_key( "é" ) or d.has_key(d.has_key(key))
+    return {'ü': d.has_key(k) for k in keys}
+"""
+
+
+def test_rewrite():
+    assert (
+        rewrite("$x.has_key($k)", "$k in $x", SOURCE)
+        == """\
+def f(d, key):
+    if key in d:  # legacy
+        return "é" in d or d.has_key(key) in d
+    return {'ü': k in d for k in keys}
+"""
+    )
+    assert rewrite("~.missing()", "x", SOURCE) == SOURCE
+
+
+def test_rewrite_parenthesizes():
+    assert rewrite("$x.has_key($k)", "$k in $x", "d.has_key(a or b)") == "(a or b) in d"
+    assert (
+        rewrite("$x.has_key($k)", "$k in $x", "(d or e).has_key(k)") == "k in (d or e)"
+    )
+    assert rewrite("f($x)", "g($x, 1)", "f(a if b else c)") == "g(a if b else c, 1)"
+    assert rewrite("f($x)", "-$x", "f(a + b)") == "-(a + b)"
+    assert rewrite("f($args{~*})", "g($args)", "f(a + b, c)") == "g(a + b, c)"
+    assert rewrite("f($x)", "$x", "y = f(a + b)") == "y = a + b"
+
+
+def test_rewrite_in_source_order():
+    # fields of `IfExp` and function definitions are not in source order
+    assert (
+        rewrite(
+            "$x.has_key($k)", "$k in $x", "y = a.has_key(1) if b.has_key(2) else c\n"
+        )
+        == "y = 1 in a if 2 in b else c\n"
+    )
+    source = "@cache(d.has_key(1))\ndef f() -> d.has_key(2):\n    return d.has_key(3)\n"
+    assert (
+        rewrite("$x.has_key($k)", "$k in $x", source)
+        == "@cache(1 in d)\ndef f() -> 2 in d:\n    return 3 in d\n"
+    )
+
+
+def test_rewrite_statements():
+    source = "class A:\n    def f(self):\n        print(self.x, 1)\n"
+    assert (
+        rewrite("print($0, $1)", "logger.info($0)\nlogger.debug($1)", source)
+        == "class A:\n    def f(self):\n"
+        "        logger.info(self.x)\n        logger.debug(1)\n"
+    )
+    assert rewrite("def $name(self): ...", "pass", source) == "class A:\n    pass\n"
+    assert rewrite("self.$attr", "self._$attr", source) == source.replace(".x", "._x")
+
+
+def test_rewrite_template_text():
+    assert rewrite("f($x)", "$$x = $x  # $$$$", "f(a)") == "$x = a  # $$"
+    source = "if x:\r\n    f(a,\r\n      b)\r\n"
+    assert (
+        rewrite("f($x, $y)", "g($x)\nh($y)\r\nk()", source)
+        == "if x:\r\n    g(a)\r\n    h(b)\r\n    k()\r\n"
+    )
+    # captured text keeps its own line breaks
+    assert (
+        rewrite("f($args{~*})", "g($args)\nk()", source)
+        == "if x:\r\n    g(a,\r\n      b)\r\n    k()\r\n"
+    )
+
+
+def test_rewrite_edits():
+    edits = rewrite_edits("~.has_key($k)", "$k", "é.has_key(a); b.has_key(c)")
+    assert edits == [Edit(0, 13, "a"), Edit(15, 27, "c")]
+    assert apply_edits("é.has_key(a); b.has_key(c)", edits) == "a; c"
+
+    with pytest.raises(ValueError):
+        apply_edits("abc", [Edit(1, 2, ""), Edit(0, 1, "")])
+    with pytest.raises(ValueError):
+        rewrite_edits("$x.f()", "$y", "a.f()")
@@ -0,0 +1,37 @@
+from pathlib import Path
+
+from ast_lib.pattern import SearchStats, parse_pattern, search_files
+from ast_lib.pattern.analysis import required_tokens
+
+
+def test_required_tokens():
+    assert required_tokens(parse_pattern("self.items.append(~)")) == [
+        b"append",
+        b"items",
+        b"self",
+    ]
+    assert required_tokens(parse_pattern("~.$method(1)")) == []
+    assert required_tokens(parse_pattern("self.`get_x*`(~*)")) == [b"get_x", b"self"]
+    assert required_tokens(parse_pattern('~.`"(?i)get"`()')) == []
+
+
+def test_search_files_prefilter(tmp_path: Path):
+    files = {
+        "match.py": "def f(self):\n    self.items.append(1)\n",
+        "partial.py": "items = []\nitems.append(1)\n",
+        "empty.py": "",
+        "broken.py": "self.items.append(\n",
+    }
+    for name, source in files.items():
+        (tmp_path / name).write_text(source)
+    paths = sorted(tmp_path.iterdir())
+
+    stats = SearchStats()
+    found = list(search_files("self.items.append(~)", paths, stats=stats))
+    assert [(path.name, res.node.lineno) for path, res in found] == [("match.py", 2)]
+    assert (stats.files, stats.skipped, stats.parsed, stats.matches) == (4, 2, 1, 1)
+    assert [path.name for path, _ in stats.errors] == ["broken.py"]
+
+    unfiltered = SearchStats()
+    assert len(list(search_files("~.append(~)", paths, stats=unfiltered))) == 2
+    assert unfiltered.skipped == 1
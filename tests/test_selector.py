@@ -0,0 +1,77 @@
+import ast
+
+import pytest
+
+from ast_lib.pattern import Selector, TreeIndex, compile_selector, select
+
+SOURCE = """
+class C:
+    @property
+    def x(self):
+        return self.f(1)
+
+    @staticmethod
+    def g():
+        h(2)
+
+    def get_a(self):
+        y = self.z
+        return [k(i) for i in y]
+"""
+
+
+@pytest.mark.parametrize(
+    ("selector", "expected"),
+    [
+        ("//FunctionDef[decorator_list/Name/@id='property']//Call", ["self.f(1)"]),
+        ("/Module/body/ClassDef/body/FunctionDef/@name", None),
+        ("//Call[func/Name]", ["h(2)", "k(i)"]),
+        ("//Name[@ctx='Store']", ["y", "i"]),
+        ("//Constant[@value=2]", ["2"]),
+        ("//body/Return/value", ["self.f(1)", "[k(i) for i in y]"]),
+        ("//ClassDef//Call[args/Constant]", ["self.f(1)", "h(2)"]),
+        ("//FunctionDef[.//Return and not(decorator_list)]//Attribute", ["self.z"]),
+        ("//Attribute[starts-with(@attr, 'f') or @attr = 'z']", ["self.f", "self.z"]),
+        ("/ClassDef", []),
+    ],
+)
+def test_select(selector: str, expected: list[str] | None):
+    tree = ast.parse(SOURCE)
+    if expected is None:
+        with pytest.raises(SyntaxError):
+            select(selector, tree)
+        return
+    assert [ast.unparse(node) for node in select(selector, tree)] == expected
+
+
+def test_select_fields():
+    tree = ast.parse(SOURCE)
+
+    functions = select("/Module/body/ClassDef/body/FunctionDef", tree)
+    assert [f.name for f in functions] == ["x", "g", "get_a"]  # type: ignore
+    args = select("//FunctionDef/args/args/arg[@arg='self']", tree)
+    assert len(args) == 2
+
+    with pytest.raises(SyntaxError, match="unknown class or field"):
+        Selector("//Foo")
+
+
+@pytest.mark.parametrize("name", ["x", "get_a", "missing"])
+def test_identifier_plan_agrees_with_walk(name: str):
+    tree = ast.parse(SOURCE)
+    index = TreeIndex(tree)
+
+    # the pinned name is looked up in the index, the negated one filters every node
+    pinned = select(f"//FunctionDef[@name='{name}']", index)
+    filtered = select(f"//FunctionDef[not(@name!='{name}')]", index)
+    walked = [
+        node
+        for node in ast.walk(tree)
+        if isinstance(node, ast.FunctionDef) and node.name == name
+    ]
+    assert pinned == filtered == walked
+
+
+def test_compile_selector_cache():
+    assert compile_selector("//Call") is compile_selector("//Call")
+    assert compile_selector.cache_info().maxsize is not None
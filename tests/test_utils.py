@@ -0,0 +1,36 @@
+import ast
+
+from ast_lib.utils import StructuralHasher, structurally_equal
+
+
+def test_structural_hasher_ignores_positions():
+    hasher = StructuralHasher()
+    a = ast.parse("x = foo(a.b, 1)").body[0]
+    b = ast.parse("\n\nx   =  foo(a.b,1)").body[0]
+    c = ast.parse("x = foo(a.b, True)").body[0]
+
+    assert hasher(a) == hasher(b)
+    assert hasher(a) != hasher(c)
+    assert not structurally_equal(
+        ast.parse("x", mode="eval"), ast.parse("x = 1").body[0]
+    )
+
+
+def make_chain(n: int) -> ast.expr:
+    # Deeper than the recursion limit, and deeper than `ast.parse` accepts
+    node: ast.expr = ast.Name("a0")
+    for i in range(1, n):
+        node = ast.BinOp(node, ast.Add(), ast.Name(f"a{i % 3}"))
+    return node
+
+
+def test_structural_hasher_deep_tree():
+    hasher = StructuralHasher()
+    assert hasher(make_chain(5000)) == hasher(make_chain(5000))
+    assert hasher(make_chain(5000)) != hasher(make_chain(5001))
+
+
+def test_structural_hasher_ignore_fields():
+    store, load = ast.parse("x.y = x.y").body[0].targets[0], ast.parse("x.y").body[0]
+    assert not StructuralHasher().equal(store, load.value)
+    assert StructuralHasher(ignore_fields=["ctx"], weak=True).equal(store, load.value)
@@ -1,32 +1,71 @@
-import ast
-
-from ast_lib.visitor.core import BaseNodeVisitor
-from ast_lib.visitor.presets import ParentMap
-
-
-def test_parent_map():
-    source = """
-def f1():
-    def f2():
-        def f3():
-            pass
-    """
-
-    expected_parent_maps = {
-        "f1": {"f1": None},
-        "f2": {"f1": None, "f2": "f1"},
-        "f3": {"f1": None, "f2": "f1", "f3": "f2"},
-    }
-
-    class Visitor(BaseNodeVisitor):
-        parent_map = ParentMap()
-
-        def visit_FunctionDef(self, node: ast.FunctionDef):
-            name_parent_map = {
-                k.name: v
-                for k, v in self.parent_map.items()
-                if isinstance(k, ast.FunctionDef)
-            }
-            assert name_parent_map == expected_parent_maps[node.name]
-
-    Visitor().visit(ast.parse(source))
+import ast
+
+from ast_lib.visitor.core import BaseNodeVisitor
+from ast_lib.visitor.presets import ParentMap, synthesized_attr
+
+
+def test_parent_map():
+    source = """
+def f1():
+    def f2():
+        def f3():
+            pass
+    """
+
+    expected_parent_maps = {
+        "f1": {"f1": None},
+        "f2": {"f1": None, "f2": "f1"},
+        "f3": {"f1": None, "f2": "f1", "f3": "f2"},
+    }
+
+    class Visitor(BaseNodeVisitor):
+        parent_map = ParentMap()
+
+        def visit_FunctionDef(self, node: ast.FunctionDef):
+            name_parent_map = {
+                k.name: v
+                for k, v in self.parent_map.items()
+                if isinstance(k, ast.FunctionDef)
+            }
+            assert name_parent_map == expected_parent_maps[node.name]
+
+    Visitor().visit(ast.parse(source))
+
+
+def test_synthesized_attr():
+    source = """
+def f1(x):
+    if x:
+        return [await g() for _ in x]
+    return x
+
+async def f2():
+    while True:
+        if a and b:
+            pass
+"""
+
+    branches = (ast.If, ast.While, ast.For, ast.comprehension, ast.BoolOp)
+
+    class Visitor(BaseNodeVisitor):
+        @synthesized_attr
+        def subtree_size(node: ast.AST, children: list[int]) -> int:
+            return 1 + sum(children)
+
+        @synthesized_attr
+        def contains_await(node: ast.AST, children: list[bool]) -> bool:
+            return isinstance(node, ast.Await) or any(children)
+
+        @synthesized_attr
+        def complexity(self, node: ast.AST, children: list[int]) -> int:
+            return isinstance(node, branches) + sum(children)
+
+    tree = ast.parse(source)
+    visitor = Visitor()
+    visitor.visit(tree)
+
+    f1, f2 = tree.body
+    for node in ast.walk(tree):
+        assert visitor.subtree_size[node] == sum(1 for _ in ast.walk(node))
+    assert visitor.contains_await[f1] and not visitor.contains_await[f2]
+    assert (visitor.complexity[f1], visitor.complexity[f2]) == (2, 3)
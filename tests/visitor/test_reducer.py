@@ -0,0 +1,240 @@
+import ast
+import io
+import queue
+from collections import Counter
+
+import pytest
+
+import ast_lib.visitor.core
+from ast_lib.pattern import TreeIndex, compile_pattern
+from ast_lib.visitor.core import BaseNodeVisitor
+from ast_lib.visitor.reducer import (
+    SpillList,
+    nodededup_collector,
+    nodelist_collector,
+    nodemultimap_collector,
+    nodesink_collector,
+    nodespill_collector,
+)
+
+SOURCE = """
+def f1():
+    def f2():
+        pass
+
+def f3():
+    pass
+
+class C:
+    def f4(self):
+        pass
+"""
+
+
+def test_multimap_collector():
+    source = """
+class A:
+    def f(self): ...
+    def g(self): ...
+    def f(self): ...
+
+class B:
+    def h(self): ...
+"""
+
+    class Visitor(BaseNodeVisitor):
+        def get_class(self, node: ast.ClassDef) -> str:
+            return node.name
+
+        @nodemultimap_collector(ast.ClassDef, get_key=get_class)
+        def methods(self, node: ast.ClassDef):
+            for stmt in node.body:
+                if isinstance(stmt, ast.FunctionDef):
+                    yield stmt.name
+
+        @nodemultimap_collector(ast.ClassDef, get_key=get_class, container="set")
+        def unique_methods(self, node: ast.ClassDef):
+            for stmt in node.body:
+                if isinstance(stmt, ast.FunctionDef):
+                    yield stmt.name
+
+        @nodemultimap_collector(
+            ast.FunctionDef, get_key=lambda node: "all", max_per_key=2
+        )
+        def first_methods(self, node: ast.FunctionDef) -> str:
+            return node.name
+
+    visitor = Visitor()
+    visitor.visit(ast.parse(source))
+
+    assert visitor.methods == {"A": ["f", "g", "f"], "B": ["h"]}
+    assert visitor.unique_methods == {"A": {"f", "g"}, "B": {"h"}}
+    assert visitor.first_methods == {"all": ["f", "g"]}
+
+
+def test_dedup_collector():
+    source = """
+f(a, 1)
+x = f(a, 1)
+if y:
+    f(a,   1)
+f(a, 1.0)
+f(a, True)
+g(f(a, 1))
+"""
+
+    class Visitor(BaseNodeVisitor):
+        @nodededup_collector(ast.Call)
+        def calls(self, node: ast.Call) -> ast.Call:
+            return node
+
+    visitor = Visitor()
+    visitor.visit(ast.parse(source))
+
+    groups = [
+        (ast.unparse(g.node), g.node.lineno, g.count) for g in visitor.calls.values()
+    ]
+    assert groups == [
+        ("f(a, 1)", 2, 4),
+        ("f(a, 1.0)", 6, 1),
+        ("f(a, True)", 7, 1),
+        ("g(f(a, 1))", 8, 1),
+    ]
+
+
+def test_shared_pattern_matched_once(monkeypatch: pytest.MonkeyPatch):
+    calls: Counter[ast.AST] = Counter()
+    counted = {}
+
+    def counting_compile_pattern(pattern):
+        matcher = compile_pattern(pattern)
+        if matcher not in counted:
+
+            def count(node: ast.AST):
+                calls[node] += 1
+                return matcher(node)
+
+            counted[matcher] = count
+        return counted[matcher]
+
+    monkeypatch.setattr(
+        ast_lib.visitor.core, "compile_pattern", counting_compile_pattern
+    )
+
+    class Visitor(BaseNodeVisitor):
+        @nodelist_collector(ast.Call, pattern="~.append(~)")
+        def appends(self, node: ast.Call) -> str:
+            return ast.unparse(node)
+
+        @nodelist_collector(ast.Call, pattern="~.append(~)", mode="after")
+        def appends_after(self, node: ast.Call) -> str:
+            return ast.unparse(node)
+
+    visitor = Visitor()
+    visitor.visit(ast.parse("xs.append(f(1))\nys.append(g(2))"))
+
+    assert (
+        visitor.appends
+        == visitor.appends_after
+        == ["xs.append(f(1))", "ys.append(g(2))"]
+    )
+    assert len(calls) == 4 and set(calls.values()) == {1}
+    assert not visitor._match_cache
+
+    # the pattern is parsed once per visitor class, and held by its hooks only
+    hooks = Visitor.__visit_hook_map__.values()
+    shared = {id(hook.pattern_node) for hook in hooks if hook.pattern == "~.append(~)"}
+    assert len(shared) == 1
+
+
+def test_descendant_pattern_indexes_tree_once(monkeypatch: pytest.MonkeyPatch):
+    built: list[ast.AST] = []
+    init = TreeIndex.__init__
+
+    def counting_init(self: TreeIndex, tree: ast.AST) -> None:
+        built.append(tree)
+        init(self, tree)
+
+    monkeypatch.setattr(TreeIndex, "__init__", counting_init)
+
+    class Visitor(BaseNodeVisitor):
+        @nodelist_collector(
+            ast.AsyncFunctionDef, pattern="async def $f(): ... contains await ~"
+        )
+        def awaiting(self, node: ast.AsyncFunctionDef) -> str:
+            return node.name
+
+    tree = ast.parse(
+        "async def a():\n    await x\nasync def b():\n    pass\n"
+        "async def c():\n    if y:\n        await z"
+    )
+    visitor = Visitor()
+    visitor.visit(tree)
+
+    assert visitor.awaiting == ["a", "c"]
+    assert built == [tree]
+
+
+def test_sink_collector_batches():
+    batches: list[list[str]] = []
+
+    class Visitor(BaseNodeVisitor):
+        @nodesink_collector(ast.FunctionDef, sink=batches.append, batch_size=3)
+        def function_names(self, node: ast.FunctionDef) -> str:
+            return node.name
+
+    visitor = Visitor()
+    visitor.visit(ast.parse(SOURCE))
+
+    assert batches == [["f1", "f2", "f3"], ["f4"]]
+    assert visitor.function_names == 4
+
+
+def test_sink_collector_queue_and_file():
+    q: queue.Queue[list[str]] = queue.Queue()
+    file = io.StringIO()
+
+    class Visitor(BaseNodeVisitor):
+        @nodesink_collector(ast.FunctionDef, sink=q, batch_size=2)
+        def queued(self, node: ast.FunctionDef) -> str:
+            return node.name
+
+        @nodesink_collector(ast.FunctionDef, sink=file)
+        def written(self, node: ast.FunctionDef):
+            yield node.name
+            yield node.name.upper()
+
+    visitor = Visitor()
+    visitor.visit(ast.parse(SOURCE))
+
+    assert [q.get_nowait(), q.get_nowait()] == [["f1", "f2"], ["f3", "f4"]]
+    assert q.empty()
+    assert file.getvalue().split() == ["f1", "F1", "f2", "F2", "f3", "F3", "f4", "F4"]
+    assert visitor.written == 8
+
+
+def test_spill_collector():
+    class Visitor(BaseNodeVisitor):
+        @nodespill_collector(ast.FunctionDef, threshold=3)
+        def function_names(self, node: ast.FunctionDef) -> str:
+            return node.name
+
+    visitor = Visitor()
+    visitor.visit(ast.parse(SOURCE))
+
+    with visitor.function_names as names:
+        assert names.spilled == 1
+        assert len(names) == 4
+        assert list(names) == ["f1", "f2", "f3", "f4"]
+
+
+def test_spill_list_iterate_while_appending():
+    with SpillList[int](threshold=2) as values:
+        values.extend(range(5))
+        seen = []
+        for value in values:
+            seen.append(value)
+            if value == 0:
+                values.append(5)
+        assert seen == list(range(6))
+        assert values.spilled == 3